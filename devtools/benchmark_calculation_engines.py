@@ -0,0 +1,78 @@
+#! /usr/bin/env python
+"""Compare the merge and sparse engines for reconciling FERC1 calculations.
+
+The FERC1 XBRL metadata, calculation components, tags and transformed tables are loaded
+from the outputs of a previous ETL run (the Dagster storage in ``$DAGSTER_HOME``). For
+each exploded table, the inter-table calculations are evaluated on the concatenated
+tables with both engines of
+:func:`pudl.transform.ferc1.calculate_values_from_components`. The results are checked
+for equality before the timings are reported.
+
+Example:
+    python benchmark_calculation_engines.py
+"""
+
+import logging
+import time
+
+import click
+import pandas as pd
+from dagster import AssetKey
+
+from pudl.etl import defs
+from pudl.output.ferc1 import EXPLOSION_ARGS, Exploder
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+@click.command()
+def benchmark_calculation_engines():
+    """Time the inter-table calculations of each exploded FERC1 table."""
+    metadata = defs.load_asset_value(AssetKey("_core_ferc1_xbrl__metadata"))
+    calculation_components = defs.load_asset_value(
+        AssetKey("_core_ferc1_xbrl__calculation_components")
+    )
+    tags = defs.load_asset_value(AssetKey("_out_ferc1__detailed_tags"))
+
+    for explosion_args in EXPLOSION_ARGS:
+        root_table = explosion_args["root_table"]
+        tables_to_explode = {
+            table_name: defs.load_asset_value(AssetKey(table_name))
+            for table_name in explosion_args["table_names"]
+        }
+        exploders = {
+            engine: Exploder(
+                table_names=explosion_args["table_names"],
+                root_table=root_table,
+                metadata_xbrl_ferc1=metadata,
+                calculation_components_xbrl_ferc1=calculation_components,
+                seed_nodes=explosion_args["seed_nodes"],
+                tags=tags,
+                group_metric_checks=explosion_args["group_metric_checks"],
+                off_by_facts=explosion_args["off_by_facts"],
+                calculation_engine=engine,
+            )
+            for engine in ["merge", "sparse"]
+        }
+        exploded = exploders["merge"].initial_explosion_concatenation(tables_to_explode)
+
+        results = {}
+        timings = {}
+        for engine, exploder in exploders.items():
+            start = time.perf_counter()
+            results[engine] = exploder.calculate_intertable_non_total_calculations(
+                exploded
+            )
+            timings[engine] = time.perf_counter() - start
+
+        pd.testing.assert_frame_equal(results["merge"], results["sparse"])
+        logger.info(
+            f"{root_table}: {len(exploded)} records. "
+            f"merge: {timings['merge']:.2f} seconds, sparse: {timings['sparse']:.2f} "
+            f"seconds ({timings['merge'] / timings['sparse']:.1f}x faster)"
+        )
+
+
+if __name__ == "__main__":
+    benchmark_calculation_engines()
@@ -0,0 +1,82 @@
+#! /usr/bin/env python
+"""Time importing PUDL and starting its CLIs in fresh Python processes.
+
+Each target is run in a new interpreter several times, and the median wall clock time
+is reported, so that regressions in import time (e.g. a subpackage that is imported
+eagerly again, or work done at import time) can be tracked. If a metadata cache
+directory is given, the targets are also timed with the validated metadata loaded from
+it (see :class:`pudl.metadata.classes.PackageCache`) after it has been warmed up.
+
+Example:
+    python benchmark_import_time.py --repeats 5 --metadata-cache /tmp/pudl_metadata
+"""
+
+import logging
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import click
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+TARGETS = {
+    "import pudl": "import pudl",
+    "import pudl.helpers": "import pudl.helpers",
+    "pudl_datastore --help": (
+        "from pudl.workspace.datastore import pudl_datastore; "
+        "pudl_datastore(['--help'])"
+    ),
+    "Package.from_resource_ids()": (
+        "from pudl.metadata.classes import Package; Package.from_resource_ids()"
+    ),
+    "import pudl.etl": "import pudl.etl",
+}
+
+
+def _time_target(statement: str, env: dict[str, str], repeats: int) -> float:
+    """Return the median time to run a statement in a fresh interpreter."""
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-W", "ignore", "-c", statement],  # noqa: S603
+            env=env,
+            check=False,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+@click.command()
+@click.option("--repeats", type=int, default=3, show_default=True)
+@click.option(
+    "--metadata-cache",
+    type=click.Path(file_okay=False, path_type=Path),
+    help="Directory to also time the targets with a warm metadata cache in.",
+)
+def benchmark_import_time(repeats: int, metadata_cache: Path | None):
+    """Time importing PUDL and starting its CLIs."""
+    env = {k: v for k, v in os.environ.items() if k != "PUDL_METADATA_CACHE"}
+    cached_env = None
+    if metadata_cache is not None:
+        cached_env = env | {"PUDL_METADATA_CACHE": str(metadata_cache)}
+        _time_target(TARGETS["Package.from_resource_ids()"], cached_env, repeats=1)
+
+    for name, statement in TARGETS.items():
+        uncached = _time_target(statement, env, repeats)
+        message = f"{name}: {uncached:.2f} seconds"
+        if cached_env is not None:
+            cached = _time_target(statement, cached_env, repeats)
+            message += f", {cached:.2f} seconds with cached metadata"
+        logger.info(message)
+
+
+if __name__ == "__main__":
+    benchmark_import_time()
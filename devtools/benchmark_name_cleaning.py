@@ -0,0 +1,99 @@
+#! /usr/bin/env python
+"""Compare row-wise and batch name cleaning and metaphone encoding.
+
+The plant and utility names of the EIA plant parts list are read from the PUDL outputs
+(by default the Parquet files in ``$PUDL_OUTPUT``). They are then cleaned and encoded
+row by row with :meth:`pandas.Series.apply` and in batches of unique values with
+:func:`pudl.analysis.record_linkage.name_cleaner.map_unique_values`. The results are
+checked for equality before the timings are reported.
+
+Example:
+    python benchmark_name_cleaning.py --num-workers 4
+"""
+
+import logging
+import time
+from pathlib import Path
+
+import click
+import pandas as pd
+
+from pudl.analysis.record_linkage.eia_ferc1_record_linkage import (
+    _get_metaphone,
+    plant_name_cleaner,
+)
+from pudl.analysis.record_linkage.name_cleaner import (
+    CompanyNameCleaner,
+    map_unique_values,
+)
+from pudl.workspace.setup import PudlPaths
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+NAME_COLS = ["plant_name_eia", "utility_name_eia"]
+
+
+def _time(name: str, func, *args) -> tuple[pd.Series, float]:
+    start = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - start
+    logger.info(f"{name}: {elapsed:.2f} seconds")
+    return result, elapsed
+
+
+@click.command()
+@click.option(
+    "--plant-parts",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    default=None,
+    help="Parquet file of out_eia__yearly_plant_parts. Defaults to the one in "
+    "PUDL_OUTPUT.",
+)
+@click.option("--num-workers", type=int, default=1, show_default=True)
+def benchmark_name_cleaning(plant_parts: Path | None, num_workers: int):
+    """Time cleaning and encoding the plant parts names row-wise and in batches."""
+    plant_parts = plant_parts or PudlPaths().parquet_path("out_eia__yearly_plant_parts")
+    names = pd.read_parquet(plant_parts, columns=NAME_COLS)
+    logger.info(
+        f"Read {len(names)} plant parts with {names.plant_name_eia.nunique()} unique "
+        f"plant names and {names.utility_name_eia.nunique()} unique utility names."
+    )
+
+    cleaners = {
+        "plant_name_eia": plant_name_cleaner.model_copy(
+            update={"num_workers": num_workers}
+        ),
+        "utility_name_eia": CompanyNameCleaner(num_workers=num_workers),
+    }
+    speedups = {}
+    for col in NAME_COLS:
+        cleaner = cleaners[col]
+        expected, row_time = _time(
+            f"{col} row-wise cleaning", names[col].apply, cleaner.get_clean_data
+        )
+        actual, batch_time = _time(
+            f"{col} batch cleaning", cleaner.clean_names, names[col]
+        )
+        pd.testing.assert_series_equal(expected, actual)
+        speedups[f"{col} cleaning"] = row_time / batch_time
+
+        expected, row_time = _time(
+            f"{col} row-wise metaphone", names[col].apply, _get_metaphone
+        )
+        actual, batch_time = _time(
+            f"{col} batch metaphone",
+            map_unique_values,
+            names[col],
+            _get_metaphone,
+            num_workers,
+        )
+        pd.testing.assert_series_equal(expected, actual)
+        speedups[f"{col} metaphone"] = row_time / batch_time
+
+    for name, speedup in speedups.items():
+        logger.info(f"{name}: {speedup:.1f}x faster")
+
+
+if __name__ == "__main__":
+    benchmark_name_cleaning()
@@ -0,0 +1,137 @@
+#! /usr/bin/env python
+"""Compare the vectorized occurrence_consistency with the old groupby & merge version.
+
+A synthetic stand-in for the compiled EIA generator records is harvested column by
+column, the way :func:`pudl.transform.eia.harvest_entity_tables` does it, using both
+implementations. The results, including the order of the records, are checked for
+equality before the timings are reported.
+
+Example:
+    python benchmark_occurrence_consistency.py --n-rows 2000000 --n-cols 40
+"""
+
+import logging
+import time
+
+import click
+import numpy as np
+import pandas as pd
+
+from pudl.helpers import get_pudl_dtypes
+from pudl.transform.eia import _group_codes, occurrence_consistency
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+ID_COLS = ["plant_id_eia", "generator_id"]
+
+
+def _merge_occurrence_consistency(
+    entity_idx: list[str],
+    compiled_df: pd.DataFrame,
+    col: str,
+    cols_to_consit: list[str],
+    strictness: float = 0.7,
+) -> pd.DataFrame:
+    """The original groupby & merge implementation of occurrence_consistency."""
+    col_df = compiled_df[entity_idx + ["report_date", col]].copy().dropna()
+    occur = (
+        col_df.assign(entity_occurences=1)
+        .groupby(by=cols_to_consit, observed=True)[["entity_occurences"]]
+        .count()
+        .reset_index()
+    )
+    col_df = col_df.merge(occur, on=cols_to_consit)
+    consist_df = (
+        col_df.assign(record_occurences=1)
+        .groupby(by=cols_to_consit + [col], observed=True)[["record_occurences"]]
+        .count()
+        .reset_index()
+    )
+    col_df = col_df.merge(consist_df, how="outer")
+    col_df[f"{col}_consistent_rate"] = (
+        col_df["record_occurences"] / col_df["entity_occurences"]
+    )
+    col_df[f"{col}_is_consistent"] = col_df[f"{col}_consistent_rate"] > strictness
+    return col_df.sort_values(f"{col}_consistent_rate")
+
+
+def _synthetic_compiled_df(n_rows: int, n_cols: int, seed: int = 42) -> pd.DataFrame:
+    """Generate records for ~n_rows / 40 generators, mostly reporting one value."""
+    rng = np.random.default_rng(seed)
+    n_entities = max(n_rows // 40, 1)
+    entity = rng.integers(0, n_entities, n_rows)
+    df = pd.DataFrame(
+        {
+            "plant_id_eia": pd.array(entity // 3, dtype="Int64"),
+            "generator_id": pd.array((entity % 3).astype(str), dtype="string"),
+            "report_date": pd.to_datetime(
+                rng.integers(2001, 2024, n_rows).astype(str), format="%Y"
+            ),
+        }
+    )
+    float_cols = [
+        col
+        for col, dtype in get_pudl_dtypes(group="eia").items()
+        if dtype == "float64" and col not in df.columns
+    ]
+    for col in float_cols[:n_cols]:
+        # Each entity usually reports its own value, but sometimes something else.
+        values = np.where(
+            rng.random(n_rows) < 0.9, entity % 50, rng.integers(0, 50, n_rows)
+        ).astype(float)
+        values[rng.random(n_rows) < 0.2] = np.nan
+        df[col] = values
+    return df
+
+
+@click.command()
+@click.option("--n-rows", type=int, default=1_000_000, show_default=True)
+@click.option("--n-cols", type=int, default=20, show_default=True)
+def benchmark_occurrence_consistency(n_rows: int, n_cols: int):
+    """Time harvesting every column of a synthetic table with both implementations."""
+    df = _synthetic_compiled_df(n_rows, n_cols)
+    cols = [col for col in df.columns if col not in ID_COLS + ["report_date"]]
+    # Alternate between static and annual columns.
+    consit = {
+        col: ID_COLS if i % 2 == 0 else ID_COLS + ["report_date"]
+        for i, col in enumerate(cols)
+    }
+    logger.info(f"Harvesting {len(cols)} columns from {n_rows} records.")
+
+    start = time.perf_counter()
+    expected = {
+        col: _merge_occurrence_consistency(ID_COLS, df, col, consit[col])
+        for col in cols
+    }
+    merge_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    consit_codes = {
+        "static": _group_codes(df, ID_COLS),
+        "annual": _group_codes(df, ID_COLS + ["report_date"]),
+    }
+    actual = {
+        col: occurrence_consistency(
+            ID_COLS,
+            df,
+            col,
+            consit[col],
+            consit_codes=consit_codes["static" if i % 2 == 0 else "annual"],
+        )
+        for i, col in enumerate(cols)
+    }
+    vectorized_time = time.perf_counter() - start
+
+    # The order of the records matters, since it breaks ties between values.
+    for col in cols:
+        pd.testing.assert_frame_equal(expected[col], actual[col])
+    logger.info(f"groupby & merge: {merge_time:.2f} seconds")
+    logger.info(
+        f"vectorized: {vectorized_time:.2f} seconds "
+        f"({merge_time / vectorized_time:.1f}x faster)"
+    )
+
+
+if __name__ == "__main__":
+    benchmark_occurrence_consistency()
@@ -0,0 +1,128 @@
+#! /usr/bin/env python
+"""Compare the spatially indexed self_union with the old all-pairs implementation.
+
+Overlapping service-territory-like features are built from the Census DP1 county layer
+(by default the one in ``$PUDL_OUTPUT``): each feature is the union of a random county
+with all of the counties that touch it. The layer is then unioned with itself using
+:func:`pudl.analysis.spatial.self_union` and with the old implementation, which
+intersects every pair of features. The results are checked for equality before the
+timings are reported.
+
+Example:
+    python benchmark_self_union.py --n-features 500 --state 08 --state 56
+"""
+
+import itertools
+import logging
+import time
+
+import click
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+import shapely.ops
+from geopandas.testing import assert_geodataframe_equal
+
+from pudl.analysis.spatial import check_gdf, get_data_columns, self_union
+from pudl.workspace.setup import PudlPaths
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def _pairwise_self_union(gdf: gpd.GeoDataFrame, ratios=None) -> gpd.GeoDataFrame:
+    """The original implementation of self_union, which intersects all pairs.
+
+    Polygons filling gaps enclosed by the features are dropped by an inner join, as
+    they are in the new implementation. The original left join raised a KeyError.
+    """
+    check_gdf(gdf)
+    gdf = gdf.reset_index(drop=True)
+    pairs = itertools.combinations(gdf.geometry, 2)
+    intersections = gpd.GeoSeries([a.intersection(b) for a, b in pairs])
+    boundaries = pd.concat([gdf.geometry, intersections]).boundary.unary_union
+    polygons = gpd.GeoSeries(shapely.ops.polygonize(boundaries))
+    points = gpd.GeoDataFrame(geometry=polygons.representative_point(), crs=gdf.crs)
+    oids = gpd.sjoin(points, gdf[["geometry"]], how="inner", predicate="within")[
+        "index_right"
+    ]
+    columns = get_data_columns(gdf)
+    df = gpd.GeoDataFrame(
+        data=gdf.loc[oids, columns].reset_index(drop=True),
+        geometry=polygons[oids.index].to_numpy(),
+    )
+    if ratios:
+        fraction = df.area.to_numpy() / gdf.area[oids].to_numpy()
+        df[ratios] = df[ratios].multiply(fraction, axis="index")
+    df.index = oids.groupby(oids.index).agg(tuple)[oids.index]
+    df.index.name = None
+    return df[gdf.columns]
+
+
+def _overlapping_features(
+    counties: gpd.GeoDataFrame, n_features: int, seed: int = 42
+) -> gpd.GeoDataFrame:
+    """Union random counties with their neighbors to make overlapping polygons."""
+    rng = np.random.default_rng(seed)
+    seeds = rng.choice(len(counties), min(n_features, len(counties)), replace=False)
+    geoms = counties.geometry.to_numpy()
+    neighbors, touched = counties.sindex.query(geoms[seeds], predicate="intersects")
+    features = (
+        gpd.GeoSeries(geoms[touched])
+        .groupby(seeds[neighbors])
+        .agg(lambda group: shapely.ops.unary_union(group.to_numpy()))
+    )
+    gdf = gpd.GeoDataFrame(
+        {
+            "geoid10": counties.geoid10.to_numpy()[features.index],
+            "dp0010001": counties.dp0010001.to_numpy()[features.index].astype(float),
+        },
+        geometry=features.to_numpy(),
+        crs=counties.crs,
+    ).explode(index_parts=False)
+    # self_union only supports Polygons, and counties are far apart in degrees.
+    return gdf[gdf.area > 1e-6].reset_index(drop=True).to_crs("ESRI:102003")
+
+
+@click.command()
+@click.option("--n-features", type=int, default=300, show_default=True)
+@click.option(
+    "--state",
+    "states",
+    multiple=True,
+    help="Two digit state FIPS codes to take counties from. Defaults to all states.",
+)
+def benchmark_self_union(n_features: int, states: tuple[str]):
+    """Time the self union of overlapping groups of census counties."""
+    counties = gpd.read_postgis(
+        "SELECT geoid10, dp0010001, shape AS geometry FROM county_2010census_dp1",
+        con=PudlPaths().sqlite_db_uri("censusdp1tract"),
+        geom_col="geometry",
+        crs="EPSG:4326",
+    )
+    if states:
+        counties = counties[counties.geoid10.str[:2].isin(states)]
+    gdf = _overlapping_features(counties.reset_index(drop=True), n_features)
+    logger.info(
+        f"Self-unioning {len(gdf)} features built from {len(counties)} counties."
+    )
+
+    start = time.perf_counter()
+    expected = _pairwise_self_union(gdf, ratios=["dp0010001"])
+    pairwise_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    actual = self_union(gdf, ratios=["dp0010001"])
+    indexed_time = time.perf_counter() - start
+
+    assert_geodataframe_equal(expected, actual)
+    logger.info(f"Output has {len(actual)} features.")
+    logger.info(f"all pairs: {pairwise_time:.2f} seconds")
+    logger.info(
+        f"spatial index: {indexed_time:.2f} seconds "
+        f"({pairwise_time / indexed_time:.1f}x faster)"
+    )
+
+
+if __name__ == "__main__":
+    benchmark_self_union()
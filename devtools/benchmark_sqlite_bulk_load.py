@@ -0,0 +1,82 @@
+#! /usr/bin/env python
+"""Compare DataFrame.to_sql with the bulk SQLite loader on a large PUDL table.
+
+The table is read from an existing PUDL SQLite database (by default the one in
+``$PUDL_OUTPUT``) and then written into two fresh, empty copies of the PUDL schema:
+once with :meth:`pandas.DataFrame.to_sql` as the SQLite IO manager used to do, and once
+with :func:`pudl.helpers.bulk_insert_sqlite`.
+
+Example:
+    python benchmark_sqlite_bulk_load.py --table core_eia923__monthly_generation_fuel
+"""
+
+import logging
+import tempfile
+import time
+from pathlib import Path
+
+import click
+import pandas as pd
+import sqlalchemy as sa
+
+from pudl.helpers import bulk_insert_sqlite, sqlite_pragmas
+from pudl.metadata.classes import Package, Resource
+from pudl.workspace.setup import PudlPaths
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def _to_sql(engine: sa.Engine, table: sa.Table, df: pd.DataFrame) -> None:
+    with engine.begin() as con:
+        df.to_sql(
+            table.name,
+            con,
+            if_exists="append",
+            index=False,
+            chunksize=100_000,
+            dtype={c.name: c.type for c in table.columns},
+        )
+
+
+def _bulk_insert(engine: sa.Engine, table: sa.Table, df: pd.DataFrame) -> None:
+    with engine.connect() as con, sqlite_pragmas(con), con.begin():
+        bulk_insert_sqlite(con, table, df)
+
+
+@click.command()
+@click.option(
+    "--table",
+    default="core_eia923__monthly_generation_fuel",
+    help="Name of the PUDL table to load.",
+)
+@click.option(
+    "--pudl-db",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    default=None,
+    help="PUDL SQLite DB to read the table from. Defaults to the one in PUDL_OUTPUT.",
+)
+def benchmark_sqlite_bulk_load(table: str, pudl_db: Path | None):
+    """Time writing one PUDL table to SQLite with to_sql and the bulk loader."""
+    pudl_db = pudl_db or PudlPaths().sqlite_db_path("pudl")
+    res = Resource.from_id(table)
+    with sa.create_engine(f"sqlite:///{pudl_db}").connect() as con:
+        df = res.enforce_schema(pd.read_sql_table(table, con))
+    logger.info(f"Read {len(df)} rows x {len(df.columns)} columns of {table}.")
+
+    md = Package.from_resource_ids().to_sql()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name, load in [("to_sql", _to_sql), ("bulk_insert_sqlite", _bulk_insert)]:
+            engine = sa.create_engine(f"sqlite:///{Path(tmp_dir) / name}.sqlite")
+            md.create_all(engine)
+            start = time.perf_counter()
+            load(engine, md.tables[table], df)
+            elapsed = time.perf_counter() - start
+            logger.info(
+                f"{name}: {elapsed:.2f} seconds ({len(df) / elapsed:,.0f} rows/s)"
+            )
+            engine.dispose()
+
+
+if __name__ == "__main__":
+    benchmark_sqlite_bulk_load()
@@ -1,26 +1,43 @@
 """The Public Utility Data Liberation (PUDL) Project."""
 
+import importlib
 import importlib.metadata
 
-from . import (
-    analysis,
-    convert,
-    etl,
-    extract,
-    ferc_to_sqlite,
-    glue,
-    helpers,
-    io_managers,
-    logging_helpers,
-    metadata,
-    output,
-    transform,
-    validate,
-    workspace,
-)
+from . import logging_helpers
 
 logging_helpers.configure_root_logger()
 
+# The subpackages are only imported when they're first used, so that e.g. the CLIs and
+# pudl.helpers don't have to wait for the ETL's assets and dependencies to be imported.
+_SUBPACKAGES = (
+    "analysis",
+    "convert",
+    "etl",
+    "extract",
+    "ferc_to_sqlite",
+    "glue",
+    "helpers",
+    "io_managers",
+    "metadata",
+    "output",
+    "transform",
+    "validate",
+    "workspace",
+)
+
+
+def __getattr__(name: str):
+    """Import subpackages on first access, e.g. ``pudl.helpers``."""
+    if name in _SUBPACKAGES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    """List the lazily imported subpackages along with the module's attributes."""
+    return sorted(set(globals()) | set(_SUBPACKAGES))
+
+
 __author__ = "Catalyst Cooperative"
 __contact__ = "pudl@catalyst.coop"
 __maintainer__ = "Catalyst Cooperative"
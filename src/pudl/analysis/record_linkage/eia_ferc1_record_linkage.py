@@ -28,15 +28,19 @@ are the connections we keep as the matches between FERC1 plant records and EIA
 plant-parts.
 """
 
+import hashlib
 import importlib
-from typing import Literal
+import json
+from typing import Any, Literal
 
 import jellyfish
 import mlflow
 import numpy as np
 import pandas as pd
-from dagster import Out, graph, op
+from dagster import Config, Out, graph, op
 from splink.duckdb.linker import DuckDBLinker
+from splink.predict import predict_from_comparison_vectors_sqls
+from splink.settings import Settings
 
 import pudl
 from pudl.analysis.ml_tools import experiment_tracking, models
@@ -49,6 +53,7 @@ from pudl.analysis.record_linkage.eia_ferc1_model_config import (
     BLOCKING_RULES,
     COMPARISONS,
 )
+from pudl.helpers import DataFrameFileCache
 from pudl.metadata.classes import DataSource, Resource
 
 logger = pudl.logging_helpers.get_logger(__name__)
@@ -171,23 +176,25 @@ def get_input_dfs(inputs):
     return eia_df, ferc_df
 
 
+def _get_metaphone(name: str | None) -> str | None:
+    """Return the metaphone encoding of a name, or None if it is null."""
+    if pd.isnull(name):
+        return None
+    return jellyfish.metaphone(name)
+
+
 @op
 def prepare_for_matching(df, transformed_df):
     """Prepare the input dataframes for matching with splink."""
-
-    def _get_metaphone(row, col_name):
-        if pd.isnull(row[col_name]):
-            return None
-        return jellyfish.metaphone(row[col_name])
-
     # replace old cols with transformed cols
     for col in transformed_df.columns:
         orig_col_name = col.split("__")[1]
         df[orig_col_name] = transformed_df[col]
     df["installation_year"] = pd.to_datetime(df["installation_year"], format="%Y")
     df["construction_year"] = pd.to_datetime(df["construction_year"], format="%Y")
-    df["plant_name_mphone"] = df.apply(_get_metaphone, axis=1, args=("plant_name",))
-    df["utility_name_mphone"] = df.apply(_get_metaphone, axis=1, args=("utility_name",))
+    # Names repeat across years and plant parts, so only encode each one once
+    for col in ["plant_name", "utility_name"]:
+        df[f"{col}_mphone"] = name_cleaner.map_unique_values(df[col], _get_metaphone)
     cols = ID_COL + MATCHING_COLS + EXTRA_COLS
     df = df.loc[:, cols]
     return df
@@ -208,9 +215,162 @@ def get_training_data_df(inputs):
     return train_df
 
 
+class SplinkModelCache(DataFrameFileCache):
+    """An on-disk cache of trained splink models and their record comparisons.
+
+    Trained models are stored as splink JSON settings files, and the compared pairs of
+    records for each report year as dataframes. Training the model and comparing the
+    records across all the report years are the most expensive steps of the FERC1 to EIA
+    record linkage, and their inputs rarely change between runs.
+
+    The cache is used by :func:`get_model_predictions` when the ``PUDL_SPLINK_CACHE``
+    environment variable is set to the directory where models should be stored.
+    """
+
+    ENV_VAR = "PUDL_SPLINK_CACHE"
+
+    def get_model(self, key: str) -> dict[str, Any] | None:
+        """Return the trained model stored under ``key``, or None if there isn't one."""
+        return self.get_entry(key, ".json")
+
+    def put_model(self, key: str, model: dict[str, Any]) -> None:
+        """Store a trained model, as returned by ``linker.save_model_to_json()``."""
+        self.put_entry(key, model, ".json")
+
+
+def _hash_json(*objs: Any) -> str:
+    """Hash JSON serializable objects, ignoring the random splink linker uid."""
+    objs = [
+        {k: v for k, v in obj.items() if k != "linker_uid"}
+        if isinstance(obj, dict)
+        else obj
+        for obj in objs
+    ]
+    return hashlib.sha256(
+        json.dumps(objs, sort_keys=True, default=str).encode()
+    ).hexdigest()
+
+
+def _hash_records(df: pd.DataFrame) -> str:
+    """Hash the columns and values of a dataframe."""
+    digest = hashlib.sha256("|".join(map(str, df.columns)).encode())
+    digest.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def _hash_report_years(df: pd.DataFrame) -> dict[int, str]:
+    """Hash the records of each report year in a dataframe."""
+    return {
+        int(year): _hash_records(df.iloc[inds])
+        for year, inds in df.groupby("report_year").indices.items()
+    }
+
+
+def _tf_columns(model: dict[str, Any]) -> set[str]:
+    """The columns with term frequency adjustments in a splink model."""
+    return {
+        level["tf_adjustment_column"]
+        for comparison in model["comparisons"]
+        for level in comparison["comparison_levels"]
+        if level.get("tf_adjustment_column")
+    }
+
+
+def _train_linker(linker: DuckDBLinker, train_df: pd.DataFrame) -> None:
+    """Estimate the u and m probabilities of the model from the training labels."""
+    linker.register_table(train_df, "training_labels", overwrite=True)
+    linker.estimate_u_using_random_sampling(max_pairs=1e7)
+    linker.estimate_m_from_pairwise_labels("training_labels")
+
+
+def _compare_report_years(
+    model: dict[str, Any],
+    eia_df: pd.DataFrame,
+    ferc_df: pd.DataFrame,
+    report_years: list[int],
+) -> pd.DataFrame:
+    """Compare all of the blocked pairs of records from a subset of report years.
+
+    All of the blocking rules require records to be from the same report year, so the
+    comparisons for each year only depend on that year's records. This is the
+    expensive part of predicting matches. The term frequencies and match weights are
+    computed from all the records in :func:`_score_comparisons`, so these comparisons
+    remain valid when the records from other years change.
+    """
+    linker = DuckDBLinker(
+        [
+            eia_df[eia_df.report_year.isin(report_years)],
+            ferc_df[ferc_df.report_year.isin(report_years)],
+        ],
+        input_table_aliases=["eia_df", "ferc_df"],
+        settings_dict=model,
+    )
+    return linker.predict().as_pandas_dataframe()
+
+
+def _score_comparisons(
+    model: dict[str, Any],
+    comparisons_df: pd.DataFrame,
+    eia_df: pd.DataFrame,
+    ferc_df: pd.DataFrame,
+    threshold_prob: float,
+) -> pd.DataFrame:
+    """Compute the match weights of compared pairs of records, and keep the matches.
+
+    The term frequencies of the compared values are looked up in tables computed from
+    all of the records, and the match weights are computed from the comparison levels
+    with splink's own SQL, so the results are the same as predicting every year at
+    once with ``linker.predict()``.
+    """
+    linker = DuckDBLinker(
+        [eia_df, ferc_df],
+        input_table_aliases=["eia_df", "ferc_df"],
+        settings_dict=model,
+    )
+    comparisons_df = comparisons_df.copy()
+    for col in sorted(_tf_columns(model)):
+        tf_table = linker.compute_tf_table(col).as_pandas_dataframe()
+        tf = tf_table.set_index(col)[f"tf_{col}"]
+        for side in ["l", "r"]:
+            comparisons_df[f"tf_{col}_{side}"] = comparisons_df[f"{col}_{side}"].map(tf)
+    linker.register_table(
+        comparisons_df, "__splink__df_comparison_vectors", overwrite=True
+    )
+    match_weight_parts, predict = predict_from_comparison_vectors_sqls(
+        Settings(model), threshold_match_probability=threshold_prob
+    )
+    return linker.query_sql(
+        f"WITH {match_weight_parts['output_table_name']} AS "
+        f"({match_weight_parts['sql']}) {predict['sql']}"
+    )
+
+
+class ModelPredictionsConfig(Config):
+    """Configuration for :func:`get_model_predictions`."""
+
+    #: Reuse a cached model trained on the same training labels and model settings
+    #: even if the input records have changed, and only predict matches for the report
+    #: years whose EIA plant parts or FERC1 plants changed. Cached comparisons for
+    #: other years are reused. Has no effect unless ``PUDL_SPLINK_CACHE`` is set.
+    incremental: bool = False
+
+
 @op
-def get_model_predictions(eia_df, ferc_df, train_df, experiment_tracker):
-    """Train splink model and output predicted matches."""
+def get_model_predictions(
+    config: ModelPredictionsConfig, eia_df, ferc_df, train_df, experiment_tracker
+):
+    """Train splink model and output predicted matches.
+
+    If a :class:`SplinkModelCache` is configured, the trained model is cached under a
+    hash of the training labels, the model settings and the input records. The
+    comparisons of all the blocked pairs of records in each report year are cached
+    under a hash of the model and of that year's input records. The term frequencies
+    depend on the records from every year, so the match weights are computed from the
+    cached comparisons on each run, which is cheap compared to making them. In
+    incremental mode the input records are left out of the model's key, so that new or
+    updated report years are linked with the existing model and only their records
+    are compared.
+    """
     settings_dict = {
         "link_type": "link_only",
         "unique_id_column_name": "record_id",
@@ -226,15 +386,62 @@ def get_model_predictions(eia_df, ferc_df, train_df, experiment_tracker):
         input_table_aliases=["eia_df", "ferc_df"],
         settings_dict=settings_dict,
     )
-    linker.register_table(train_df, "training_labels", overwrite=True)
-    linker.estimate_u_using_random_sampling(max_pairs=1e7)
-    linker.estimate_m_from_pairwise_labels("training_labels")
     threshold_prob = 0.9
     experiment_tracker.execute_logging(
         lambda: mlflow.log_params({"threshold match probability": threshold_prob})
     )
-    preds_df = linker.predict(threshold_match_probability=threshold_prob)
-    return preds_df.as_pandas_dataframe()
+    cache = SplinkModelCache.from_env()
+    if cache is None:
+        _train_linker(linker, train_df)
+        preds_df = linker.predict(threshold_match_probability=threshold_prob)
+        return preds_df.as_pandas_dataframe()
+
+    eia_year_hashes = _hash_report_years(eia_df)
+    ferc_year_hashes = _hash_report_years(ferc_df)
+    model_settings = linker.save_model_to_json()
+    if config.incremental:
+        # The prior depends on the number of EIA records, not on the training labels.
+        model_settings.pop("probability_two_random_records_match")
+        input_hashes = None
+    else:
+        input_hashes = [eia_year_hashes, ferc_year_hashes]
+    model_key = "splink_model__" + _hash_json(
+        model_settings, _hash_records(train_df), input_hashes
+    )
+    model = cache.get_model(model_key)
+    if model is None:
+        _train_linker(linker, train_df)
+        model = linker.save_model_to_json()
+        cache.put_model(model_key, model)
+    else:
+        logger.info(f"Using cached splink model {model_key}.")
+
+    model_hash = _hash_json(model)
+    comparison_keys = {
+        year: f"splink_comparisons__{year}__"
+        + _hash_json(model_hash, eia_year_hashes.get(year), ferc_hash)
+        for year, ferc_hash in ferc_year_hashes.items()
+    }
+    comparisons = {year: cache.get(key) for year, key in comparison_keys.items()}
+    stale_years = sorted(year for year, df in comparisons.items() if df is None)
+    if stale_years:
+        logger.info(
+            f"Comparing records for {len(stale_years)} of {len(comparisons)} report "
+            f"years: {stale_years}"
+        )
+        new_comparisons_df = _compare_report_years(model, eia_df, ferc_df, stale_years)
+        comparison_years = new_comparisons_df.record_id_r.map(
+            ferc_df.set_index("record_id").report_year
+        )
+        for year in stale_years:
+            comparisons[year] = new_comparisons_df[
+                comparison_years == year
+            ].reset_index(drop=True)
+            cache.put(comparison_keys[year], comparisons[year])
+    comparisons_df = pd.concat(
+        [comparisons[year] for year in sorted(comparisons)], ignore_index=True
+    )
+    return _score_comparisons(model, comparisons_df, eia_df, ferc_df, threshold_prob)
 
 
 @op()
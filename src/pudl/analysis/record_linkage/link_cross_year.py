@@ -1,17 +1,14 @@
 """Define a record linkage model interface and implement common functionality."""
 
-from pathlib import Path
-from tempfile import TemporaryDirectory
+from collections.abc import Iterator
 
 import mlflow
 import numpy as np
 import pandas as pd
+import scipy.sparse
 from dagster import Config, graph, op
-from numba import njit
-from numba.typed import List
 from sklearn.cluster import DBSCAN, AgglomerativeClustering
-from sklearn.metrics import pairwise_distances_chunked
-from sklearn.neighbors import NearestNeighbors
+from sklearn.metrics import pairwise_distances, pairwise_distances_chunked
 
 import pudl
 from pudl.analysis.ml_tools import experiment_tracking
@@ -29,89 +26,126 @@ class PenalizeReportYearDistanceConfig(Config):
 
     distance_penalty: float = 10000.0
     metric: str = "euclidean"
+    #: Only distances up to this radius are stored in the sparse distance graph. It
+    #: must be at least as large as the ``eps`` used by :func:`cluster_records_dbscan`.
+    radius: float = 0.5
 
 
 class DistanceMatrix:
-    """Class to wrap a distance matrix saved in a np.memmap."""
+    """Sparse radius neighbor graph of the penalized distances between records.
+
+    Distances are computed in blocks of rows, and only the pairs of records within
+    ``radius`` of each other are kept, so the dense n x n matrix is never materialized.
+    The same report year penalty is applied to each block with a mask comparing the
+    report years of its rows and columns. Steps which need distances beyond the radius
+    recompute them from the feature matrix with :meth:`get_block_distances` or
+    :meth:`iter_distance_blocks`.
+    """
 
     def __init__(
         self,
-        feature_matrix: np.ndarray,
+        feature_matrix: np.ndarray | scipy.sparse.csr_matrix,
         original_df: pd.DataFrame,
         config: PenalizeReportYearDistanceConfig,
     ):
-        """Compute distance matrix from feature_matrix and write to memmap."""
-        self.file_buffer = TemporaryDirectory()
-
-        filename = Path(self.file_buffer.name) / "distance_matrix.dat"
-        self.distance_matrix = np.memmap(
-            filename,
-            dtype="float32",
-            mode="w+",
-            shape=(feature_matrix.shape[0], feature_matrix.shape[0]),
+        """Compute the radius neighbor graph from feature_matrix."""
+        self.feature_matrix = feature_matrix
+        self.report_year = original_df["report_year"].to_numpy()
+        self.metric = config.metric
+        self.distance_penalty = config.distance_penalty
+        self.radius = config.radius
+
+        n_records = feature_matrix.shape[0]
+        data, indices, row_lengths = [], [], []
+        for _, block in self.iter_distance_blocks():
+            rows, cols = np.nonzero(block <= self.radius)
+            data.append(block[rows, cols])
+            indices.append(cols)
+            row_lengths.append(np.bincount(rows, minlength=len(block)))
+
+        indptr = np.zeros(n_records + 1, dtype=np.int64)
+        np.cumsum(np.concatenate(row_lengths), out=indptr[1:])
+        # Build the CSR arrays directly so that explicit zero distances are kept.
+        self.distance_matrix = scipy.sparse.csr_matrix(
+            (np.concatenate(data), np.concatenate(indices), indptr),
+            shape=(n_records, n_records),
+        )
+        logger.info(
+            f"Stored {self.distance_matrix.nnz} of {n_records**2} distances within "
+            f"radius {self.radius}."
         )
 
-        # Compute distances in chunks and write to memmap
+    def _penalize(self, block: np.ndarray, row_inds: np.ndarray, col_inds: np.ndarray):
+        """Apply the same report year penalty to a block of distances in place."""
+        same_year = self.report_year[row_inds, None] == self.report_year[None, col_inds]
+        block[same_year] = self.distance_penalty
+        # Records are never penalized against themselves.
+        block[row_inds[:, None] == col_inds[None, :]] = 0
+
+    def get_block_distances(
+        self, row_inds: np.ndarray, col_inds: np.ndarray | None = None
+    ) -> np.ndarray:
+        """Return the dense penalized distances between two sets of records."""
+        col_inds = row_inds if col_inds is None else col_inds
+        block = pairwise_distances(
+            self.feature_matrix[row_inds],
+            self.feature_matrix[col_inds],
+            metric=self.metric,
+        ).astype("float32")
+        self._penalize(block, row_inds, col_inds)
+        return block
+
+    def iter_distance_blocks(self) -> Iterator[tuple[slice, np.ndarray]]:
+        """Yield consecutive blocks of rows of the dense penalized distance matrix."""
+        all_inds = np.arange(self.feature_matrix.shape[0])
         row_start = 0
-        for chunk in pairwise_distances_chunked(feature_matrix, metric=config.metric):
-            self.distance_matrix[row_start : row_start + len(chunk), :] = chunk[:, :]
-            self.distance_matrix.flush()
+        for chunk in pairwise_distances_chunked(
+            self.feature_matrix, metric=self.metric
+        ):
+            rows = slice(row_start, row_start + len(chunk))
+            block = chunk.astype("float32")
+            self._penalize(block, all_inds[rows], all_inds)
+            yield rows, block
             row_start += len(chunk)
 
-        # Apply distance penalty to records from the same year
-        year_inds = original_df.groupby("report_year").indices
-        for inds in year_inds.values():
-            matching_year_inds = np.array(np.meshgrid(inds, inds)).T.reshape(-1, 2)
-            self.distance_matrix[matching_year_inds[:, 0], matching_year_inds[:, 1]] = (
-                config.distance_penalty
-            )
-
-        np.fill_diagonal(self.distance_matrix, 0)
-        self.distance_matrix.flush()
-
-        # Convert distance matrix to read only memory map
-        self.distance_matrix = np.memmap(
-            filename,
-            dtype="float32",
-            mode="r",
-            shape=(feature_matrix.shape[0], feature_matrix.shape[0]),
-        )
-
 
 def get_cluster_distance_matrix(
-    distance_matrix: np.ndarray, cluster_inds: np.ndarray
+    distance_matrix: DistanceMatrix, cluster_inds: np.ndarray
 ) -> np.ndarray:
     """Return a distance matrix with only distances within a cluster."""
-    cluster_size = len(cluster_inds)
-    dist_inds = np.array(np.meshgrid(cluster_inds, cluster_inds)).T.reshape(-1, 2)
-    return distance_matrix[dist_inds[:, 0], dist_inds[:, 1]].reshape(
-        (cluster_size, cluster_size)
-    )
+    return distance_matrix.get_block_distances(cluster_inds)
 
 
-@njit
 def get_average_distance_matrix(
-    distance_matrix: np.ndarray,
-    cluster_groups: list[list[int]],
+    distance_matrix: DistanceMatrix,
+    cluster_groups: list[np.ndarray],
 ) -> np.ndarray:
-    """Compute average distance between two clusters of records given indices of each cluster."""
-    # Prepare a distance matrix of (n_clusters x n_clusters)
-    # Distance matrix contains average distance between each cluster
-    n_clusters = len(cluster_groups)
-    average_dist_matrix = np.zeros((n_clusters, n_clusters))
+    """Compute average distance between two clusters of records given indices of each cluster.
 
-    # Heavy nested looping optimized by numba
-    for i, cluster_i in enumerate(cluster_groups):
-        for j, cluster_j in enumerate(cluster_groups[:i]):
-            total_dist = 0
-            for cluster_i_ind in cluster_i:
-                for cluster_j_ind in cluster_j:
-                    total_dist += distance_matrix[cluster_i_ind, cluster_j_ind]
+    The summed distances between each pair of clusters are accumulated one block of
+    rows at a time, as the product of the distance block with a sparse record to
+    cluster membership matrix.
+    """
+    n_records = distance_matrix.feature_matrix.shape[0]
+    n_clusters = len(cluster_groups)
+    cluster_sizes = np.array([len(inds) for inds in cluster_groups])
+    membership = scipy.sparse.csr_matrix(
+        (
+            np.ones(cluster_sizes.sum()),
+            (
+                np.concatenate(cluster_groups),
+                np.repeat(np.arange(n_clusters), cluster_sizes),
+            ),
+        ),
+        shape=(n_records, n_clusters),
+    )
 
-            average_dist = total_dist / (len(cluster_i) + len(cluster_j))
-            average_dist_matrix[i, j] = average_dist
-            average_dist_matrix[j, i] = average_dist
+    total_dist = np.zeros((n_clusters, n_clusters))
+    for rows, block in distance_matrix.iter_distance_blocks():
+        total_dist += membership[rows].T @ (membership.T @ block.T).T
 
+    average_dist_matrix = total_dist / (cluster_sizes[:, None] + cluster_sizes[None, :])
+    np.fill_diagonal(average_dist_matrix, 0)
     return average_dist_matrix
 
 
@@ -142,10 +176,14 @@ def cluster_records_dbscan(
     experiment_tracker: experiment_tracking.ExperimentTracker,
 ) -> pd.DataFrame:
     """Generate initial IDs using DBSCAN algorithm."""
-    # DBSCAN is very efficient when passed a sparse radius neighbor graph
-    neighbor_computer = NearestNeighbors(radius=config.eps, metric="precomputed")
-    neighbor_computer.fit(distance_matrix.distance_matrix)
-    neighbor_graph = neighbor_computer.radius_neighbors_graph(mode="distance")
+    # DBSCAN is very efficient when passed a sparse radius neighbor graph, but it needs
+    # every pair of records within eps to be stored in the graph.
+    if config.eps > distance_matrix.radius:
+        raise ValueError(
+            f"DBSCAN eps ({config.eps}) is larger than the radius of the distance "
+            f"matrix ({distance_matrix.radius})."
+        )
+    neighbor_graph = distance_matrix.distance_matrix
 
     # Classify records
     classifier = DBSCAN(metric="precomputed", eps=config.eps, min_samples=2)
@@ -218,9 +256,7 @@ def split_clusters(
         cluster_inds = id_year_df[
             id_year_df.record_label == duplicated_id
         ].index.to_numpy()
-        cluster_distances = get_cluster_distance_matrix(
-            distance_matrix.distance_matrix, cluster_inds
-        )
+        cluster_distances = get_cluster_distance_matrix(distance_matrix, cluster_inds)
 
         new_labels = classifier.fit_predict(cluster_distances)
         for new_label in np.unique(new_labels):
@@ -270,15 +306,12 @@ def match_orphaned_records(
     cluster_inds = id_year_df.groupby("record_label").indices
 
     # Orphaned records are considered a cluster of a single record
-    cluster_groups = [List([ind]) for ind in cluster_inds.get(-1, [])]
+    cluster_groups = [np.array([ind]) for ind in cluster_inds.get(-1, [])]
 
     # Get list of all points in each assigned cluster
-    cluster_groups += [List(inds) for key, inds in cluster_inds.items() if key != -1]
-    cluster_groups = List(cluster_groups)
+    cluster_groups += [inds for key, inds in cluster_inds.items() if key != -1]
 
-    average_dist_matrix = get_average_distance_matrix(
-        distance_matrix.distance_matrix, cluster_groups
-    )
+    average_dist_matrix = get_average_distance_matrix(distance_matrix, cluster_groups)
 
     # Assign new labels to all points
     new_labels = classifier.fit_predict(average_dist_matrix)
@@ -6,20 +6,26 @@ the historical spatial extent of utility and balancing area territories. Output
 resulting geometries for use in other applications.
 """
 
+import hashlib
 import math
+import multiprocessing
 import pathlib
 import sys
 from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
 from typing import Literal
 
 import click
 import geopandas as gpd
+import numpy as np
 import pandas as pd
+import shapely
 import sqlalchemy as sa
 from dagster import AssetsDefinition, Field, asset
 from matplotlib import pyplot as plt
 
 import pudl
+from pudl.helpers import CacheEntryFormat, DataFrameFileCache
 from pudl.workspace.setup import PudlPaths
 
 logger = pudl.logging_helpers.get_logger(__name__)
@@ -122,11 +128,131 @@ def get_territory_fips(
     )
 
 
+class TerritoryGeometryCache(DataFrameFileCache):
+    """An on-disk cache of the geometries of dissolved sets of counties.
+
+    Most utilities and balancing authorities serve the same set of counties year after
+    year, so each distinct territory only needs to be dissolved once. The geometries of
+    all the county sets dissolved from one version of the Census county layer are stored
+    together in a single GeoParquet file.
+
+    The cache is used by :func:`add_geometries` when the ``PUDL_TERRITORY_CACHE``
+    environment variable is set to the directory where geometries should be stored.
+    """
+
+    ENV_VAR = "PUDL_TERRITORY_CACHE"
+    FORMATS = DataFrameFileCache.FORMATS | {
+        ".parquet": CacheEntryFormat(
+            gpd.read_parquet,
+            lambda gdf, path: gdf.to_parquet(path, index=False),
+            (OSError, ValueError),
+        )
+    }
+
+    def get_geometries(self, key: str) -> gpd.GeoSeries | None:
+        """Return the geometries stored under ``key``, indexed by county set."""
+        gdf = self.get_entry(key, ".parquet")
+        return None if gdf is None else gdf.set_index("county_id_fips_set").geometry
+
+    def put_geometries(self, key: str, geoms: gpd.GeoSeries) -> None:
+        """Store geometries indexed by county set, replacing any stored under ``key``."""
+        gdf = gpd.GeoDataFrame(
+            geoms.rename_axis("county_id_fips_set").rename("geometry").reset_index()
+        )
+        self.put_entry(key, gdf, ".parquet")
+
+
+def _hash_county_geometries(counties: dict[str, shapely.Geometry]) -> str:
+    """Hash the IDs and geometries of the Census counties."""
+    digest = hashlib.sha256()
+    for fips, geom in sorted(counties.items()):
+        digest.update(fips.encode())
+        digest.update(shapely.to_wkb(geom))
+    return digest.hexdigest()
+
+
+_COUNTY_GEOMETRIES: dict[str, shapely.Geometry] = {}
+
+
+def _init_dissolve_worker(counties: dict[str, shapely.Geometry]) -> None:
+    global _COUNTY_GEOMETRIES
+    _COUNTY_GEOMETRIES = counties
+
+
+def _dissolve_county_sets(
+    county_sets: list[str], counties: dict[str, shapely.Geometry] | None = None
+) -> list[shapely.Geometry]:
+    """Union the geometries of each comma separated set of county FIPS IDs."""
+    counties = _COUNTY_GEOMETRIES if counties is None else counties
+    return [
+        shapely.union_all([counties[fips] for fips in county_set.split(",")])
+        for county_set in county_sets
+    ]
+
+
+def dissolve_county_sets(
+    county_sets: Iterable[str],
+    counties: dict[str, shapely.Geometry],
+    crs=None,
+    num_workers: int = 1,
+) -> gpd.GeoSeries:
+    """Dissolve county geometries into the territory of each set of counties.
+
+    Each distinct set of counties is only dissolved once. If the
+    ``PUDL_TERRITORY_CACHE`` environment variable is set, the dissolved geometries are
+    also persisted between runs (see :class:`TerritoryGeometryCache`).
+
+    Args:
+        county_sets: Sets of counties, each identified by the sorted, comma separated
+            FIPS IDs of its counties.
+        counties: The geometry of each county, keyed by its FIPS ID.
+        crs: The coordinate reference system of the county geometries.
+        num_workers: Number of processes to spread the dissolves across.
+
+    Returns:
+        The dissolved geometry of each distinct county set, indexed by county set.
+    """
+    county_sets = pd.unique(np.asarray(list(county_sets), dtype=object))
+    cache = TerritoryGeometryCache.from_env()
+    cache_key = f"territory_geometries__{_hash_county_geometries(counties)}"
+    cached = cache.get_geometries(cache_key) if cache else None
+    if cached is None:
+        cached = gpd.GeoSeries([], index=pd.Index([], dtype=object), crs=crs)
+    missing = [cs for cs in county_sets if cs not in cached.index]
+    logger.info(
+        f"Dissolving {len(missing)} of {len(county_sets)} distinct county sets "
+        f"({len(county_sets) - len(missing)} cached)."
+    )
+    if num_workers > 1 and len(missing) > 1:
+        chunks = np.array_split(np.asarray(missing, dtype=object), num_workers * 4)
+        with ProcessPoolExecutor(
+            max_workers=num_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_dissolve_worker,
+            initargs=(counties,),
+        ) as executor:
+            dissolved = [
+                geom
+                for geoms in executor.map(_dissolve_county_sets, map(list, chunks))
+                for geom in geoms
+            ]
+    else:
+        dissolved = _dissolve_county_sets(missing, counties)
+    if missing:
+        cached = pd.concat(
+            [cached, gpd.GeoSeries(dissolved, index=missing, crs=cached.crs or crs)]
+        )
+        if cache:
+            cache.put_geometries(cache_key, cached)
+    return cached.loc[county_sets].set_crs(crs, allow_override=True)
+
+
 def add_geometries(
     df: pd.DataFrame,
     census_gdf: gpd.GeoDataFrame,
     dissolve: bool = False,
     dissolve_by: list[str] = None,
+    num_workers: int = 1,
 ) -> gpd.GeoDataFrame:
     """Merge census geometries into dataframe on county_id_fips, optionally dissolving.
 
@@ -146,6 +272,8 @@ def add_geometries(
             dissolve_by=["report_date", "utility_id_eia"] might provide annual utility
             service territories, while ["report_date", "balancing_authority_id_eia"]
             would provide annual balancing authority territories.
+        num_workers: Number of processes to spread the dissolves across. Each
+            distinct set of counties is only dissolved once.
 
     Returns:
         geopandas.GeoDataFrame
@@ -175,8 +303,32 @@ def add_geometries(
         summed = (
             out_gdf.groupby(dissolve_by)[["population", "area_km2"]].sum().reset_index()
         )
+        # Identify each territory by its set of counties, and only dissolve each
+        # distinct set once, no matter how many entities and years share it.
+        county_sets = (
+            out_gdf.loc[out_gdf.geometry.notna()]
+            .groupby(dissolve_by)
+            .county_id_fips.agg(lambda fips: ",".join(sorted(fips)))
+        )
+        counties = census_gdf.loc[census_gdf.geometry.notna()]
+        geometry = gpd.GeoSeries(
+            dissolve_county_sets(
+                county_sets,
+                counties=dict(zip(counties.geoid10, counties.geometry, strict=True)),
+                crs=census_gdf.crs,
+                num_workers=num_workers,
+            )
+            .loc[county_sets.to_numpy()]
+            .to_numpy(),
+            index=county_sets.index,
+            crs=census_gdf.crs,
+        )
+        first = (
+            pd.DataFrame(out_gdf.drop(columns="geometry")).groupby(dissolve_by).first()
+        )
         out_gdf = (
-            out_gdf.dissolve(by=dissolve_by)
+            gpd.GeoDataFrame(geometry=geometry.reindex(first.index))
+            .join(first)
             .drop(
                 [
                     "county_id_fips",
@@ -203,6 +355,7 @@ def get_territory_geometries(
     census_gdf: gpd.GeoDataFrame,
     limit_by_state: bool = True,
     dissolve: bool = False,
+    num_workers: int = 1,
 ) -> gpd.GeoDataFrame:
     """Compile service territory geometries based on county_id_fips.
 
@@ -215,7 +368,9 @@ def get_territory_geometries(
 
     Note:
         Dissolving geometires is a costly operation, and may take half an hour or more
-        if you are processing all entities for all years. Dissolving also means that all
+        if you are processing all entities for all years. Each distinct set of counties
+        is only dissolved once, and the dissolved geometries can be persisted between
+        runs by setting ``PUDL_TERRITORY_CACHE``. Dissolving also means that all
         the per-county information will be lost, rendering the output inappropriate for
         use in many analyses. Dissolving is mostly useful for generating visualizations.
 
@@ -240,6 +395,7 @@ def get_territory_geometries(
             county-level geometries for each utility in each year will be merged
             together ("dissolved") resulting in a single geometry and record for each
             balancing_authority-year.
+        num_workers: Number of processes to spread the dissolves across.
 
     Returns:
         A GeoDataFrame with service territory geometries for each entity.
@@ -255,6 +411,7 @@ def get_territory_geometries(
         census_gdf,
         dissolve=dissolve,
         dissolve_by=["report_date", assn_col],
+        num_workers=num_workers,
     )
 
 
@@ -307,6 +464,7 @@ def compile_geoms(
     dissolve: bool = False,
     limit_by_state: bool = True,
     years: list[int] = [],
+    num_workers: int = 1,
 ) -> pd.DataFrame:
     """Compile all available utility or balancing authority geometries.
 
@@ -367,6 +525,7 @@ def compile_geoms(
         census_gdf=census_counties,
         limit_by_state=limit_by_state,
         dissolve=dissolve,
+        num_workers=num_workers,
     )
     if save_format == "geoparquet":
         # TODO[dagster]: update to use IO Manager.
@@ -414,6 +573,13 @@ def service_territory_asset_factory(
                     "Format of output in PUDL. One of: geoparquet, geodataframe, dataframe."
                 ),
             ),
+            "num_workers": Field(
+                int,
+                default_value=1,
+                description=(
+                    "Number of processes to spread the dissolves across. Only used if dissolve is True."
+                ),
+            ),
         },
         compute_kind="Python",
     )
@@ -447,6 +613,7 @@ def service_territory_asset_factory(
             dissolve=dissolve,
             limit_by_state=limit_by_state,
             save_format=save_format,
+            num_workers=context.op_config["num_workers"],
         )
 
     return _service_territory
@@ -644,6 +811,18 @@ def plot_all_territories(
         "the other flags provided."
     ),
 )
+@click.option(
+    "--num-workers",
+    "-w",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help=(
+        "Number of processes to spread the dissolve operations across. Set the "
+        "PUDL_TERRITORY_CACHE environment variable to a directory to reuse dissolved "
+        "geometries between runs."
+    ),
+)
 @click.option(
     "--logfile",
     help="If specified, write logs to this file.",
@@ -667,6 +846,7 @@ def pudl_service_territories(
     output_dir: pathlib.Path,
     limit_by_state: bool,
     years: list[int],
+    num_workers: int,
     logfile: pathlib.Path,
     loglevel: str,
 ):
@@ -726,6 +906,7 @@ FROM
         entity_type=entity_type,
         limit_by_state=limit_by_state,
         years=years,
+        num_workers=num_workers,
     )
 
 
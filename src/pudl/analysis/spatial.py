@@ -1,12 +1,13 @@
 """Spatial operations for demand allocation."""
 
-import itertools
 import warnings
 from collections.abc import Callable, Iterable
 from typing import Literal
 
 import geopandas as gpd
+import numpy as np
 import pandas as pd
+import shapely
 import shapely.ops
 from shapely.geometry import GeometryCollection, MultiPolygon, Polygon
 from shapely.geometry.base import BaseGeometry
@@ -139,26 +140,34 @@ def self_union(gdf: gpd.GeoDataFrame, ratios: Iterable[str] = None) -> gpd.GeoDa
     is_mpoly = gdf.geometry.geom_type == "MultiPolygon"
     if is_mpoly.any():
         raise NotImplementedError("MultiPolygon geometries are not yet supported")
-    # Calculate all pairwise intersections
+    geoms = gdf.geometry.to_numpy()
+    tree = shapely.STRtree(geoms)
+    # Calculate the intersections of each pair of features whose geometries intersect,
+    # using the spatial index to skip the many pairs which are far apart.
     # https://nbviewer.jupyter.org/gist/jorisvandenbossche/3a55a16fda9b3c37e0fb48b1d4019e65
-    pairs = itertools.combinations(gdf.geometry, 2)
-    intersections = gpd.GeoSeries([a.intersection(b) for a, b in pairs])
+    left, right = tree.query(geoms, predicate="intersects")
+    is_pair = left < right
+    # Keep the pairs in the order of itertools.combinations, so the union of their
+    # boundaries is noded, and the resulting polygons ordered, the same way.
+    order = np.lexsort((right[is_pair], left[is_pair]))
+    left, right = left[is_pair][order], right[is_pair][order]
+    intersections = shapely.intersection(geoms[left], geoms[right])
     # Form polygons from the boundaries of the original polygons and their intersections
-    boundaries = pd.concat([gdf.geometry, intersections]).boundary.unary_union
-    polygons = gpd.GeoSeries(shapely.ops.polygonize(boundaries))
-    # Determine origin of each polygon by a spatial join on representative points
-    points = gpd.GeoDataFrame(geometry=polygons.representative_point())
-    oids = gpd.sjoin(
-        points,
-        gdf[["geometry"]],
-        how="left",
-        predicate="within",
-    )["index_right"]
+    boundaries = shapely.union_all(
+        shapely.boundary(np.concatenate([geoms, intersections]))
+    )
+    polygons = np.array(list(shapely.ops.polygonize(boundaries)), dtype=object)
+    # Determine origin of each polygon from the features containing its representative
+    # point. Polygons filling gaps enclosed by the features belong to none of them.
+    points = shapely.point_on_surface(polygons)
+    pids, oids = tree.query(points, predicate="within")
+    order = np.lexsort((oids, pids))
+    oids = pd.Series(oids[order], index=pids[order])
     # Build new dataframe
     columns = get_data_columns(gdf)
     df = gpd.GeoDataFrame(
         data=gdf.loc[oids, columns].reset_index(drop=True),
-        geometry=polygons[oids.index].to_numpy(),
+        geometry=polygons[oids.index],
     )
     if ratios:
         fraction = df.area.to_numpy() / gdf.area[oids].to_numpy()
@@ -18,7 +18,11 @@ electricity demand estimates (e.g. at the county level).
 """
 
 import datetime
+import multiprocessing
+import tempfile
 from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
 from typing import Any
 
 import geopandas as gpd
@@ -378,29 +382,86 @@ def filter_ferc714_hourly_demand_matrix(
     return df
 
 
-def impute_ferc714_hourly_demand_matrix(df: pd.DataFrame) -> pd.DataFrame:
+_DEMAND_MATRIX: np.ndarray | None = None
+
+
+def _init_impute_worker(path: str) -> None:
+    """Memory-map the demand matrix shared by all of the imputation workers."""
+    global _DEMAND_MATRIX
+    _DEMAND_MATRIX = np.load(path, mmap_mode="r")
+
+
+def _impute_demand_year(
+    rows: np.ndarray,
+    cols: np.ndarray,
+    x: np.ndarray | None = None,
+    **kwargs: Any,
+) -> np.ndarray:
+    """Impute the selected rows and columns of the demand matrix."""
+    x = _DEMAND_MATRIX if x is None else x
+    tsi = pudl.analysis.timeseries_cleaning.Timeseries(x[np.ix_(rows, cols)])
+    return tsi.impute(method="tnn", **kwargs)
+
+
+def impute_ferc714_hourly_demand_matrix(
+    df: pd.DataFrame, num_workers: int = 1, **kwargs: Any
+) -> pd.DataFrame:
     """Impute null values in FERC 714 hourly demand matrix.
 
     Imputation is performed separately for each year,
     with only the respondents reporting data in that year.
+    Since the years are independent, they can be imputed concurrently
+    in a pool of processes which memory-map a single copy of the matrix.
 
     .. note::
-        Takes about 15 minutes.
+        Takes about 15 minutes in a single process.
 
     Args:
         df: FERC 714 hourly demand matrix,
           as described in :func:`load_ferc714_hourly_demand_matrix`.
+        num_workers: Number of processes to impute the years in.
+        kwargs: Optional arguments to
+          :meth:`pudl.analysis.timeseries_cleaning.Timeseries.impute`.
 
     Returns:
         Copy of `df` with imputed values.
     """
-    results = []
-    for year, gdf in df.groupby(df.index.year):
-        logger.info(f"Imputing year {year}")
-        keep = df.columns[~gdf.isnull().all()]
-        tsi = pudl.analysis.timeseries_cleaning.Timeseries(gdf[keep])
-        result = tsi.to_dataframe(tsi.impute(method="tnn"), copy=False)
-        results.append(result)
+    x = df.to_numpy(dtype=float)
+    years = df.groupby(df.index.year).indices
+    keeps = {
+        year: np.flatnonzero(~np.isnan(x[rows]).all(axis=0))
+        for year, rows in years.items()
+    }
+    if num_workers > 1 and len(years) > 1:
+        logger.info(f"Imputing {len(years)} years with {num_workers} processes.")
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = str(Path(tmp_dir) / "demand_matrix.npy")
+            np.save(path, x)
+            # Spawn rather than fork, since the parent is usually a threaded process.
+            with ProcessPoolExecutor(
+                max_workers=num_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_impute_worker,
+                initargs=(path,),
+            ) as executor:
+                futures = {
+                    year: executor.submit(
+                        _impute_demand_year, rows, keeps[year], **kwargs
+                    )
+                    for year, rows in years.items()
+                }
+                imputed = {year: future.result() for year, future in futures.items()}
+    else:
+        imputed = {}
+        for year, rows in years.items():
+            logger.info(f"Imputing year {year}")
+            imputed[year] = _impute_demand_year(rows, keeps[year], x=x, **kwargs)
+    results = [
+        pd.DataFrame(
+            imputed[year], index=df.index[rows], columns=df.columns[keeps[year]]
+        )
+        for year, rows in years.items()
+    ]
     return pd.concat(results)
 
 
@@ -474,8 +535,21 @@ def _out_ferc714__hourly_demand_matrix(
     return df
 
 
-@asset(compute_kind="NumPy")
+@asset(
+    compute_kind="NumPy",
+    config_schema={
+        "num_workers": Field(
+            int,
+            default_value=1,
+            description=(
+                "Number of processes to impute the years of demand in. If 1, all years"
+                " are imputed in the asset's own process."
+            ),
+        ),
+    },
+)
 def _out_ferc714__hourly_imputed_demand(
+    context,
     _out_ferc714__hourly_demand_matrix: pd.DataFrame,
     _out_ferc714__utc_offset: pd.DataFrame,
 ) -> pd.DataFrame:
@@ -492,7 +566,10 @@ def _out_ferc714__hourly_imputed_demand(
     Returns:
         df: DataFrame with imputed FERC714 hourly demand.
     """
-    df = impute_ferc714_hourly_demand_matrix(_out_ferc714__hourly_demand_matrix)
+    df = impute_ferc714_hourly_demand_matrix(
+        _out_ferc714__hourly_demand_matrix,
+        num_workers=context.op_config["num_workers"],
+    )
     df = melt_ferc714_hourly_demand_matrix(df, _out_ferc714__utc_offset)
     return df
 
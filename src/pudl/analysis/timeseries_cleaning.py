@@ -30,8 +30,11 @@ And described at:
 """
 
 import functools
+import itertools
+import multiprocessing
 import warnings
 from collections.abc import Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
 from typing import Any
 
 import matplotlib.pyplot as plt
@@ -39,6 +42,10 @@ import numpy as np
 import pandas as pd
 import scipy.stats
 
+import pudl.logging_helpers
+
+logger = pudl.logging_helpers.get_logger(__name__)
+
 # ---- Helpers ---- #
 
 
@@ -333,6 +340,7 @@ def impute_latc_tnn(
     theta: int = 20,
     epsilon: float = 1e-7,
     maxiter: int = 300,
+    seed: int | None = None,
 ) -> np.ndarray:
     """Impute tensor values with LATC-TNN method by Chen and Sun (2020).
 
@@ -352,11 +360,12 @@ def impute_latc_tnn(
         theta:
         epsilon: Convergence criterion. A smaller number will result in more iterations.
         maxiter: Maximum number of iterations.
+        seed: Seed for the random initial autoregressive coefficients.
 
     Returns:
         Tensor with missing values in `tensor` replaced by imputed values.
     """
-    rng = np.random.default_rng()
+    rng = np.random.default_rng(seed)
     tensor = np.where(np.isnan(tensor), 0, tensor)
     dim = np.array(tensor.shape)
     dim_time = int(np.prod(dim) / dim[0])
@@ -410,10 +419,9 @@ def impute_latc_tnn(
         tol = np.linalg.norm((mat_hat - last_mat), "fro") / snorm
         last_mat = mat_hat.copy()
         it += 1
-        print(f"Iteration: {it}", end="\r")
         if tol < epsilon or it >= maxiter:
             break
-    print(f"Iteration: {it}")
+    logger.debug(f"Stopped after {it} iterations.")
     return tensor_hat
 
 
@@ -439,6 +447,7 @@ def impute_latc_tubal(  # noqa: C901
     lambda0: float = 2e-7,
     epsilon: float = 1e-7,
     maxiter: int = 300,
+    seed: int | None = None,
 ) -> np.ndarray:
     """Impute tensor values with LATC-Tubal method by Chen, Chen and Sun (2020).
 
@@ -457,11 +466,12 @@ def impute_latc_tubal(  # noqa: C901
         lambda0:
         epsilon: Convergence criterion. A smaller number will result in more iterations.
         maxiter: Maximum number of iterations.
+        seed: Seed for the random initial autoregressive coefficients.
 
     Returns:
         Tensor with missing values in `tensor` replaced by imputed values.
     """
-    rng = np.random.default_rng()
+    rng = np.random.default_rng(seed)
     tensor = np.where(np.isnan(tensor), 0, tensor)
     dim = np.array(tensor.shape)
     dim_time = int(np.prod(dim) / dim[0])
@@ -522,10 +532,9 @@ def impute_latc_tubal(  # noqa: C901
             temp1 = _ten2mat(_mat2ten(z, dim, 0) - t / rho, 2)
             _, phi = np.linalg.eig(temp1 @ temp1.T)
             del temp1
-        print(f"Iteration: {it}", end="\r")
         if tol < epsilon or it >= maxiter:
             break
-    print(f"Iteration: {it}")
+    logger.debug(f"Stopped after {it} iterations.")
     return x
 
 
@@ -1220,6 +1229,7 @@ class Timeseries:
         periods: int = 24,
         blocks: int = 1,
         method: str = "tubal",
+        num_workers: int = 1,
         **kwargs: Any,
     ) -> np.ndarray:
         """Impute null values.
@@ -1237,6 +1247,8 @@ class Timeseries:
                 This has been found to reduce processing time for `method='tnn'`.
             method: Imputation method to use
                 ('tubal': :func:`impute_latc_tubal`, 'tnn': :func:`impute_latc_tnn`).
+            num_workers: Number of processes to impute the blocks in.
+                Blocks are imputed independently, so this has no effect on the result.
             kwargs: Optional arguments to `method`.
 
         Returns:
@@ -1253,11 +1265,25 @@ class Timeseries:
         tensor = self.fold_tensor(x, periods=periods)
         n = tensor.shape[1]
         ends = [*range(0, n, int(np.ceil(n / blocks))), n]
-        for i in range(blocks):
-            if blocks > 1:
-                print(f"Block: {i}")
-            idx = slice(None), slice(ends[i], ends[i + 1]), slice(None)
-            tensor[idx] = imputer(tensor[idx], **kwargs)
+        idxs = [
+            (slice(None), slice(start, end), slice(None))
+            for start, end in itertools.pairwise(ends)
+        ]
+        impute_block = functools.partial(imputer, **kwargs)
+        if num_workers > 1 and len(idxs) > 1:
+            logger.info(f"Imputing {len(idxs)} blocks with {num_workers} processes.")
+            # Spawn rather than fork, since this is usually run in a threaded process.
+            with ProcessPoolExecutor(
+                max_workers=num_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            ) as executor:
+                imputed = executor.map(impute_block, [tensor[idx] for idx in idxs])
+                for idx, block in zip(idxs, imputed, strict=True):
+                    tensor[idx] = block
+        else:
+            for i, idx in enumerate(idxs):
+                logger.debug(f"Imputing block {i + 1} of {len(idxs)}.")
+                tensor[idx] = impute_block(tensor[idx])
         return self.unfold_tensor(tensor)
 
     def summarize_imputed(self, imputed: np.ndarray, mask: np.ndarray) -> pd.DataFrame:
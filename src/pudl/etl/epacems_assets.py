@@ -20,6 +20,7 @@ from dagster import (
     AssetIn,
     DynamicOut,
     DynamicOutput,
+    Field,
     asset,
     graph_asset,
     op,
@@ -64,6 +65,25 @@ def get_years_from_settings(context):
 
 
 @op(
+    config_schema={
+        "streaming": Field(
+            bool,
+            default_value=False,
+            description=(
+                "If True, stream each quarter from the raw CSV through the transform "
+                "and into Parquet in bounded-size batches, instead of loading the "
+                "whole quarter into memory at once."
+            ),
+        ),
+        "block_size": Field(
+            int,
+            default_value=64 * 2**20,
+            description=(
+                "Approximate number of bytes of raw CSV to parse into each batch "
+                "when streaming."
+            ),
+        ),
+    },
     required_resource_keys={"datastore", "dataset_settings"},
     tags={"memory-use": "high"},
 )
@@ -84,6 +104,8 @@ def process_single_year(
     """
     ds = context.resources.datastore
     epacems_settings = context.resources.dataset_settings.epacems
+    streaming = context.op_config["streaming"]
+    block_size = context.op_config["block_size"]
 
     schema = Resource.from_id("core_epacems__hourly_emissions").to_pyarrow()
     partitioned_path = _partitioned_path()
@@ -96,13 +118,6 @@ def process_single_year(
 
     for year_quarter in year_quarters_in_year:
         logger.info(f"Processing EPA CEMS hourly data for {year_quarter}")
-        df = pudl.extract.epacems.extract(year_quarter=year_quarter, ds=ds)
-        if not df.empty:  # If state-year combination has data
-            df = pudl.transform.epacems.transform(
-                df, core_epa__assn_eia_epacamd, core_eia__entity_plants
-            )
-        table = pa.Table.from_pandas(df, schema=schema, preserve_index=False)
-
         # Write to a directory of partitioned parquet files
         with pq.ParquetWriter(
             where=partitioned_path / f"epacems-{year_quarter}.parquet",
@@ -110,7 +125,25 @@ def process_single_year(
             compression="snappy",
             version="2.6",
         ) as partitioned_writer:
-            partitioned_writer.write_table(table)
+            if streaming:
+                for df in pudl.extract.epacems.extract_batches(
+                    year_quarter=year_quarter, ds=ds, block_size=block_size
+                ):
+                    df = pudl.transform.epacems.transform(
+                        df, core_epa__assn_eia_epacamd, core_eia__entity_plants
+                    )
+                    partitioned_writer.write_table(
+                        pa.Table.from_pandas(df, schema=schema, preserve_index=False)
+                    )
+            else:
+                df = pudl.extract.epacems.extract(year_quarter=year_quarter, ds=ds)
+                if not df.empty:  # If state-year combination has data
+                    df = pudl.transform.epacems.transform(
+                        df, core_epa__assn_eia_epacamd, core_eia__entity_plants
+                    )
+                partitioned_writer.write_table(
+                    pa.Table.from_pandas(df, schema=schema, preserve_index=False)
+                )
 
     return YearPartitions(year_quarters_in_year)
 
@@ -599,16 +599,15 @@ class FercDbfExtractor:
             if len(new_df) <= 0:
                 continue
 
-            coltypes = {col.name: col.type for col in self.sqlite_meta.tables[table].c}
             logger.info(f"SQLite: loading {len(new_df)} rows into {table}.")
-            new_df.to_sql(
-                table,
-                self.sqlite_engine,
-                if_exists="append",
-                chunksize=100000,
-                dtype=coltypes,
-                index=False,
-            )
+            with (
+                self.sqlite_engine.connect() as con,
+                pudl.helpers.sqlite_pragmas(con),
+                con.begin(),
+            ):
+                pudl.helpers.bulk_insert_sqlite(
+                    con, self.sqlite_meta.tables[table], new_df
+                )
 
     def finalize_schema(self, meta: sa.MetaData) -> sa.MetaData:
         """This method is called just before the schema is written to sqlite.
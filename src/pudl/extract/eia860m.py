@@ -16,7 +16,7 @@ eia860_raw_dfs = pudl.extract.eia860m.append_eia860m(
 from datetime import datetime
 
 import pandas as pd
-from dagster import AssetOut, Output, asset, multi_asset
+from dagster import AssetOut, Field, Output, asset, multi_asset
 
 import pudl.logging_helpers
 from pudl.extract import excel
@@ -94,13 +94,20 @@ def append_eia860m(
 
 @asset(
     required_resource_keys={"datastore", "dataset_settings"},
+    config_schema={
+        "max_workers": Field(
+            int,
+            default_value=1,
+            description="Number of monthly spreadsheets to extract concurrently.",
+        ),
+    },
 )
 def raw_eia860m__all_dfs(context):
     """Extract raw EIA 860M data from excel sheets into dict of dataframes."""
     eia_settings = context.resources.dataset_settings.eia
     ds = context.resources.datastore
 
-    eia860m_extractor = Extractor(ds=ds)
+    eia860m_extractor = Extractor(ds=ds, max_workers=context.op_config["max_workers"])
     raw_eia860m__all_dfs = eia860m_extractor.extract(
         year_month=eia_settings.eia860m.year_months
     )
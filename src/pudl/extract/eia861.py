@@ -8,11 +8,10 @@ This code is for use analyzing EIA Form 861 data.
 import warnings
 
 import pandas as pd
-from dagster import AssetOut, Output, multi_asset
 
 import pudl.logging_helpers
 from pudl.extract import excel
-from pudl.extract.extractor import raw_df_factory
+from pudl.extract.extractor import raw_page_dfs_factory
 from pudl.helpers import remove_leading_zeros_from_numeric_strings
 
 logger = pudl.logging_helpers.get_logger(__name__)
@@ -73,55 +72,11 @@ class Extractor(excel.ExcelExtractor):
         }
 
 
-raw_eia861__all_dfs = raw_df_factory(Extractor, name="eia861")
-
-
-@multi_asset(
-    outs={
-        table_name: AssetOut()
-        for table_name in sorted(
-            (  # is there some way to programmatically generate this list?
-                "raw_eia861__advanced_metering_infrastructure",
-                "raw_eia861__balancing_authority",
-                "raw_eia861__delivery_companies",
-                "raw_eia861__demand_response",
-                "raw_eia861__demand_side_management",
-                "raw_eia861__distributed_generation",
-                "raw_eia861__distribution_systems",
-                "raw_eia861__dynamic_pricing",
-                "raw_eia861__energy_efficiency",
-                "raw_eia861__frame",
-                "raw_eia861__green_pricing",
-                "raw_eia861__mergers",
-                "raw_eia861__net_metering",
-                "raw_eia861__non_net_metering",
-                "raw_eia861__operational_data",
-                "raw_eia861__reliability",
-                "raw_eia861__sales",
-                "raw_eia861__service_territory",
-                "raw_eia861__short_form",
-                "raw_eia861__utility_data",
-            )
-        )
+raw_eia861_assets = raw_page_dfs_factory(
+    Extractor,
+    name="eia861",
+    asset_names={
+        page: "raw_eia861__" + page.removesuffix("_eia861")
+        for page in excel.ExcelMetadata("eia861").get_all_pages()
     },
-    required_resource_keys={"datastore", "dataset_settings"},
 )
-def extract_eia861(context, raw_eia861__all_dfs):
-    """Extract raw EIA-861 data from Excel sheets into dataframes.
-
-    Args:
-        context: dagster keyword that provides access to resources and config.
-
-    Returns:
-        A tuple of extracted EIA-861 dataframes.
-    """
-    raw_eia861__all_dfs = {
-        "raw_eia861__" + table_name.replace("_eia861", ""): df
-        for table_name, df in raw_eia861__all_dfs.items()
-    }
-    raw_eia861__all_dfs = dict(sorted(raw_eia861__all_dfs.items()))
-
-    return (
-        Output(output_name=table_name, value=df)
-        for table_name, df in raw_eia861__all_dfs.items()
-    )
@@ -1,10 +1,13 @@
 """Extract EIA Form 930 data from CSVs."""
 
 import pandas as pd
-from dagster import asset
 
 from pudl.extract.csv import CsvExtractor
-from pudl.extract.extractor import GenericMetadata, PartitionSelection, raw_df_factory
+from pudl.extract.extractor import (
+    GenericMetadata,
+    PartitionSelection,
+    raw_page_dfs_factory,
+)
 
 
 class Extractor(CsvExtractor):
@@ -47,28 +50,4 @@ class Extractor(CsvExtractor):
         return df.rename(columns=self.METADATA.get_column_map(page, **partition))
 
 
-def raw_eia930_asset_factory(page: str):
-    """Asset factory for individual raw EIA 930 dataframes."""
-
-    @asset(
-        name=f"raw_eia930__{page}",
-        op_tags={"memory-use": "high"},
-        compute_kind="pandas",
-    )
-    def _extract_raw_eia930(
-        raw_eia930__all_dfs: dict[str, pd.DataFrame],
-    ) -> pd.DataFrame:
-        """Select a specific EIA 930 dataframe from the extracted raw dataframes.
-
-        Returns:
-            An extracted EIA 930 dataframe.
-        """
-        return raw_eia930__all_dfs[page]
-
-    return _extract_raw_eia930
-
-
-raw_eia930__all_dfs = raw_df_factory(Extractor, name="eia930")
-raw_eia930_assets = [
-    raw_eia930_asset_factory(page) for page in ["balance", "interchange", "subregion"]
-]
+raw_eia930_assets = raw_page_dfs_factory(Extractor, name="eia930")
@@ -12,103 +12,145 @@ tables: one of metadata and one of timeseries. That is the format delivered by t
 module.
 """
 
+import json
+import re
 import warnings
+import zipfile
+from array import array
 from io import BytesIO
-from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
 from pudl.workspace.datastore import Datastore
 
+SERIES_TO_EXTRACT = ["RECEIPTS_BTU", "COST_BTU"]
+"""Codes of the data series to extract. Fuel receipts and costs are ~1% of the lines."""
 
-def _filter_for_fuel_receipts_costs_series(df: pd.DataFrame) -> pd.DataFrame:
-    """Pick out the desired data series.
+_SERIES_ID_PATTERN = re.compile(rf"^ELEC\.(?:{'|'.join(SERIES_TO_EXTRACT)})")
+_SERIES_LINE_PATTERN = re.compile(
+    rf'"series_id"\s*:\s*"ELEC\.(?:{"|".join(SERIES_TO_EXTRACT)})'.encode()
+)
 
-    Fuel receipts and costs are about 1% of the total lines. This function filters for
-    series that contain the name "RECEIPTS_BTU" or "COST_BTU" in their ``series_id``.
+
+def _is_fuel_receipts_costs_series(record: dict) -> bool:
+    """Check whether a parsed JSON object is one of the desired data series.
 
     Of the approximately 680,000 objects in the dataset, about 19,000 represent things
     other than data series (such as category definitions or plot axes). Those
     non-series objects do not have a field called ``series_id``.
-    The ``except KeyError:`` clause handles that situation.
     """
-    series_to_extract = ["RECEIPTS_BTU", "COST_BTU"]
-    series_pattern = "|".join(series_to_extract)
-    pattern = rf"^ELEC\.(?:{series_pattern})"
-    try:
-        _filter = df.loc[:, "series_id"].str.match(pattern, na=False)
-        return df.loc[_filter, :]
-    except KeyError:
-        return pd.DataFrame()  # empty
+    return bool(_SERIES_ID_PATTERN.match(record.get("series_id", "")))
 
 
-def _filter_and_read_to_dataframe(raw_zipfile: Path) -> pd.DataFrame:
-    """Decompress and filter the 1100 MB file down to the 16 MB we actually want.
+def _parse_dates(dates: pd.Series) -> pd.Series:
+    """Parse the dates of the timeseries points.
+
+    There are three possible date formats, only annual/quarterly handled by
+    pd.to_datetime() automatically:
+
+    * annual data as "YYYY" eg "2020"
+    * quarterly data as "YYYYQQ" eg "2020Q2"
+    * monthly data as "YYYYMM" eg "202004"
 
-    This produces a dataframe with all text fields. The timeseries data is left as JSON
-    strings in the 'data' column. The other columns are metadata.
+    Each format is parsed in one vectorized step for all of the series at once.
+    Anything else falls back on dateutil.
     """
-    filtered = []
-    # Use chunksize arg to reduce peak memory usage when reading in 1.1 GB file
-    # For reference, the file has ~680k lines and we want around 8.5k
-    with pd.read_json(
-        raw_zipfile, compression="zip", lines=True, chunksize=10_000
-    ) as reader:
-        for chunk in reader:
-            filtered.append(_filter_for_fuel_receipts_costs_series(chunk))
-    out = pd.concat(filtered, ignore_index=True)
-    return out
-
-
-def _parse_data_column(elec_df: pd.DataFrame) -> pd.DataFrame:
-    out = []
-    for idx in elec_df.index:
-        data_df = pd.DataFrame(elec_df.loc[idx, "data"], columns=["date", "value"])
-        # three possible date formats, only annual/quarterly handled by pd.to_datetime() automatically
-        #   annual data as "YYYY" eg "2020"
-        #   quarterly data as "YYYYQQ" eg "2020Q2"
-        #   monthly data as "YYYYMM" eg "202004"
-        is_monthly = (
-            data_df.iloc[0:5, data_df.columns.get_loc("date")].str.match(r"\d{6}").all()
-        )
+    parsed = pd.Series(pd.NaT, index=dates.index, dtype="datetime64[ns]")
+    monthly = dates.str.fullmatch(r"\d{6}")
+    annual = dates.str.fullmatch(r"\d{4}")
+    quarterly = dates.str.fullmatch(r"\d{4}Q[1-4]")
+    parsed[monthly] = pd.to_datetime(dates[monthly], format="%Y%m", errors="raise")
+    parsed[annual] = pd.to_datetime(dates[annual], format="%Y", errors="raise")
+    parsed[quarterly] = pd.to_datetime(
+        pd.DataFrame(
+            {
+                "year": dates[quarterly].str[:4].astype(int),
+                "month": dates[quarterly].str[5].astype(int) * 3 - 2,
+                "day": 1,
+            }
+        ),
+        errors="raise",
+    )
+    other = ~(monthly | annual | quarterly)
+    if other.any():
         # Unfortunately, the date formats in the EIA bulk electricity data are not
-        # uniform, and so for now we need to fall back on dateutil. Currently this
-        # warning is emitted thousands of times, clogging up the logs.
+        # uniform, and so for now we need to fall back on dateutil.
         with warnings.catch_warnings():
             warnings.filterwarnings(
                 action="ignore",
                 message="Could not infer format, so each element will be parsed individually",
                 category=UserWarning,
             )
-            if is_monthly:
-                data_df.loc[:, "date"] = pd.to_datetime(
-                    data_df.loc[:, "date"], format="%Y%m", errors="raise"
-                )
-            else:
-                data_df.loc[:, "date"] = pd.to_datetime(
-                    data_df.loc[:, "date"], errors="raise"
-                )
-        data_df["series_id"] = elec_df.loc[idx, "series_id"]
-        out.append(data_df)
-    out = pd.concat(out, ignore_index=True, axis=0)
-    out = out.convert_dtypes()
-    out.loc[:, "series_id"] = out.loc[:, "series_id"].astype("category", copy=False)
-    return out.loc[:, ["series_id", "date", "value"]]  # reorder cols
+            parsed[other] = pd.to_datetime(dates[other], errors="raise")
+    return parsed
+
+
+def _stream_fuel_receipts_costs_series(raw_zipfile) -> dict[str, pd.DataFrame]:
+    """Decompress and filter the 1100 MB file down to the 16 MB we actually want.
+
+    The file is read one line at a time. Only lines whose ``series_id`` matches one of
+    :data:`SERIES_TO_EXTRACT` are parsed as JSON. The timeseries points of those series
+    are appended directly to flat columns of dates and values, rather than being
+    collected into a dataframe per series.
+
+    Args:
+        raw_zipfile: Path or other file-like object containing a zipfile with a single
+            line-delimited JSON file.
+
+    Returns:
+        Dictionary of dataframes with keys 'metadata' and 'timeseries'
+    """
+    metadata = []
+    series_ids = []
+    n_points = []
+    dates = []
+    values = array("d")
+    with zipfile.ZipFile(raw_zipfile) as zf:
+        names = zf.namelist()
+        if len(names) != 1:
+            raise ValueError(f"Expected a single file in the zipfile, found {names}")
+        with zf.open(names[0]) as lines:
+            for line in lines:
+                if not _SERIES_LINE_PATTERN.search(line):
+                    continue
+                record = json.loads(line)
+                if not _is_fuel_receipts_costs_series(record):
+                    continue
+                data = record.pop("data")
+                metadata.append(record)
+                series_ids.append(record["series_id"])
+                n_points.append(len(data))
+                dates.extend(date for date, _ in data)
+                values.extend(np.nan if value is None else value for _, value in data)
+
+    categories, series_codes = np.unique(
+        np.array(series_ids, dtype=object), return_inverse=True
+    )
+    timeseries = pd.DataFrame(
+        {
+            "series_id": pd.Categorical.from_codes(
+                np.repeat(series_codes, n_points),
+                categories=pd.Index(categories, dtype="string"),
+            ),
+            "date": _parse_dates(pd.Series(dates, dtype=object)),
+            "value": np.frombuffer(values, dtype=np.float64),
+        }
+    )
+    timeseries = timeseries.convert_dtypes()
+    return {"metadata": pd.DataFrame(metadata), "timeseries": timeseries}
 
 
 def _extract(raw_zipfile) -> dict[str, pd.DataFrame]:
     """Extract metadata and timeseries from raw EIA bulk electricity data.
 
     Args:
-        raw_zipfile: Path or other file-like object that can be read by pd.read_json()
+        raw_zipfile: Path or other file-like object containing the zipped bulk data.
 
     Returns:
         Dictionary of dataframes with keys 'metadata' and 'timeseries'
     """
-    filtered = _filter_and_read_to_dataframe(raw_zipfile)
-    timeseries = _parse_data_column(filtered)
-    metadata = filtered.drop(columns="data")
-    return {"metadata": metadata, "timeseries": timeseries}
+    return _stream_fuel_receipts_costs_series(raw_zipfile)
 
 
 def extract(ds: Datastore) -> dict[str, pd.DataFrame]:
@@ -20,10 +20,15 @@ Hence, we've called it `plant_id_epa` until it gets transformed into `plant_id_e
 during the transform process with help from the crosswalk.
 """
 
+import csv
+import io
+from collections.abc import Iterator
 from pathlib import Path
-from typing import Annotated
+from typing import IO, Annotated
 
 import pandas as pd
+import pyarrow as pa
+from pyarrow import csv as pa_csv
 from pydantic import BaseModel, StringConstraints
 
 import pudl.logging_helpers
@@ -137,6 +142,15 @@ API_DTYPE_DICT = {
 }
 
 
+def _arrow_type(dtype: pd.api.extensions.ExtensionDtype) -> pa.DataType:
+    """Translate one of the pandas dtypes in :data:`API_DTYPE_DICT` to Arrow."""
+    if isinstance(dtype, pd.CategoricalDtype):
+        return pa.dictionary(pa.int32(), pa.string())
+    if isinstance(dtype, pd.StringDtype):
+        return pa.string()
+    return pa.from_numpy_dtype(dtype.numpy_dtype)
+
+
 class EpaCemsPartition(BaseModel):
     """Represents EpaCems partition identifying unique resource file."""
 
@@ -175,7 +189,7 @@ class EpaCemsDatastore:
     def get_data_frame(self, partition: EpaCemsPartition) -> pd.DataFrame:
         """Constructs dataframe from a zipfile for a given (year_quarter) partition."""
         with (
-            self.datastore.get_zipfile_resource(
+            self.datastore.open_zipfile_resource(
                 "epacems", **partition.get_filters()
             ) as zf,
             zf.open(str(partition.get_quarterly_file()), "r") as csv_file,
@@ -188,6 +202,92 @@ class EpaCemsDatastore:
             )
         return df
 
+    def get_data_frame_batches(
+        self, partition: EpaCemsPartition, block_size: int = 64 * 2**20
+    ) -> Iterator[pd.DataFrame]:
+        """Stream a (year_quarter) partition out of its zipfile in typed batches.
+
+        Unlike :meth:`get_data_frame` the whole quarter is never held in memory at
+        once. Each yielded dataframe has the same columns and dtypes that
+        :meth:`get_data_frame` would produce for the same rows.
+
+        Args:
+            partition: the year_quarter to extract.
+            block_size: approximate number of bytes of CSV to parse into each batch.
+
+        Raises:
+            KeyError: if there is no resource for the requested partition.
+        """
+        with self.datastore.open_zipfile_resource(
+            "epacems", **partition.get_filters()
+        ) as zf:
+            csv_name = str(partition.get_quarterly_file())
+            with zf.open(csv_name, "r") as csv_file:
+                header = self._read_csv_header(csv_file)
+            with zf.open(csv_name, "r") as csv_file:
+                yield from self._csv_to_dataframe_batches(
+                    csv_file,
+                    header=header,
+                    ignore_cols=API_IGNORE_COLS,
+                    rename_dict=API_RENAME_DICT,
+                    dtype_dict=API_DTYPE_DICT,
+                    block_size=block_size,
+                )
+
+    @staticmethod
+    def _read_csv_header(csv_file: IO[bytes]) -> list[str]:
+        """Read the column names from the first line of a CEMS CSV file."""
+        first_line = csv_file.readline().decode("utf-8-sig")
+        return next(csv.reader(io.StringIO(first_line)))
+
+    def _csv_to_dataframe_batches(
+        self,
+        csv_file: IO[bytes],
+        header: list[str],
+        ignore_cols: dict[str, str],
+        rename_dict: dict[str, str],
+        dtype_dict: dict[str, type],
+        block_size: int,
+    ) -> Iterator[pd.DataFrame]:
+        """Convert a CEMS csv file into a stream of :class:`pandas.DataFrame` batches.
+
+        The CSV is parsed by Arrow directly into typed record batches, so only one
+        block of raw text and one batch of typed columns is resident at a time.
+
+        Args:
+            csv_file: Open binary file handle to the CSV file.
+            header: The column names found in the CSV file.
+            ignore_cols: Columns to skip entirely while parsing.
+            rename_dict: Mapping from raw column names to PUDL column names.
+            dtype_dict: The pandas dtype to use for each raw column.
+            block_size: Approximate number of bytes of CSV parsed into each batch.
+
+        Yields:
+            Filtered, dtyped and renamed batches of the contents of the CSV file.
+        """
+        include_columns = [col for col in header if col not in ignore_cols]
+        reader = pa_csv.open_csv(
+            csv_file,
+            read_options=pa_csv.ReadOptions(block_size=block_size),
+            convert_options=pa_csv.ConvertOptions(
+                include_columns=include_columns,
+                column_types={
+                    col: _arrow_type(dtype_dict[col])
+                    for col in include_columns
+                    if col in dtype_dict
+                },
+                strings_can_be_null=True,
+            ),
+        )
+        dtypes = {k: v for k, v in dtype_dict.items() if k in include_columns}
+        for batch in reader:
+            yield (
+                pa.Table.from_batches([batch])
+                .to_pandas()
+                .astype(dtypes)
+                .rename(columns=rename_dict)
+            )
+
     def _csv_to_dataframe(
         self,
         csv_path: Path,
@@ -240,3 +340,38 @@ def extract(year_quarter: str, ds: Datastore) -> pd.DataFrame:
         res = Resource.from_id("core_epacems__hourly_emissions")
         df = res.format_df(pd.DataFrame())
     return df
+
+
+def extract_batches(
+    year_quarter: str, ds: Datastore, block_size: int = 64 * 2**20
+) -> Iterator[pd.DataFrame]:
+    """Stream the extraction of EPA CEMS hourly DataFrames in bounded-memory batches.
+
+    This is the streaming counterpart to :func:`extract`. The concatenation of all
+    batches is equivalent to the output of :func:`extract`, except that a missing
+    quarter yields no batches at all rather than a single empty dataframe.
+
+    Args:
+        year_quarter: report year and quarter of the data to extract
+        ds: Initialized datastore
+        block_size: approximate number of bytes of raw CSV to parse into each batch.
+
+    Yields:
+        Consecutive batches of a single quarter of EPA CEMS hourly emissions data.
+    """
+    ds = EpaCemsDatastore(ds)
+    partition = EpaCemsPartition(year_quarter=year_quarter)
+    year = partition.year
+    logger.info(f"Streaming data frame batches for {year_quarter}")
+    batches = ds.get_data_frame_batches(partition, block_size=block_size)
+    try:
+        first_batch = next(batches)
+    # If the requested quarter is not found, there is nothing to stream:
+    except KeyError:
+        logger.warning(f"No data found for {year_quarter}. Yielding no batches.")
+        return
+    except StopIteration:
+        return
+    yield first_batch.assign(year=year)
+    for batch in batches:
+        yield batch.assign(year=year)
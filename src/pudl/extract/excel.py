@@ -1,5 +1,7 @@
 """Load excel metadata CSV files form a python data package."""
 
+import hashlib
+import importlib.metadata
 import pathlib
 import re
 from io import BytesIO
@@ -90,6 +92,26 @@ class ExcelMetadata(GenericMetadata):
         return self._page_part_map.loc[page, "form"]
 
 
+class ExcelSheetCache(pudl.helpers.DataFrameFileCache):
+    """An on-disk cache of parsed Excel spreadsheets.
+
+    Parsing Excel files is one of the largest fixed costs of the ETL, and the archived
+    spreadsheets rarely change. Entries are keyed by the checksum of the archive that
+    contains the spreadsheet, the file and sheet names, the rows to skip and the
+    dtypes, so any change to the raw data or to how it is read results in a new entry.
+    Raw spreadsheets often contain columns of mixed types that Feather can't represent
+    exactly, which are stored as pickles instead.
+
+    The cache is used by all Excel extractors when the ``PUDL_EXCEL_CACHE`` environment
+    variable is set to the directory where the parsed sheets should be stored. Loading
+    the pickles can run arbitrary code, so that directory must only be writable by
+    users you trust.
+    """
+
+    ENV_VAR = "PUDL_EXCEL_CACHE"
+    ALLOW_PICKLE = True
+
+
 class ExcelExtractor(GenericExtractor):
     """Logic for extracting :class:`pd.DataFrame` from Excel spreadsheets.
 
@@ -127,15 +149,22 @@ class ExcelExtractor(GenericExtractor):
 
     METADATA: ExcelMetadata = None
 
-    def __init__(self, ds):
+    def __init__(self, ds, sheet_cache: ExcelSheetCache | None = None, **kwargs):
         """Create new extractor object and load metadata.
 
         Args:
             ds (datastore.Datastore): An initialized datastore, or subclass
+            sheet_cache: persistent cache of parsed spreadsheets. Defaults to
+                :meth:`ExcelSheetCache.from_env`.
+            kwargs: additional arguments for :class:`GenericExtractor`, e.g. to extract
+                partitions concurrently.
         """
-        super().__init__(ds)
+        super().__init__(ds, **kwargs)
         self._metadata = self.METADATA
         self._file_cache = {}
+        if sheet_cache is None:
+            sheet_cache = ExcelSheetCache.from_env()
+        self.sheet_cache = sheet_cache
 
     def process_raw(
         self, df: pd.DataFrame, page: str, **partition: PartitionSelection
@@ -199,6 +228,9 @@ class ExcelExtractor(GenericExtractor):
     def load_source(self, page: str, **partition: PartitionSelection) -> pd.DataFrame:
         """Produce the ExcelFile object for the given (partition, page).
 
+        If there is a :attr:`sheet_cache`, a previously parsed copy of the sheet is
+        returned when there is one, and newly parsed sheets are added to it.
+
         Args:
             page: pudl name for the dataset contents, eg "boiler_generator_assn" or
                 "coal_stocks",
@@ -210,7 +242,35 @@ class ExcelExtractor(GenericExtractor):
             pd.DataFrame instance with the parsed Excel spreadsheet frame
         """
         xlsx_filename = self.source_filename(page, **partition)
+        read_excel_kwargs = {
+            "sheet_name": self._metadata.get_sheet_name(page, **partition),
+            "skiprows": self._metadata.get_skiprows(page, **partition),
+            "skipfooter": self._metadata.get_skipfooter(page, **partition),
+            "dtype": self.get_dtypes(page, **partition),
+        }
+
+        cache_key = None
+        if self.sheet_cache is not None:
+            cache_key = self._sheet_cache_key(
+                xlsx_filename, read_excel_kwargs, page, **partition
+            )
+            df = self.sheet_cache.get(cache_key)
+            if df is not None:
+                logger.debug(f"Loaded {page} from cached sheet {cache_key}")
+                return df
+
+        df = pd.read_excel(
+            self._get_excel_file(xlsx_filename, page, **partition),
+            **read_excel_kwargs,
+        )
+        if cache_key is not None:
+            self.sheet_cache.put(cache_key, df)
+        return df
 
+    def _get_excel_file(
+        self, xlsx_filename: str, page: str, **partition: PartitionSelection
+    ) -> pd.ExcelFile:
+        """Open the ExcelFile for the given (partition, page), reusing open files."""
         if xlsx_filename not in self._file_cache:
             excel_file = None
             with self.ds.get_zipfile_resource(
@@ -233,15 +293,37 @@ class ExcelExtractor(GenericExtractor):
                     )
             self._file_cache[xlsx_filename] = excel_file
         # TODO(rousik): this _file_cache could be replaced with @cache or @memoize annotations
-        excel_file = self._file_cache[xlsx_filename]
-
-        return pd.read_excel(
-            excel_file,
-            sheet_name=self._metadata.get_sheet_name(page, **partition),
-            skiprows=self._metadata.get_skiprows(page, **partition),
-            skipfooter=self._metadata.get_skipfooter(page, **partition),
-            dtype=self.get_dtypes(page, **partition),
+        return self._file_cache[xlsx_filename]
+
+    def _sheet_cache_key(
+        self,
+        xlsx_filename: str,
+        read_excel_kwargs: dict,
+        page: str,
+        **partition: PartitionSelection,
+    ) -> str:
+        """Identify a parsed sheet by everything that determines its contents.
+
+        The checksum of the archive comes from the datapackage descriptor, so cached
+        sheets can be found without retrieving the archive at all.
+        """
+        checksum = self.ds.get_unique_resource_checksum(
+            self._dataset_name, **self.zipfile_resource_partitions(page, **partition)
         )
+        key_parts = [
+            checksum,
+            xlsx_filename,
+            str(read_excel_kwargs["sheet_name"]),
+            str(read_excel_kwargs["skiprows"]),
+            str(read_excel_kwargs["skipfooter"]),
+            repr(
+                sorted((str(k), str(v)) for k, v in read_excel_kwargs["dtype"].items())
+            ),
+            pd.__version__,
+            importlib.metadata.version("python-calamine"),
+        ]
+        digest = hashlib.sha256("\x1f".join(key_parts).encode()).hexdigest()
+        return f"{self._dataset_name}__{digest[:32]}"
 
     def source_filename(self, page: str, **partition: PartitionSelection) -> str:
         """Produce the xlsx document file name as it will appear in the archive.
@@ -1,20 +1,27 @@
 """Generic functionality for extractors."""
 
+import copy
 import importlib.resources
+import itertools
 from abc import ABC, abstractmethod
 from collections import defaultdict
-from typing import Any
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Literal
 
 import pandas as pd
 from dagster import (
+    AssetOut,
     AssetsDefinition,
     DagsterType,
     DynamicOut,
     DynamicOutput,
     In,
     OpDefinition,
+    Out,
+    Output,
     TypeCheckContext,
     graph_asset,
+    graph_multi_asset,
     op,
 )
 
@@ -111,11 +118,21 @@ class GenericExtractor(ABC):
     BLACKLISTED_PAGES = []
     """List of supported pages that should not be extracted."""
 
-    def __init__(self, ds):
+    def __init__(
+        self,
+        ds,
+        max_workers: int = 1,
+        executor: Literal["thread", "process"] = "thread",
+    ):
         """Create new extractor object and load metadata.
 
         Args:
             ds (datastore.Datastore): An initialized datastore, or subclass
+            max_workers: the number of partitions to extract concurrently. If 1, all
+                partitions are extracted one after another in the calling thread.
+            executor: whether to extract partitions concurrently in a pool of threads
+                or of processes. With processes, the extractor and its datastore must
+                be picklable.
         """
         if not self.METADATA:
             raise NotImplementedError("self.METADATA must be set.")
@@ -123,6 +140,8 @@ class GenericExtractor(ABC):
         self._dataset_name = self._metadata.get_dataset_name()
         self.ds = ds
         self.cols_added: list[str] = []
+        self.max_workers = max_workers
+        self.executor = executor
 
     @abstractmethod
     def source_filename(self, page: str, **partition: PartitionSelection) -> str:
@@ -203,23 +222,75 @@ class GenericExtractor(ABC):
 
     def combine(self, dfs: list[pd.DataFrame], page: str) -> pd.DataFrame:
         """Concatenate dataframes into one, take any special steps for processing final page."""
-        df = pd.concat(dfs, sort=True, ignore_index=True)
+        df = pd.concat(dfs, sort=True, ignore_index=True) if dfs else pd.DataFrame()
 
         # After all years are loaded, add empty columns that could appear
-        # in other years so that df matches the database schema
-        missing_cols = list(
-            set(self._metadata.get_all_columns(page)).difference(df.columns)
-        )
-        df = pd.concat([df, pd.DataFrame(columns=missing_cols)], sort=True)
+        # in other years so that df matches the database schema. The columns and
+        # dtypes are those of concatenating the data with an empty dataframe of the
+        # missing columns, which is worked out on empty frames rather than the data.
+        missing_cols = [
+            col for col in self._metadata.get_all_columns(page) if col not in df.columns
+        ]
+        dtypes = pd.concat(
+            [df.iloc[:0], pd.DataFrame(columns=missing_cols)], sort=True
+        ).dtypes
+        df = df.reindex(columns=dtypes.index).astype(dtypes.to_dict())
 
         return self.process_final_page(df, page)
 
+    def extract_partition(
+        self, pages: list[str], **partition: PartitionSelection
+    ) -> dict[str, pd.DataFrame]:
+        """Extract the given pages of a single partition.
+
+        Args:
+            pages: the pages to extract.
+            partition: the partition to extract. Examples:
+                {'year': 2009}
+                {'year_month': '2020-08'}
+
+        Returns:
+            A dictionary of the processed dataframes for each page that exists in the
+            partition.
+        """
+        page_dfs = {}
+        for page in pages:
+            # we are going to skip
+            if self.source_filename(page, **partition) == "-1":
+                logger.debug(f"No page for {self._dataset_name} {page} {partition}")
+                continue
+            logger.debug(
+                f"Loading dataframe for {self._dataset_name} {page} {partition}"
+            )
+            df = self.load_source(page, **partition)
+            df = pudl.helpers.simplify_columns(df)
+            df = self.process_raw(df, page, **partition)
+            df = self.process_renamed(df, page, **partition)
+            self.validate(df, page, **partition)
+            page_dfs[page] = df
+        return page_dfs
+
+    def _extract_partition_copy(
+        self, pages: list[str], partition: dict[str, PartitionSelection]
+    ) -> dict[str, pd.DataFrame]:
+        """Extract a partition with a shallow copy of this extractor.
+
+        Extracting a partition updates the extractor's state (e.g. ``cols_added``), so
+        partitions that are extracted concurrently each get their own copy.
+        """
+        extractor = copy.copy(self)
+        extractor.cols_added = list(self.cols_added)
+        return extractor.extract_partition(pages, **partition)
+
     def extract(self, **partitions: PartitionSelection) -> dict[str, pd.DataFrame]:
         """Extracts dataframes.
 
         Returns dict where keys are page names and values are
         DataFrames containing data across given years.
 
+        If :attr:`max_workers` is greater than 1, partitions are extracted concurrently
+        in a pool of threads or processes, depending on :attr:`executor`.
+
         Args:
             partitions: keyword argument dictionary specifying how the source is partitioned and which
                 particular partitions to extract. Examples:
@@ -236,29 +307,38 @@ class GenericExtractor(ABC):
             return all_page_dfs
         logger.info(f"Extracting {self._dataset_name} spreadsheet data.")
 
+        pages = []
         for page in self._metadata.get_all_pages():
             if page in self.BLACKLISTED_PAGES:
                 logger.debug(f"Skipping blacklisted page {page}.")
                 continue
-            current_page_dfs = [
-                pd.DataFrame(),
-            ]
-            for partition in pudl.helpers.iterate_multivalue_dict(**partitions):
-                # we are going to skip
-                if self.source_filename(page, **partition) == "-1":
-                    logger.debug(f"No page for {self._dataset_name} {page} {partition}")
-                    continue
-                logger.debug(
-                    f"Loading dataframe for {self._dataset_name} {page} {partition}"
+            pages.append(page)
+        partition_list = list(pudl.helpers.iterate_multivalue_dict(**partitions))
+
+        if self.max_workers > 1 and len(partition_list) > 1:
+            executor_cls = (
+                ProcessPoolExecutor
+                if self.executor == "process"
+                else ThreadPoolExecutor
+            )
+            with executor_cls(max_workers=self.max_workers) as executor:
+                partition_dfs = list(
+                    executor.map(
+                        self._extract_partition_copy,
+                        itertools.repeat(pages),
+                        partition_list,
+                    )
                 )
-                df = self.load_source(page, **partition)
-                df = pudl.helpers.simplify_columns(df)
-                df = self.process_raw(df, page, **partition)
-                df = self.process_renamed(df, page, **partition)
-                self.validate(df, page, **partition)
-                current_page_dfs.append(df)
-
-            all_page_dfs[page] = self.combine(current_page_dfs, page)
+        else:
+            partition_dfs = [
+                self.extract_partition(pages, **partition)
+                for partition in partition_list
+            ]
+
+        for page in pages:
+            all_page_dfs[page] = self.combine(
+                [dfs[page] for dfs in partition_dfs if page in dfs], page
+            )
         return all_page_dfs
 
 
@@ -434,3 +514,107 @@ def raw_df_factory(
         return concat_pages(dfs.collect())
 
     return graph_asset(name=f"raw_{name}__all_dfs")(raw_dfs)
+
+
+def partition_page_extractor_factory(
+    extractor_cls: type[GenericExtractor], name: str, pages: list[str]
+) -> OpDefinition:
+    """Construct a Dagster op that extracts one partition of data, with one output per page.
+
+    Unlike the op built by :func:`partition_extractor_factory`, each page is a separate
+    output, which is stored and loaded independently of the others.
+
+    Args:
+        extractor_cls: Class of type :class:`Extractor` used to extract the data.
+        name: Name of an Excel based dataset (e.g. "eia860").
+        pages: The pages to extract. Each one becomes an output of the op.
+    """
+
+    @op(
+        required_resource_keys={"datastore", "dataset_settings"},
+        name=f"extract_single_{name}_partition_pages",
+        ins={"part_dict": In(dagster_type=dagster_dict_str_strint)},
+        out={page: Out(pd.DataFrame) for page in pages},
+    )
+    def extract_single_partition_pages(context, part_dict: dict[str, str | int]):
+        """Extract one partition of spreadsheet data, yielding each page separately.
+
+        Args:
+            context: Dagster keyword that provides access to resources and config.
+            part_dict: Dictionary of partition name and partition to extract.
+
+        Yields:
+            One output per page, containing the DataFrame extracted for that page.
+        """
+        ds = context.resources.datastore
+        page_dfs = extractor_cls(ds).extract(**part_dict)
+        for page in pages:
+            yield Output(page_dfs.pop(page), output_name=page)
+
+    return extract_single_partition_pages
+
+
+def concat_page_factory(name: str, page: str) -> OpDefinition:
+    """Construct a Dagster op that concatenates one page of data from all partitions.
+
+    Like :func:`concat_pages`, the op is tagged with a high memory-use tag, since
+    concatenating the pages of the large EIA930 dataset is memory-intensive.
+
+    Args:
+        name: Name of a CSV or Excel based dataset (e.g. "eia930").
+        page: Name of the page being concatenated.
+    """
+
+    @op(name=f"concat_{name}_{page}", tags={"memory-use": "high"})
+    def concat_page(page_dfs: list[pd.DataFrame]) -> pd.DataFrame:
+        """Concatenate the same page of data from different partitions."""
+        return pd.concat(page_dfs).reset_index(drop=True)
+
+    return concat_page
+
+
+def raw_page_dfs_factory(
+    extractor_cls: type[GenericExtractor],
+    name: str,
+    asset_names: dict[str, str] | None = None,
+) -> AssetsDefinition:
+    """Return a dagster graph asset that extracts each page into its own raw asset.
+
+    Like :func:`raw_df_factory`, every partition of the dataset is extracted in
+    parallel. However, rather than collecting all of the pages into a single dictionary
+    of dataframes, which then has to be loaded in its entirety by every downstream
+    asset, each page is concatenated and stored as a separate asset. This keeps the
+    memory required by any one step down to a single page of data.
+
+    Args:
+        extractor_cls: The dataset-specific CSV or Excel extractor used to extract the
+            data. Must correspond to the dataset identified by ``name``.
+        name: Name of a CSV or Excel based dataset (e.g. "eia861" or "eia930").
+        asset_names: A mapping of page names to the names of the assets they should be
+            stored in. By default all pages that aren't blacklisted by the extractor
+            are extracted into assets named ``raw_{name}__{page}``.
+    """
+    if asset_names is None:
+        asset_names = {
+            page: f"raw_{name}__{page}"
+            for page in GenericMetadata(name).get_all_pages()
+            if page not in extractor_cls.BLACKLISTED_PAGES
+        }
+    pages = list(asset_names)
+    partition_extractor = partition_page_extractor_factory(extractor_cls, name, pages)
+    partitions_from_settings = partitions_from_settings_factory(name)
+    concat_ops = {page: concat_page_factory(name, page) for page in pages}
+
+    def raw_page_dfs():
+        """Extract each partition, then concatenate each page across partitions."""
+        partitions = partitions_from_settings()
+        page_dfs = dict(zip(pages, partitions.map(partition_extractor), strict=True))
+        return {
+            asset_names[page]: concat_ops[page](page_dfs[page].collect())
+            for page in pages
+        }
+
+    return graph_multi_asset(
+        name=f"raw_{name}__page_dfs",
+        outs={asset_name: AssetOut() for asset_name in asset_names.values()},
+    )(raw_page_dfs)
@@ -10,19 +10,24 @@ with cleaning and restructing dataframes.
 import importlib.resources
 import itertools
 import json
+import os
 import pathlib
+import pickle
 import re
 import shutil
 from collections import defaultdict
-from collections.abc import Generator, Iterable
+from collections.abc import Callable, Generator, Iterable
+from contextlib import contextmanager
 from functools import partial
 from io import BytesIO
-from typing import Any, Literal, NamedTuple
+from typing import Any, Literal, NamedTuple, Self
 
 import addfips
 import datasette
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.feather
 import requests
 import sqlalchemy as sa
 import yaml
@@ -1084,6 +1089,313 @@ def drop_tables(engine: sa.Engine, clobber: bool = False) -> None:
         conn.exec_driver_sql("VACUUM")
 
 
+SQLITE_BULK_LOAD_PRAGMAS: dict[str, str | int] = {
+    "synchronous": "OFF",
+    "temp_store": "MEMORY",
+    "cache_size": -512_000,
+}
+"""SQLite PRAGMA settings that speed up loading large amounts of data.
+
+A negative ``cache_size`` is measured in KiB, so the page cache may grow to 500 MiB.
+"""
+
+
+@contextmanager
+def sqlite_pragmas(
+    con: sa.Connection, pragmas: dict[str, str | int] = SQLITE_BULK_LOAD_PRAGMAS
+) -> Generator[sa.Connection, None, None]:
+    """Temporarily apply PRAGMA settings to a SQLite connection.
+
+    The original values of the PRAGMAs are restored on exit. Any transaction that
+    is started within the context should be completed before it exits.
+
+    Args:
+        con: A SQLAlchemy connection to a SQLite database. It must not be in the
+            middle of a transaction, since some PRAGMAs can't be changed in one.
+        pragmas: Mapping of PRAGMA names to the values to use within the context.
+
+    Yields:
+        The same connection, with the PRAGMAs applied.
+    """
+    original = {
+        name: con.exec_driver_sql(f"PRAGMA {name}").scalar() for name in pragmas
+    }
+    for name, value in pragmas.items():
+        con.exec_driver_sql(f"PRAGMA {name} = {value}")
+    con.commit()
+    try:
+        yield con
+    finally:
+        if con.in_transaction():
+            con.rollback()
+        for name, value in original.items():
+            con.exec_driver_sql(f"PRAGMA {name} = {value}")
+        con.commit()
+
+
+def _sqlite_column_values(
+    series: pd.Series, sa_type: Any, dialect: sa.Dialect
+) -> list[Any]:
+    """Convert a column into a list of Python values that SQLite can store.
+
+    Missing values become None. Dates and datetimes are serialized the same way
+    SQLAlchemy would serialize them, so that they can be read back by SQLAlchemy.
+    """
+    temporal = isinstance(sa_type, sa.Date | sa.DateTime | sa.Time)
+    process = (
+        sa_type.dialect_impl(dialect).bind_processor(dialect) if temporal else None
+    )
+    if process is not None and pd.api.types.is_datetime64_any_dtype(series):
+        # Timestamps repeat a lot (e.g. hourly data), so only serialize unique values
+        # using the column's own storage format.
+        codes, uniques = pd.factorize(series)
+        py_uniques = uniques.to_pydatetime()
+        if isinstance(sa_type, sa.Date):
+            py_uniques = [value.date() for value in py_uniques]
+        lookup = [process(value) for value in py_uniques] + [None]
+        return [lookup[code] for code in codes]
+    try:
+        values = pa.array(series, from_pandas=True).to_pylist()
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        # Mixed-type object columns can't be converted to Arrow.
+        values = series.astype(object).where(series.notna(), None).tolist()
+    if process is not None:
+        # e.g. columns of datetime.date objects
+        values = [process(value) for value in values]
+    return values
+
+
+def bulk_insert_sqlite(
+    con: sa.Connection,
+    table: sa.Table,
+    df: pd.DataFrame,
+    chunksize: int = 100_000,
+) -> None:
+    """Insert the contents of a dataframe into an existing SQLite table.
+
+    This is a much faster alternative to :meth:`pandas.DataFrame.to_sql`. Rather than
+    having SQLAlchemy construct and process every row of each insert, columns are
+    converted to Python values in bulk using Arrow, and the rows are handed directly to
+    the SQLite driver's ``executemany``. Like ``to_sql`` the columns of the dataframe
+    are inserted, so the table must have a column with each of their names.
+
+    Combine with :func:`sqlite_pragmas` and perform the entire insert within a single
+    transaction for best performance.
+
+    Args:
+        con: A SQLAlchemy connection to the SQLite database containing the table.
+        table: The table to insert records into.
+        df: The records to insert.
+        chunksize: The number of rows to convert and insert at a time.
+    """
+    if df.empty:
+        return
+    columns = list(df.columns)
+    quoted_columns = ", ".join(f'"{col}"' for col in columns)
+    placeholders = ", ".join(["?"] * len(columns))
+    stmt = f'INSERT INTO "{table.name}" ({quoted_columns}) VALUES ({placeholders})'  # noqa: S608
+    sa_types = {col.name: col.type for col in table.columns}
+    for start in range(0, len(df), chunksize):
+        chunk = df.iloc[start : start + chunksize]
+        values = [
+            _sqlite_column_values(chunk[col], sa_types.get(col), con.dialect)
+            for col in columns
+        ]
+        con.exec_driver_sql(stmt, list(zip(*values, strict=True)))
+
+
+def _round_trips(df: pd.DataFrame, reread: pd.DataFrame) -> bool:
+    """Check whether a dataframe read back from a file is identical to the original.
+
+    :meth:`pandas.DataFrame.equals` treats NaN and None as equal, so the types of the
+    values in object columns are compared as well.
+    """
+    if not (reread.dtypes.equals(df.dtypes) and reread.equals(df)):
+        return False
+    return all(
+        np.array_equal(
+            df.iloc[:, i].map(type).to_numpy(), reread.iloc[:, i].map(type).to_numpy()
+        )
+        for i, dtype in enumerate(df.dtypes)
+        if pd.api.types.is_object_dtype(dtype)
+    )
+
+
+def _read_feather(path: pathlib.Path) -> pd.DataFrame:
+    return pa.feather.read_table(path).to_pandas()
+
+
+def _write_feather(df: pd.DataFrame, path: pathlib.Path) -> None:
+    pa.feather.write_feather(pa.Table.from_pandas(df), path)
+    if not _round_trips(df, _read_feather(path)):
+        raise ValueError("Feather doesn't round-trip the dataframe exactly.")
+
+
+def _read_pickle(path: pathlib.Path) -> Any:
+    with path.open("rb") as pickle_file:
+        return pickle.load(pickle_file)  # noqa: S301
+
+
+def _write_pickle(obj: Any, path: pathlib.Path) -> None:
+    with path.open("wb") as pickle_file:
+        pickle.dump(obj, pickle_file, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _read_json(path: pathlib.Path) -> Any:
+    with path.open() as json_file:
+        return json.load(json_file)
+
+
+def _write_json(obj: Any, path: pathlib.Path) -> None:
+    path.write_text(json.dumps(obj))
+
+
+class CacheEntryFormat(NamedTuple):
+    """How the entries of a :class:`DataFrameFileCache` with one suffix are stored."""
+
+    read: Callable[[pathlib.Path], Any]
+    """Read an entry from a file."""
+    write: Callable[[Any, pathlib.Path], None]
+    """Write an entry to a file, raising an exception if it can't be stored."""
+    errors: tuple[type[Exception], ...]
+    """Exceptions that mean a file is unreadable, and should be discarded."""
+
+
+class DataFrameFileCache:
+    """A size-bounded on-disk cache of dataframes and other objects.
+
+    Dataframes are stored as Feather files. Arrow doesn't round-trip all object
+    columns exactly, e.g. ``datetime`` objects come back as ``datetime64`` values and
+    NaN in a column of strings comes back as None, so each file is read back when it
+    is stored, and only kept if the dataframe is unchanged. Subclasses set
+    :attr:`ENV_VAR` to the environment variable that names the cache directory, and
+    :attr:`ALLOW_PICKLE` to store dataframes Feather can't represent exactly as pickles
+    rather than skipping them.
+
+    Subclasses can also store other objects, in any of the :attr:`FORMATS`, with
+    :meth:`get_entry` and :meth:`put_entry`. Whenever the total size of all the entries
+    exceeds ``max_bytes`` the least recently used ones are deleted.
+
+    Loading a pickle can run arbitrary code, so when pickles are used the cache
+    directory must only be writable by users you trust.
+    """
+
+    ENV_VAR: str | None = None
+    ALLOW_PICKLE: bool = False
+    FORMATS: dict[str, CacheEntryFormat] = {
+        ".feather": CacheEntryFormat(
+            _read_feather, _write_feather, (OSError, pa.ArrowException)
+        ),
+        # Unpickling can fail in many ways, e.g. after a library upgrade.
+        ".pkl": CacheEntryFormat(_read_pickle, _write_pickle, (Exception,)),
+        ".json": CacheEntryFormat(
+            _read_json, _write_json, (OSError, json.JSONDecodeError)
+        ),
+    }
+    """The formats of the entries, by file suffix."""
+
+    def __init__(self, path: pathlib.Path, max_bytes: int = 20 * 2**30):
+        """Create a cache, making its directory if necessary.
+
+        Args:
+            path: directory in which the cached entries are stored.
+            max_bytes: the maximum total size of all entries in the cache.
+        """
+        self.path = pathlib.Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+
+    @classmethod
+    def from_env(cls) -> Self | None:
+        """Create a cache in the directory named by :attr:`ENV_VAR`, if it is set."""
+        path = os.environ.get(cls.ENV_VAR) if cls.ENV_VAR else None
+        return cls(pathlib.Path(path)) if path else None
+
+    def _entry_path(self, key: str, suffix: str = ".feather") -> pathlib.Path:
+        return self.path / f"{key}{suffix}"
+
+    def get_entry(self, key: str, suffix: str) -> Any | None:
+        """Return the entry stored under ``key`` in the format for ``suffix``.
+
+        Returns:
+            The entry, or None if there isn't one. Unreadable entries are deleted.
+        """
+        path = self._entry_path(key, suffix)
+        entry_format = self.FORMATS[suffix]
+        try:
+            entry = entry_format.read(path)
+        except FileNotFoundError:
+            return None
+        except entry_format.errors as err:
+            logger.warning(f"Discarding unreadable cache entry {path}: {err}")
+            path.unlink(missing_ok=True)
+            return None
+        # Mark the entry as recently used.
+        os.utime(path)
+        return entry
+
+    def put_entry(self, key: str, entry: Any, suffix: str) -> None:
+        """Store an entry under ``key`` in the format for ``suffix``.
+
+        The entry is written to a temporary file first, so that concurrent readers
+        never see a partial entry. Any exception raised while writing it is propagated,
+        and nothing is stored.
+        """
+        path = self._entry_path(key, suffix)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            self.FORMATS[suffix].write(entry, tmp_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        tmp_path.replace(path)
+        self._evict()
+
+    def get(self, key: str) -> pd.DataFrame | None:
+        """Return the dataframe stored under ``key``, or None if there isn't one."""
+        suffixes = [".feather", ".pkl"] if self.ALLOW_PICKLE else [".feather"]
+        for suffix in suffixes:
+            df = self.get_entry(key, suffix)
+            if df is not None:
+                return df
+        return None
+
+    def put(self, key: str, df: pd.DataFrame) -> bool:
+        """Store a dataframe under ``key``.
+
+        Returns:
+            Whether the dataframe could be stored. Unless :attr:`ALLOW_PICKLE` is set,
+            dataframes that Feather can't represent exactly, e.g. object columns of
+            mixed types, are not cached.
+        """
+        try:
+            self.put_entry(key, df, ".feather")
+        except (pa.ArrowException, TypeError, ValueError) as err:
+            if not self.ALLOW_PICKLE:
+                logger.warning(f"Could not cache {key}: {err}")
+                return False
+            self.put_entry(key, df, ".pkl")
+        return True
+
+    def _evict(self) -> None:
+        """Delete the least recently used entries until the cache fits in its budget."""
+        entries = []
+        for path in self.path.iterdir():
+            if path.suffix not in self.FORMATS:
+                continue
+            try:
+                entries.append((path, path.stat()))
+            except FileNotFoundError:
+                continue
+        entries.sort(key=lambda entry: entry[1].st_mtime, reverse=True)
+        total_bytes = 0
+        for path, stat in entries:
+            total_bytes += stat.st_size
+            if total_bytes > self.max_bytes:
+                logger.debug(f"Evicting cache entry {path}")
+                path.unlink(missing_ok=True)
+
+
 def merge_dicts(lods: list[dict[Any, Any]]) -> dict[Any, Any]:
     """Merge multipe dictionaries together.
 
@@ -1,14 +1,18 @@
 """Dagster IO Managers."""
 
 import json
+import operator
 import re
+from collections.abc import Callable, Sequence
 from pathlib import Path
 from sqlite3 import sqlite_version
 from typing import Any
 
 import dask.dataframe as dd
+import numpy as np
 import pandas as pd
 import pyarrow as pa
+import pyarrow.compute as pc
 import pyarrow.parquet as pq
 import sqlalchemy as sa
 from alembic.autogenerate.api import compare_metadata
@@ -42,6 +46,62 @@ def get_table_name_from_context(context: OutputContext) -> str:
     return context.get_identifier()
 
 
+_SQL_FILTER_OPERATORS: dict[str, Callable[[sa.ColumnClause, Any], Any]] = {
+    "=": operator.eq,
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "in": lambda col, value: col.in_(value),
+    "not in": lambda col, value: col.not_in(value),
+}
+"""SQLAlchemy implementations of the row filter operators used by pyarrow."""
+
+_SQLITE_ARROW_PANDAS_TYPES: dict[pa.DataType, Any] = {
+    pa.bool_(): pd.BooleanDtype(),
+    pa.int64(): pd.Int64Dtype(),
+    pa.string(): pd.StringDtype(),
+}
+"""Nullable pandas dtypes to use when converting Arrow tables read from SQLite."""
+
+
+def _sql_filter_clause(col: sa.ColumnClause, op: str, value: Any) -> Any:
+    """Build a SQL WHERE clause from a pyarrow style ``(column, op, value)`` filter."""
+    try:
+        return _SQL_FILTER_OPERATORS[op](col, value)
+    except KeyError as err:
+        raise ValueError(
+            f"Unsupported filter operator {op!r} for column {col.name}. Must be one "
+            f"of {list(_SQL_FILTER_OPERATORS)}."
+        ) from err
+
+
+def _widen_sqlite_arrow_field(field: pa.Field) -> pa.Field:
+    """Widen an Arrow field so it can hold any value SQLite stores in that column."""
+    if pa.types.is_integer(field.type):
+        return field.with_type(pa.int64())
+    if pa.types.is_floating(field.type):
+        return field.with_type(pa.float64())
+    if pa.types.is_timestamp(field.type):
+        return field.with_type(pa.timestamp("us"))
+    return field
+
+
+def _sqlite_values_to_arrow(values: Sequence[Any], pa_type: pa.DataType) -> pa.Array:
+    """Convert the raw values of one column returned by SQLite into an Arrow array."""
+    if pa.types.is_dictionary(pa_type):
+        return pa.array(values, type=pa.string()).dictionary_encode()
+    if pa.types.is_date(pa_type) or pa.types.is_timestamp(pa_type):
+        # SQLite stores dates and datetimes as ISO 8601 strings.
+        return pa.array(values, type=pa.string()).cast(pa_type)
+    if pa.types.is_boolean(pa_type):
+        # ...and booleans as 0 or 1.
+        return pa.array(values, type=pa.int64()).cast(pa_type)
+    return pa.array(values, type=pa_type)
+
+
 class PudlMixedFormatIOManager(IOManager):
     """Format switching IOManager that supports sqlite and parquet.
 
@@ -320,7 +380,16 @@ class SQLiteIOManager(IOManager):
 
 
 class PudlParquetIOManager(IOManager):
-    """IOManager that writes pudl tables to pyarrow parquet files."""
+    """IOManager that writes pudl tables to pyarrow parquet files.
+
+    Tables with a date or report year in their primary key are sorted by that column
+    and written with a separate row group for each year, so that the row group
+    statistics allow filtered reads to skip most of the file.
+
+    Like :class:`PudlSQLiteIOManager`, consumers can read a subset of a table by
+    passing ``columns`` and ``filters`` through the metadata of their asset input.
+    The filters are pushed down to :func:`pyarrow.parquet.read_table`.
+    """
 
     def handle_output(self, context: OutputContext, df: Any) -> None:
         """Writes pudl dataframe to parquet file."""
@@ -328,27 +397,66 @@ class PudlParquetIOManager(IOManager):
         table_name = get_table_name_from_context(context)
         parquet_path = PudlPaths().parquet_path(table_name)
         parquet_path.parent.mkdir(parents=True, exist_ok=True)
-        res = Resource.from_id(table_name)
+        res = Package.from_resource_ids().get_resource(table_name)
 
         df = res.enforce_schema(df)
         schema = res.to_pyarrow()
+        table = pa.Table.from_pandas(df, schema=schema, preserve_index=False)
         with pq.ParquetWriter(
             where=parquet_path,
             schema=schema,
             compression="snappy",
             version="2.6",
         ) as writer:
-            writer.write_table(
-                pa.Table.from_pandas(df, schema=schema, preserve_index=False)
-            )
+            for row_group in self._split_row_groups(res, table):
+                writer.write_table(row_group)
+
+    @staticmethod
+    def _split_row_groups(res: Resource, table: pa.Table) -> list[pa.Table]:
+        """Sort a table by its primary key date column and split it up by year.
+
+        Tables without a date or report year in their primary key are returned as is.
+        """
+        fields = {field.name: field for field in res.schema.fields}
+        date_cols = [
+            col
+            for col in res.schema.primary_key or []
+            if fields[col].type in ("date", "datetime") or col == "report_year"
+        ]
+        if not date_cols or table.num_rows == 0:
+            return [table]
+        date_col = date_cols[0]
+        table = table.sort_by(date_col)
+        years = table[date_col]
+        if fields[date_col].type in ("date", "datetime"):
+            years = pc.year(years)
+        # Because the table is sorted, each year's rows are contiguous, and a new year
+        # starts wherever the year differs from the one in the previous row.
+        years = years.to_numpy()
+        bounds = [0, *(np.flatnonzero(years[1:] != years[:-1]) + 1), len(years)]
+        return [
+            table.slice(start, stop - start)
+            for start, stop in zip(bounds[:-1], bounds[1:], strict=True)
+        ]
 
     def load_input(self, context: InputContext) -> pd.DataFrame:
         """Loads pudl table from parquet file."""
         table_name = get_table_name_from_context(context)
         parquet_path = PudlPaths().parquet_path(table_name)
-        res = Resource.from_id(table_name)
-        df = pq.read_table(source=parquet_path, schema=res.to_pyarrow()).to_pandas()
-        return res.enforce_schema(df)
+        res = Package.from_resource_ids().get_resource(table_name)
+        metadata = context.definition_metadata or {}
+        columns = metadata.get("columns")
+        df = pq.read_table(
+            source=parquet_path,
+            schema=res.to_pyarrow(),
+            columns=columns,
+            filters=metadata.get("filters"),
+        ).to_pandas()
+        if columns is None:
+            # The schema was enforced when the table was written.
+            return res.enforce_schema(df, copy=False, check_unique=False)
+        dtypes = res.to_pandas_dtypes()
+        return df.astype({col: dtypes[col] for col in df.columns}, copy=False)
 
 
 class PudlSQLiteIOManager(SQLiteIOManager):
@@ -427,16 +535,7 @@ class PudlSQLiteIOManager(SQLiteIOManager):
 
         # Check if there is a Resource in self.package for table_name.
         # We don't want folks creating views without adding package metadata.
-        try:
-            _ = self.package.get_resource(table_name)
-        except ValueError as err:
-            raise ValueError(
-                f"{table_name} does not appear in pudl.metadata.resources. "
-                "Check for typos, or add the table to the metadata and recreate the "
-                f"PUDL SQlite database. It's also possible that {table_name} is one of "
-                "the tables that does not get loaded into the PUDL SQLite DB because "
-                "it's a work in progress or is distributed in Apache Parquet format."
-            ) from err
+        self._get_resource(table_name)
 
         with engine.begin() as con:
             # Drop the existing view if it exists and create the new view.
@@ -445,38 +544,113 @@ class PudlSQLiteIOManager(SQLiteIOManager):
             con.execute(query)
 
     def _handle_pandas_output(self, context: OutputContext, df: pd.DataFrame):
-        """Enforce PUDL DB schema and write dataframe to SQLite."""
+        """Enforce PUDL DB schema and write dataframe to SQLite.
+
+        The old records are deleted and the new ones are inserted in a single
+        transaction, using :func:`pudl.helpers.bulk_insert_sqlite` and with the
+        :data:`pudl.helpers.SQLITE_BULK_LOAD_PRAGMAS` applied for the duration of the
+        load.
+        """
         table_name = get_table_name_from_context(context)
         # If table_name doesn't show up in the self.md object, this will raise an error
         sa_table = self._get_sqlalchemy_table(table_name)
         res = self.package.get_resource(table_name)
 
         df = res.enforce_schema(df)
-        with self.engine.begin() as con:
+        with (
+            self.engine.connect() as con,
+            pudl.helpers.sqlite_pragmas(con),
+            con.begin(),
+        ):
             # Remove old table records before loading to db
             con.execute(sa_table.delete())
+            pudl.helpers.bulk_insert_sqlite(con, sa_table, df)
 
-            df.to_sql(
-                table_name,
-                con,
-                if_exists="append",
-                index=False,
-                chunksize=100_000,
-                dtype={c.name: c.type for c in sa_table.columns},
-            )
-
-    def load_input(self, context: InputContext) -> pd.DataFrame:
-        """Load a dataframe from a sqlite database.
+    def read_arrow(
+        self,
+        table_name: str,
+        columns: list[str] | None = None,
+        filters: list[tuple[str, str, Any]] | None = None,
+        batch_size: int = 100_000,
+    ) -> pa.Table:
+        """Read a PUDL table or view from the database into an Arrow table.
+
+        Rows are pulled from the SQLite cursor in batches and each column is converted
+        directly into a typed Arrow array according to :meth:`Resource.to_pyarrow`,
+        with integers and numbers widened to 64 bits and datetimes to microsecond
+        precision so that no values are lost.
 
         Args:
-            context: dagster keyword that provides access output information like asset
-                name.
+            table_name: name of the table or view to read.
+            columns: names of the columns to read, in the order they should be
+                returned. If None, all columns in the table schema are read.
+            filters: row predicates that must all be satisfied, as a list of
+                ``(column, op, value)`` tuples in the same format accepted by
+                :func:`pyarrow.parquet.read_table`. ``op`` is one of ``=``, ``==``,
+                ``!=``, ``<``, ``<=``, ``>``, ``>=``, ``in`` or ``not in``.
+            batch_size: number of rows to fetch from the cursor at a time.
+
+        Raises:
+            ValueError: if the table has no metadata, doesn't exist in the database,
+                or a requested column or filter operator is invalid.
         """
-        table_name = get_table_name_from_context(context)
+        res = self._get_resource(table_name)
+        schema = res.to_pyarrow()
+        columns = schema.names if columns is None else list(columns)
+        unknown_cols = (
+            set(columns)
+            .union(col for col, _, _ in filters or [])
+            .difference(schema.names)
+        )
+        if unknown_cols:
+            raise ValueError(
+                f"{table_name} has no columns named {sorted(unknown_cols)}."
+            )
+        schema = pa.schema(
+            [_widen_sqlite_arrow_field(schema.field(col)) for col in columns],
+            metadata=schema.metadata,
+        )
+
+        # Only the columns used in the filters are typed, so that the values are bound
+        # like they were written, but read back without any per-row processing.
+        fields = {field.name: field for field in res.schema.fields}
+        table = sa.table(table_name)
+        stmt = sa.select(*[sa.column(col) for col in columns]).select_from(table)
+        for col, op, value in filters or []:
+            stmt = stmt.where(
+                _sql_filter_clause(
+                    sa.column(col, fields[col].to_sql_dtype()), op, value
+                )
+            )
+
+        batches = []
+        with self.engine.connect() as con:
+            try:
+                result = con.execute(stmt)
+            except sa.exc.OperationalError as err:
+                raise ValueError(
+                    f"{table_name} not found. Either the table was dropped "
+                    "or it doesn't exist in the pudl.metadata.resources."
+                    "Add the table to the metadata and recreate the database."
+                ) from err
+            while rows := result.fetchmany(batch_size):
+                batches.append(
+                    pa.record_batch(
+                        [
+                            _sqlite_values_to_arrow(values, field.type)
+                            for values, field in zip(
+                                zip(*rows, strict=False), schema, strict=True
+                            )
+                        ],
+                        schema=schema,
+                    )
+                )
+        return pa.Table.from_batches(batches, schema=schema)
 
-        # Check if there is a Resource in self.package for table_name
+    def _get_resource(self, table_name: str) -> Resource:
+        """Get the Resource describing a table, or raise a helpful error."""
         try:
-            res = self.package.get_resource(table_name)
+            return self.package.get_resource(table_name)
         except ValueError as err:
             raise ValueError(
                 f"{table_name} does not appear in pudl.metadata.resources. "
@@ -486,28 +660,36 @@ class PudlSQLiteIOManager(SQLiteIOManager):
                 "it's a work in progress or is distributed in Apache Parquet format."
             ) from err
 
-        with self.engine.begin() as con:
-            try:
-                df = pd.concat(
-                    [
-                        res.enforce_schema(chunk_df)
-                        for chunk_df in pd.read_sql_table(
-                            table_name, con, chunksize=100_000
-                        )
-                    ]
-                )
-            except ValueError as err:
-                raise ValueError(
-                    f"{table_name} not found. Either the table was dropped "
-                    "or it doesn't exist in the pudl.metadata.resources."
-                    "Add the table to the metadata and recreate the database."
-                ) from err
-            if df.empty:
-                raise AssertionError(
-                    f"The {table_name} table is empty. Materialize the {table_name} "
-                    "asset so it is available in the database."
-                )
-        return df
+    def load_input(self, context: InputContext) -> pd.DataFrame:
+        """Load a dataframe from a sqlite database.
+
+        Consumers that only need part of a table can ask for it through the metadata of
+        their asset input, e.g.
+        ``AssetIn(metadata={"columns": ["plant_id_eia", "report_date"], "filters":
+        [("report_date", ">=", "2020-01-01")]})``. See :meth:`read_arrow` for the
+        meaning of ``columns`` and ``filters``.
+
+        Args:
+            context: dagster keyword that provides access output information like asset
+                name.
+        """
+        table_name = get_table_name_from_context(context)
+        metadata = context.definition_metadata or {}
+        filters = metadata.get("filters")
+        res = self._get_resource(table_name)
+        table = self.read_arrow(
+            table_name, columns=metadata.get("columns"), filters=filters
+        )
+        if table.num_rows == 0 and not filters:
+            raise AssertionError(
+                f"The {table_name} table is empty. Materialize the {table_name} "
+                "asset so it is available in the database."
+            )
+        df = table.to_pandas(
+            types_mapper=_SQLITE_ARROW_PANDAS_TYPES.get, date_as_object=False
+        )
+        dtypes = res.to_pandas_dtypes()
+        return df.astype({col: dtypes[col] for col in df.columns}, copy=False)
 
 
 @io_manager(
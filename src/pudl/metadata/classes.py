@@ -2,16 +2,20 @@
 
 import copy
 import datetime
+import hashlib
 import json
+import os
+import pickle
 import re
 import sys
 import warnings
 from collections.abc import Callable, Iterable
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Annotated, Any, Literal, Self, TypeVar
 
 import jinja2
+import numpy as np
 import pandas as pd
 import pandera as pr
 import pyarrow as pa
@@ -311,12 +315,21 @@ class FieldConstraints(PudlMeta):
         return checks
 
 
+def _most_frequent_value(x: pd.Series) -> pd.Series:
+    """Aggregate a field by its most frequent value (see :class:`FieldHarvest`).
+
+    This is a module-level function rather than a lambda so that the metadata can be
+    pickled.
+    """
+    return most_and_more_frequent(x, min_frequency=0.7)
+
+
 class FieldHarvest(PudlMeta):
     """Field harvest parameters (`resource.schema.fields[...].harvest`)."""
 
     # NOTE: Callables with defaults must use pydantic.Field() to not bind to self
     aggregate: Callable[[pd.Series], pd.Series] = pydantic.Field(
-        default=lambda x: most_and_more_frequent(x, min_frequency=0.7)
+        default=_most_frequent_value
     )
     """Computes a single value from all field values in a group."""
 
@@ -1109,6 +1122,73 @@ class PudlResourceDescriptor(PudlMeta):
     create_database_schema: bool = True
 
 
+class _SchemaEnforcementPlan:
+    """The parts of a resource schema used to format and check dataframes.
+
+    :meth:`Resource.format_df` and :meth:`Resource.enforce_schema` are called for every
+    table and chunk of a table that is read or written, so the dtypes, categories and
+    primary key they need are compiled once per resource. They are recompiled when the
+    name, type or enum constraint of any field or the primary key of the schema change,
+    whether the fields are replaced or edited in place.
+    """
+
+    def __init__(self, resource: "Resource", **kwargs: Any):
+        """Compile the plan for a resource.
+
+        Args:
+            resource: the resource whose schema is enforced.
+            kwargs: Arguments to :meth:`Field.to_pandas_dtype`.
+        """
+        self.fingerprint = self._fingerprint(resource)
+        self.primary_key = list(resource.schema.primary_key or [])
+        self.dtypes = resource.to_pandas_dtypes(**kwargs)
+        self.year_fields = [
+            field.name for field in resource.schema.fields if field.type == "year"
+        ]
+        self.categorical_dtypes = {
+            name: dtype
+            for name, dtype in self.dtypes.items()
+            if isinstance(dtype, pd.CategoricalDtype)
+        }
+
+    @staticmethod
+    def _fingerprint(resource: "Resource") -> tuple:
+        """The parts of the schema that the plan is compiled from."""
+        return (
+            tuple(
+                (
+                    field.name,
+                    field.type,
+                    tuple(field.constraints.enum) if field.constraints.enum else None,
+                )
+                for field in resource.schema.fields
+            ),
+            tuple(resource.schema.primary_key or []),
+        )
+
+    def is_current(self, resource: "Resource") -> bool:
+        """Whether the plan was compiled from the current schema of the resource."""
+        return self.fingerprint == self._fingerprint(resource)
+
+    def warn_uncategorized_values(self, df: pd.DataFrame) -> None:
+        """Warn about values that will be nulled by casting to categorical dtypes."""
+        for name, dtype in self.categorical_dtypes.items():
+            if name not in df or df[name].dtype == dtype:
+                continue
+            col = df[name]
+            uncategorized = col[col.notna() & ~col.isin(dtype.categories)].unique()
+            if len(uncategorized):
+                logger.warning(
+                    f"Values in {name} column are not included in "
+                    "categorical values in field enum constraint "
+                    f"and will be converted to nulls ({uncategorized.tolist()})."
+                )
+
+    def has_duplicate_keys(self, df: pd.DataFrame) -> bool:
+        """Whether any primary key is repeated, treating nulls as values."""
+        return bool(df.duplicated(subset=self.primary_key).any())
+
+
 class Resource(PudlMeta):
     """Tabular data resource (`package.resources[...]`).
 
@@ -1461,6 +1541,24 @@ class Resource(PudlMeta):
             metadata |= {"primary_key": ",".join(self.schema.primary_key)}
         return pa.schema(fields=fields, metadata=metadata)
 
+    @cached_property
+    def _enforcement_plans(self) -> dict[tuple, _SchemaEnforcementPlan]:
+        """Compiled enforcement plans, by the arguments they were compiled with."""
+        return {}
+
+    def _get_enforcement_plan(self, **kwargs: Any) -> _SchemaEnforcementPlan:
+        """Return the compiled enforcement plan for the current schema.
+
+        Args:
+            kwargs: Arguments to :meth:`Field.to_pandas_dtype`.
+        """
+        key = tuple(sorted(kwargs.items()))
+        plan = self._enforcement_plans.get(key)
+        if plan is None or not plan.is_current(self):
+            plan = _SchemaEnforcementPlan(self, **kwargs)
+            self._enforcement_plans[key] = plan
+        return plan
+
     def to_pandas_dtypes(self, **kwargs: Any) -> dict[str, str | pd.CategoricalDtype]:
         """Return Pandas data type of each field by field name.
 
@@ -1543,7 +1641,9 @@ class Resource(PudlMeta):
             matches = {key: key for key in keys if key in names}
         return matches if len(matches) == len(keys) else None
 
-    def format_df(self, df: pd.DataFrame | None = None, **kwargs: Any) -> pd.DataFrame:
+    def format_df(
+        self, df: pd.DataFrame | None = None, copy: bool = True, **kwargs: Any
+    ) -> pd.DataFrame:
         """Format a dataframe according to the resources's table schema.
 
         * DataFrame columns not in the schema are dropped.
@@ -1557,41 +1657,36 @@ class Resource(PudlMeta):
 
         Args:
             df: Dataframe to format.
+            copy: Whether to copy ``df`` before formatting it. Callers that own ``df``
+                can skip the copy, but ``df`` may then be modified and may share
+                memory with the formatted dataframe.
             kwargs: Arguments to :meth:`Field.to_pandas_dtypes`.
 
         Returns:
             Dataframe with column names and data types matching the resource fields.
         """
-        dtypes = self.to_pandas_dtypes(**kwargs)
+        plan = self._get_enforcement_plan(**kwargs)
+        dtypes = plan.dtypes
         if df is None:
             return pd.DataFrame({n: pd.Series(dtype=d) for n, d in dtypes.items()})
-        matches = self.match_primary_key(df.columns)
+        if df.columns.is_unique and set(plan.primary_key).issubset(df.columns):
+            # Exact matches are used whether or not periodic names may match.
+            matches = {key: key for key in plan.primary_key}
+        else:
+            matches = self.match_primary_key(df.columns)
         if matches is None:
             # Primary key present but no matches were found
             return self.format_df()
-        df = df.copy()
+        if copy:
+            df = df.copy()
         # Rename periodic key columns (if any) to the requested period
-        df = df.rename(columns=matches)
+        if any(df_key != key for df_key, key in matches.items()):
+            df = df.rename(columns=matches)
         # Cast integer year fields to datetime
-        for field in self.schema.fields:
-            if (
-                field.type == "year"
-                and field.name in df
-                and pd.api.types.is_integer_dtype(df[field.name])
-            ):
-                df[field.name] = pd.to_datetime(df[field.name], format="%Y")
-            if isinstance(dtypes[field.name], pd.CategoricalDtype):
-                uncategorized = [
-                    value
-                    for value in df[field.name].dropna().unique()
-                    if value not in dtypes[field.name].categories
-                ]
-                if uncategorized:
-                    logger.warning(
-                        f"Values in {field.name} column are not included in "
-                        "categorical values in field enum constraint "
-                        f"and will be converted to nulls ({uncategorized})."
-                    )
+        for name in plan.year_fields:
+            if name in df and pd.api.types.is_integer_dtype(df[name]):
+                df[name] = pd.to_datetime(df[name], format="%Y")
+        plan.warn_uncategorized_values(df)
         df = (
             # Reorder columns and insert missing columns
             df.reindex(columns=dtypes.keys(), copy=False)
@@ -1605,19 +1700,29 @@ class Resource(PudlMeta):
                 df[key] = PERIODS[period](df[key])
         return df
 
-    def enforce_schema(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Drop columns not in the DB schema and enforce specified types."""
-        expected_cols = pd.Index(self.get_field_names())
-        missing_cols = list(expected_cols.difference(df.columns))
+    def enforce_schema(
+        self, df: pd.DataFrame, copy: bool = True, check_unique: bool = True
+    ) -> pd.DataFrame:
+        """Drop columns not in the DB schema and enforce specified types.
+
+        Args:
+            df: Dataframe to enforce the schema on.
+            copy: Whether to copy ``df`` first. See :meth:`format_df`.
+            check_unique: Whether to check that the primary key is unique. Data read
+                back from a table that was written with its schema enforced can skip
+                the check.
+        """
+        plan = self._get_enforcement_plan()
+        missing_cols = list(pd.Index(plan.dtypes.keys()).difference(df.columns))
         if missing_cols:
             raise ValueError(
                 f"{self.name}: Missing columns found when enforcing table "
                 f"schema: {missing_cols}"
             )
 
-        df = self.format_df(df)
-        pk = self.schema.primary_key
-        if pk and not df[df.duplicated(subset=pk)].empty:
+        df = self.format_df(df, copy=copy)
+        pk = plan.primary_key
+        if pk and check_unique and plan.has_duplicate_keys(df):
             raise ValueError(
                 f"{self.name} Duplicate primary keys when enforcing schema."
             )
@@ -1807,6 +1912,96 @@ class Resource(PudlMeta):
 # ---- Package ---- #
 
 
+class PackageCache:
+    """An on-disk cache of validated :class:`Package` metadata.
+
+    Building the metadata for all of the PUDL tables expands and validates every field
+    and resource, which takes seconds each time PUDL is started. The validated package
+    is pickled, so later processes can load it without validating it again. Entries are
+    keyed by the source of :mod:`pudl.metadata`, the versions of Python and of the
+    libraries whose objects are pickled, and the arguments to
+    :meth:`Package.from_resource_ids`. Entries that can't be unpickled anyway are
+    treated as missing and rebuilt.
+
+    Entries are touched whenever they are loaded. Entries built from other versions of
+    the source are deleted when a new entry is stored, once they haven't been used for
+    :attr:`STALE_AFTER`, so several checkouts of PUDL can share one cache directory
+    without deleting each other's entries.
+
+    The cache is used when the ``PUDL_METADATA_CACHE`` environment variable is set to
+    the directory where the packages should be stored. Loading a pickle can run
+    arbitrary code, so that directory must only be writable by users you trust.
+    """
+
+    ENV_VAR = "PUDL_METADATA_CACHE"
+    STALE_AFTER = datetime.timedelta(days=7)
+
+    def __init__(self, path: Path):
+        """Create a package cache, making its directory if necessary."""
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+
+    @classmethod
+    def from_env(cls) -> Self | None:
+        """Create a cache in the directory named by :attr:`ENV_VAR`, if it is set."""
+        path = os.environ.get(cls.ENV_VAR)
+        return cls(Path(path)) if path else None
+
+    @staticmethod
+    @lru_cache
+    def source_digest() -> str:
+        """Hash the source of :mod:`pudl.metadata` and the versions it's pickled with."""
+        versions = [sys.version, pydantic.VERSION, pd.__version__, np.__version__]
+        digest = hashlib.sha256(repr(versions).encode())
+        metadata_dir = Path(__file__).parent
+        for path in sorted(metadata_dir.rglob("*.py")):
+            digest.update(str(path.relative_to(metadata_dir)).encode())
+            digest.update(path.read_bytes())
+        return digest.hexdigest()[:16]
+
+    def _entry_path(self, *args: Any) -> Path:
+        args_digest = hashlib.sha256(repr(args).encode()).hexdigest()[:16]
+        return self.path / f"package__{self.source_digest()}__{args_digest}.pkl"
+
+    def get(self, *args: Any) -> "Package | None":
+        """Return the package built with ``args``, or None if it isn't cached."""
+        path = self._entry_path(*args)
+        try:
+            with path.open("rb") as package_file:
+                package = pickle.load(package_file)  # noqa: S301
+        except FileNotFoundError:
+            return None
+        except Exception as err:
+            # Unpickling can fail in many ways, e.g. after a library upgrade.
+            logger.warning(f"Discarding unreadable cached metadata {path}: {err}")
+            path.unlink(missing_ok=True)
+            return None
+        os.utime(path)
+        return package
+
+    def put(self, package: "Package", *args: Any) -> None:
+        """Store the package built with ``args``, and delete stale entries."""
+        path = self._entry_path(*args)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            with tmp_path.open("wb") as package_file:
+                pickle.dump(package, package_file, protocol=pickle.HIGHEST_PROTOCOL)
+            tmp_path.replace(path)
+        except OSError as err:
+            logger.warning(f"Could not cache metadata in {path}: {err}")
+            tmp_path.unlink(missing_ok=True)
+            return
+        stale_mtime = (datetime.datetime.now() - self.STALE_AFTER).timestamp()
+        for stale_path in self.path.glob("package__*.pkl"):
+            if stale_path.name.startswith(f"package__{self.source_digest()}__"):
+                continue
+            try:
+                if stale_path.stat().st_mtime < stale_mtime:
+                    stale_path.unlink()
+            except FileNotFoundError:
+                continue
+
+
 class Package(PudlMeta):
     """Tabular data package.
 
@@ -1907,7 +2102,9 @@ class Package(PudlMeta):
         coding table's encoder with those columns for later use cleaning them up.
 
         The result is cached, since we so often need to generate the metdata for
-        the full collection of PUDL tables.
+        the full collection of PUDL tables. If the ``PUDL_METADATA_CACHE`` environment
+        variable is set, it is also cached on disk for other processes to load (see
+        :class:`PackageCache`).
 
         Args:
             resource_ids: Resource PUDL identifiers (`resource.name`). Needs to
@@ -1918,6 +2115,11 @@ class Package(PudlMeta):
             excluded_etl_groups: Collection of ETL groups used to filter resources
                 out of Package.
         """
+        cache = PackageCache.from_env()
+        args = (resource_ids, resolve_foreign_keys, excluded_etl_groups)
+        if cache is not None and (package := cache.get(*args)) is not None:
+            return package
+
         resources = [Resource.dict_from_id(x) for x in resource_ids]
         if resolve_foreign_keys:
             # Add missing resources based on foreign keys
@@ -1940,7 +2142,10 @@ class Package(PudlMeta):
                 if resource["etl_group"] not in excluded_etl_groups
             ]
 
-        return cls(name="pudl", resources=resources)
+        package = cls(name="pudl", resources=resources)
+        if cache is not None:
+            cache.put(package, *args)
+        return package
 
     @staticmethod
     def get_etl_group_tables(
@@ -2071,7 +2276,9 @@ class DatasetteMetadata(PudlMeta):
     """
 
     data_sources: list[DataSource]
-    resources: list[Resource] = Package.from_resource_ids()
+    resources: list[Resource] = pydantic.Field(
+        default_factory=lambda: Package.from_resource_ids().resources
+    )
     xbrl_resources: dict[str, list[Resource]] = {}
     label_columns: dict[str, str] = {
         "core_eia__entity_plants": "plant_name_eia",
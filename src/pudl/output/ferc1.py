@@ -1,9 +1,12 @@
 """A collection of denormalized FERC assets and helper functions."""
 
+import hashlib
 import importlib
 import re
+from collections import defaultdict
 from copy import deepcopy
 from functools import cached_property
+from pathlib import Path
 from typing import Any, Literal, NamedTuple, Self
 
 import networkx as nx
@@ -22,6 +25,7 @@ from pydantic import (
 )
 
 import pudl
+from pudl.helpers import DataFrameFileCache
 from pudl.transform.ferc1 import (
     GroupMetricChecks,
     GroupMetricTolerances,
@@ -1306,8 +1310,19 @@ def exploded_table_asset_factory(
         name=f"_out_ferc1__detailed_{get_core_ferc1_asset_description(root_table)}",
         ins=ins,
         io_manager_key=io_manager_key,
+        config_schema={
+            "calculation_engine": Field(
+                str,
+                default_value="merge",
+                description=(
+                    "How to evaluate the inter-table calculations: merge or sparse. See"
+                    " pudl.transform.ferc1.calculate_values_from_components."
+                ),
+            ),
+        },
     )
     def exploded_tables_asset(
+        context,
         **kwargs: dict[str, pd.DataFrame],
     ) -> pd.DataFrame:
         _core_ferc1_xbrl__metadata = kwargs["_core_ferc1_xbrl__metadata"]
@@ -1335,6 +1350,7 @@ def exploded_table_asset_factory(
             tags=tags,
             group_metric_checks=group_metric_checks,
             off_by_facts=off_by_facts,
+            calculation_engine=context.op_config["calculation_engine"],
         ).boom(tables_to_explode=tables_to_explode)
 
     return exploded_tables_asset
@@ -1471,6 +1487,7 @@ class Exploder:
         tags: pd.DataFrame = pd.DataFrame(),
         group_metric_checks: GroupMetricChecks = GroupMetricChecks(),
         off_by_facts: list[OffByFactoid] = None,
+        calculation_engine: Literal["merge", "sparse"] = "merge",
     ):
         """Instantiate an Exploder class.
 
@@ -1481,6 +1498,8 @@ class Exploder:
             calculation_components_xbrl_ferc1: table of calculation components.
             seed_nodes: NodeIds to use as seeds for the calculation forest.
             tags: Additional metadata to merge onto the exploded dataframe.
+            calculation_engine: how to evaluate the inter-table calculations. See
+                :func:`pudl.transform.ferc1.calculate_values_from_components`.
         """
         self.table_names: list[str] = table_names
         self.root_table: str = root_table
@@ -1490,6 +1509,7 @@ class Exploder:
         self.seed_nodes = seed_nodes
         self.tags = tags
         self.off_by_facts = off_by_facts
+        self.calculation_engine = calculation_engine
 
     @cached_property
     def exploded_calcs(self: Self):
@@ -1698,13 +1718,22 @@ class Exploder:
 
     @cached_property
     def calculation_forest(self: Self) -> "XbrlCalculationForestFerc1":
-        """Construct a calculation forest based on class attributes."""
-        return XbrlCalculationForestFerc1(
+        """Construct a calculation forest based on class attributes.
+
+        If the ``PUDL_CALCULATION_FOREST_CACHE`` environment variable is set, the
+        pruned and annotated forest is loaded from the cache if it was built from the
+        same inputs before (see :class:`CalculationForestCache`).
+        """
+        forest = XbrlCalculationForestFerc1(
             exploded_calcs=self.exploded_calcs,
             seeds=self.seed_nodes,
             tags=self.tags,
             group_metric_checks=self.group_metric_checks,
         )
+        cache = CalculationForestCache.from_env()
+        if cache is not None:
+            forest.load_or_store_graphs(cache)
+        return forest
 
     @cached_property
     def dimensions(self: Self) -> list[str]:
@@ -1869,6 +1898,7 @@ class Exploder:
             calc_idx=self.calc_idx,
             value_col=self.value_col,
             calc_to_data_merge_validation="many_to_many",
+            engine=self.calculation_engine,
         )
         return calculated_df
 
@@ -2017,6 +2047,7 @@ class Exploder:
             data=exploded.drop(columns=["calculated_value", "is_calc"]),
             calc_idx=self.calc_idx,
             value_col=self.value_col,
+            engine=self.calculation_engine,
         )
         subdimension_calcs = pudl.transform.ferc1.check_calculation_metrics(
             calculated_df=subdimension_calcs,
@@ -2040,6 +2071,31 @@ def in_explosion_tables(table_name: str, in_explosion_table_names: list[str]) ->
 ################################################################################
 # XBRL Calculation Forests
 ################################################################################
+class CalculationForestCache(DataFrameFileCache):
+    """An on-disk cache of pruned and annotated XBRL calculation forests.
+
+    Building a calculation forest means constructing and pruning several networkx
+    graphs and propagating tags through them, but the calculation components, tags and
+    seeds that determine each forest rarely change between runs. The graphs of a built
+    forest are pickled, under a key derived from those inputs and from the code that
+    builds them, and loaded instead of being re-derived in later runs.
+
+    The cache is used by :meth:`Exploder.calculation_forest` when the
+    ``PUDL_CALCULATION_FOREST_CACHE`` environment variable is set to the directory where
+    the forests should be stored.
+    """
+
+    ENV_VAR = "PUDL_CALCULATION_FOREST_CACHE"
+
+    def get_graphs(self, key: str) -> dict[str, nx.DiGraph] | None:
+        """Return the forest graphs stored under ``key``, or None if there aren't any."""
+        return self.get_entry(key, ".pkl")
+
+    def put_graphs(self, key: str, graphs: dict[str, nx.DiGraph]) -> None:
+        """Store the graphs of a built forest under ``key``."""
+        self.put_entry(key, graphs, ".pkl")
+
+
 class XbrlCalculationForestFerc1(BaseModel):
     """A class for manipulating groups of hierarchically nested XBRL calculations.
 
@@ -2081,6 +2137,34 @@ class XbrlCalculationForestFerc1(BaseModel):
         """Construct parent_cols based on the provided calc_cols."""
         return [col + "_parent" for col in self.calc_cols]
 
+    @cached_property
+    def cache_key(self: Self) -> str:
+        """Identify the forest by everything that determines its graphs."""
+        digest = hashlib.sha256(Path(__file__).read_bytes())
+        digest.update(repr(self.calc_cols).encode())
+        digest.update(repr(self.seeds).encode())
+        for df in [self.exploded_calcs, self.tags]:
+            digest.update(repr(df.dtypes.astype(str).to_dict()).encode())
+            digest.update(pd.util.hash_pandas_object(df).to_numpy().tobytes())
+        return f"calculation_forest__{digest.hexdigest()}"
+
+    def load_or_store_graphs(self: Self, cache: CalculationForestCache) -> None:
+        """Load the pruned and annotated forest from a cache, or build and store it.
+
+        Only the graphs needed to compile the leaves of the forest are cached. Any of
+        the intermediate graphs, like :attr:`full_digraph`, are still built on demand.
+        """
+        graphs = cache.get_graphs(self.cache_key)
+        if graphs is None:
+            cache.put_graphs(
+                self.cache_key,
+                {"forest": self.forest, "annotated_forest": self.annotated_forest},
+            )
+        else:
+            logger.info(f"Using cached calculation forest {self.cache_key}.")
+            # Prime the cached properties with the prebuilt graphs.
+            self.__dict__.update(graphs)
+
     @model_validator(mode="after")
     def unique_associations(self: Self):
         """Ensure parent-child associations in exploded calculations are unique."""
@@ -2572,13 +2656,6 @@ class XbrlCalculationForestFerc1(BaseModel):
             stepparents = stepparents.union(graph.predecessors(stepchild))
         return list(stepparents)
 
-    def _get_path_weight(self, path: list[NodeId], graph: nx.DiGraph) -> float:
-        """Multiply all weights along a path together."""
-        leaf_weight = 1.0
-        for parent, child in zip(path, path[1:], strict=False):
-            leaf_weight *= graph.get_edge_data(parent, child)["weight"]
-        return leaf_weight
-
     @cached_property
     def leafy_meta(self: Self) -> pd.DataFrame:
         """Identify leaf facts and compile their metadata.
@@ -2597,60 +2674,58 @@ class XbrlCalculationForestFerc1(BaseModel):
         - The leaf node's xbrl_factoid_original
         - The weight associated with the leaf, in relation to its root.
         """
-        # Construct a dataframe that links the leaf node IDs to their root nodes:
-        leaves = self.forest_leaves
-        roots = self.forest_roots
-        leaf_to_root_map = {
-            leaf: root
-            for leaf in leaves
-            for root in roots
-            if leaf in nx.descendants(self.annotated_forest, root)
-        }
-        leaves_df = pd.DataFrame(list(leaf_to_root_map.keys()))
-        roots_df = pd.DataFrame(list(leaf_to_root_map.values())).rename(
-            columns={col: col + "_root" for col in self.calc_cols}
-        )
-        leafy_meta = pd.concat([roots_df, leaves_df], axis="columns")
-
-        # Propagate tags and weights to leaf nodes
-        leaf_rows = []
+        forest = self.annotated_forest
+        root_order = {root: i for i, root in enumerate(self.forest_roots)}
+        # Visit every node after all of its parents, carrying the weights of all the
+        # paths leading to it from each of its roots, and the union of the tags of
+        # all its ancestors, one edge further down the forest.
+        path_weights: dict[NodeId, dict[NodeId, set[float]]] = {}
+        inherited_tags: dict[NodeId, dict[str, Any]] = {}
+        for node in nx.topological_sort(forest):
+            parents = list(forest.predecessors(node))
+            if parents:
+                weights = defaultdict(set)
+                tags = {}
+                for parent in parents:
+                    edge_weight = forest.edges[parent, node]["weight"]
+                    for root, parent_weights in path_weights[parent].items():
+                        weights[root] |= {w * edge_weight for w in parent_weights}
+                    tags |= inherited_tags[parent]
+            else:
+                weights = {node: {1.0}}
+                tags = {}
+            path_weights[node] = weights
+            inherited_tags[node] = tags | forest.nodes[node].get("tags", {})
+
+        leaves = [leaf for leaf in self.forest_leaves if leaf not in root_order]
+        leaf_roots = []
+        leaf_weights = []
         for leaf in leaves:
-            leaf_tags = {}
-            ancestors = list(nx.ancestors(self.annotated_forest, leaf)) + [leaf]
-            for node in ancestors:
-                leaf_tags |= self.annotated_forest.nodes[node].get("tags", {})
-            all_leaf_weights = {
-                self._get_path_weight(path, self.annotated_forest)
-                for path in nx.all_simple_paths(
-                    self.annotated_forest, leaf_to_root_map[leaf], leaf
-                )
-            }
+            # A leaf descended from several roots is attributed to the last of them.
+            root = max(path_weights[leaf], key=root_order.__getitem__)
+            all_leaf_weights = path_weights[leaf][root]
             if len(all_leaf_weights) != 1:
                 raise ValueError(
-                    f"Paths from {leaf_to_root_map[leaf]} to {leaf} have "
-                    f"different weights: {all_leaf_weights}"
+                    f"Paths from {root} to {leaf} have different weights: "
+                    f"{all_leaf_weights}"
                 )
-            leaf_weight = all_leaf_weights.pop()
-
-            # Construct a dictionary describing the leaf node and convert it into a
-            # single row DataFrame. This makes adding arbitrary tags easy.
-            leaf_attrs = {
-                "table_name": leaf.table_name,
-                "xbrl_factoid": leaf.xbrl_factoid,
-                "utility_type": leaf.utility_type,
-                "plant_status": leaf.plant_status,
-                "plant_function": leaf.plant_function,
-                "weight": leaf_weight,
-                "tags": leaf_tags,
-            }
-            leaf_rows.append(pd.json_normalize(leaf_attrs, sep="_"))
+            leaf_roots.append(root)
+            leaf_weights.append(next(iter(all_leaf_weights)))
 
-        # Combine the two dataframes we've constructed above:
-        return (
-            pd.merge(leafy_meta, pd.concat(leaf_rows), validate="one_to_one")
-            .reset_index(drop=True)
-            .convert_dtypes()
-        )
+        return pd.concat(
+            [
+                pd.DataFrame(
+                    leaf_roots, columns=[col + "_root" for col in self.calc_cols]
+                ),
+                pd.DataFrame(leaves, columns=self.calc_cols),
+                pd.DataFrame({"weight": leaf_weights}),
+                pd.DataFrame.from_records(
+                    [inherited_tags[leaf] for leaf in leaves],
+                    index=pd.RangeIndex(len(leaves)),
+                ).add_prefix("tags_"),
+            ],
+            axis="columns",
+        ).convert_dtypes()
 
     @cached_property
     def root_calculations(self: Self) -> pd.DataFrame:
@@ -29,7 +29,7 @@ import pandas as pd
 import sqlalchemy as sa
 
 import pudl
-from pudl.metadata.classes import Resource
+from pudl.metadata.classes import Package, Resource
 from pudl.metadata.fields import apply_pudl_dtypes
 
 logger = pudl.logging_helpers.get_logger(__name__)
@@ -307,10 +307,11 @@ class PudlTabl:
             "pudl.sqlite. To access the data returned by this method, "
             f"use the {table_name} table in the pudl.sqlite database."
         )
-        resource = Resource.from_id(table_name)
+        resource = Package.from_resource_ids().get_resource(table_name)
+        # The database enforces the primary keys, and each chunk is only a part of it.
         return pd.concat(
             [
-                resource.enforce_schema(df)
+                resource.enforce_schema(df, copy=False, check_unique=False)
                 for df in pd.read_sql(
                     self._select_between_dates(table_name),
                     self.pudl_engine,
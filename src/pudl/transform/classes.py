@@ -65,15 +65,18 @@ defined in the per-dataset modules under :mod:`pudl.transform.params` e.g.
 """
 
 import enum
+import hashlib
 import re
 from abc import ABC, abstractmethod
 from collections.abc import Callable
-from functools import wraps
+from functools import cache, wraps
 from itertools import combinations
-from typing import Annotated, Any, Protocol, Self
+from pathlib import Path
+from typing import Annotated, Any, Literal, Protocol, Self
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 from pydantic import (
     BaseModel,
     ConfigDict,
@@ -85,6 +88,7 @@ from pydantic import (
 
 import pudl.logging_helpers
 import pudl.transform.params.ferc1
+from pudl.helpers import DataFrameFileCache
 from pudl.metadata.classes import Package
 
 logger = pudl.logging_helpers.get_logger(__name__)
@@ -998,6 +1002,69 @@ class TableTransformParams(TransformParams):
         return cls.from_dict(transform_params[table_id.value])
 
 
+#####################################################################################
+# Persistent transform checkpoints
+#####################################################################################
+class TransformCheckpointCache(DataFrameFileCache):
+    """An on-disk cache of the dataframes produced by table transform steps.
+
+    Entries are content-addressed: their keys are derived from everything that
+    determines the output of a transform step (see
+    :meth:`AbstractTableTransformer.transform`), so a stale entry is never returned and
+    nothing needs to be invalidated by hand. Whenever the total size of the cache
+    exceeds ``max_bytes`` the least recently used entries are deleted.
+
+    This is meant to speed up iterating on transforms during development. It is enabled
+    for all table transformers by setting the ``PUDL_TRANSFORM_CHECKPOINTS``
+    environment variable to the directory where the checkpoints should be stored.
+    """
+
+    ENV_VAR = "PUDL_TRANSFORM_CHECKPOINTS"
+
+
+def _update_checkpoint_hash(hasher: "hashlib._Hash", obj: Any) -> None:
+    """Add an input of a transform to a checkpoint key hash.
+
+    Raises:
+        TypeError: if the object isn't something we know how to hash reliably.
+    """
+    if isinstance(obj, pd.DataFrame):
+        hasher.update(repr(obj.dtypes.astype(str).to_dict()).encode())
+        try:
+            hasher.update(pd.util.hash_pandas_object(obj).to_numpy().tobytes())
+        except TypeError:
+            # Object columns containing e.g. lists or dicts.
+            hasher.update(obj.to_json(orient="split", default_handler=str).encode())
+    elif isinstance(obj, list | tuple):
+        hasher.update(f"{type(obj).__name__}{len(obj)}".encode())
+        for item in obj:
+            _update_checkpoint_hash(hasher, item)
+    elif isinstance(obj, dict):
+        _update_checkpoint_hash(hasher, sorted(obj.items(), key=lambda kv: repr(kv[0])))
+    elif isinstance(obj, set | frozenset):
+        _update_checkpoint_hash(hasher, sorted(obj, key=repr))
+    elif isinstance(obj, enum.Enum) or pd.api.types.is_scalar(obj):
+        hasher.update(f"{type(obj).__name__}:{obj!r}".encode())
+    else:
+        raise TypeError(f"Can't compute a checkpoint key for a {type(obj)}.")
+
+
+@cache
+def _pudl_source_digest() -> str:
+    """Hash the source code of PUDL, so that checkpoints change with the code.
+
+    Transforms depend on much more than the modules defining the transformer classes,
+    e.g. on the field and code metadata in :mod:`pudl.metadata` and on
+    :mod:`pudl.helpers`, so any change to the source invalidates all checkpoints.
+    """
+    digest = hashlib.sha256()
+    pudl_dir = Path(__file__).parents[1]
+    for path in sorted(pudl_dir.rglob("*.py")):
+        digest.update(str(path.relative_to(pudl_dir)).encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
 #####################################################################################
 # Abstract Table Transformer classes
 #####################################################################################
@@ -1018,7 +1085,9 @@ def cache_df(key: str = "main") -> Callable[..., pd.DataFrame]:
     Saving many intermediate steps can provide lots of detailed information, but will
     use more memory. Updating the same cached dataframe as it successfully passes
     through each step lets you access the last known state it had before an error
-    occurred.
+    occurred. How much memory is used depends on the transformer's
+    :attr:`AbstractTableTransformer.cache_dfs_mode` and
+    :attr:`AbstractTableTransformer.cache_dfs_max_bytes`.
 
     This decorator requires that the decorated function return a single
     :class:`pd.DataFrame`, but it can take any type of inputs.
@@ -1027,8 +1096,8 @@ def cache_df(key: str = "main") -> Callable[..., pd.DataFrame]:
     https://realpython.com/primer-on-python-decorators/#fancy-decorators
 
     Args:
-        key: The key that will be used to store and look up the cached dataframe in the
-            internal ``self._cached_dfs`` dictionary.
+        key: The key that will be used to store and look up the cached dataframe with
+            :meth:`AbstractTableTransformer.get_cached_df`.
 
     Returns:
         The decorated class method.
@@ -1049,7 +1118,7 @@ def cache_df(key: str = "main") -> Callable[..., pd.DataFrame]:
                     f"{self.table_id.value}: Caching df to {key=} "
                     f"in {func.__name__}()"
                 )
-                self._cached_dfs[key] = df.copy()
+                self._cache_df(key, df)
             return df
 
         return _wrapper
@@ -1113,10 +1182,40 @@ class AbstractTableTransformer(ABC):
     clear_cached_dfs: bool = True
     """Determines whether cached dataframes are deleted at the end of the transform."""
 
-    _cached_dfs: dict[str, pd.DataFrame] = {}
+    cache_dfs_mode: Literal["copy", "arrow", "cow"] = "copy"
+    """How intermediate dataframes are snapshotted when ``cache_dfs`` is True.
+
+    * ``copy``: store a deep copy of the dataframe.
+    * ``arrow``: store the dataframe as an immutable, LZ4 compressed Arrow IPC buffer,
+      which is much more compact than pandas, especially for string and categorical
+      columns. Dataframes that can't be converted to Arrow are copied instead.
+    * ``cow``: store a shallow copy that shares memory with the original until either
+      of them is modified. Requires ``pd.options.mode.copy_on_write = True``, since
+      otherwise later in-place modifications would leak into the snapshot.
+    """
+
+    cache_dfs_max_bytes: int | None = None
+    """Approximate memory budget for cached dataframes.
+
+    When it is exceeded, the least recently cached dataframes are dropped. The most
+    recent one is always kept. If None, there's no limit.
+    """
+
+    _cached_dfs: dict[str, pd.DataFrame | pa.Buffer]
     """Cached intermediate dataframes for use in development and debugging.
 
-    The dictionary keys are the strings passed to the :func:`cache_df` method decorator.
+    The dictionary keys are the strings passed to the :func:`cache_df` method decorator,
+    in the order they were cached. Use :meth:`get_cached_df` to retrieve them.
+    """
+
+    _cached_df_nbytes: dict[str, int]
+    """Approximate size of each cached dataframe in bytes."""
+
+    checkpoint_cache: TransformCheckpointCache | None = None
+    """Persistent cache used to skip transform steps whose output is already known.
+
+    Defaults to :meth:`TransformCheckpointCache.from_env`. See
+    :meth:`AbstractTableTransformer.transform`.
     """
 
     parameter_model = TableTransformParams
@@ -1140,6 +1239,9 @@ class AbstractTableTransformer(ABC):
         params: TableTransformParams | None = None,
         cache_dfs: bool = False,
         clear_cached_dfs: bool = True,
+        checkpoint_cache: TransformCheckpointCache | None = None,
+        cache_dfs_mode: Literal["copy", "arrow", "cow"] = "copy",
+        cache_dfs_max_bytes: int | None = None,
         **kwargs,
     ) -> None:
         """Initialize the table transformer, setting caching flags."""
@@ -1150,8 +1252,25 @@ class AbstractTableTransformer(ABC):
             self.params = self.parameter_model.from_id(self.table_id)
         else:
             self.params = params
+        if cache_dfs_mode not in ("copy", "arrow", "cow"):
+            raise ValueError(f"Unknown cache_dfs_mode: {cache_dfs_mode!r}")
+        if (
+            cache_dfs
+            and cache_dfs_mode == "cow"
+            and pd.options.mode.copy_on_write is not True
+        ):
+            raise ValueError(
+                "cache_dfs_mode='cow' requires pd.options.mode.copy_on_write = True."
+            )
         self.cache_dfs = cache_dfs
         self.clear_cached_dfs = clear_cached_dfs
+        self.cache_dfs_mode = cache_dfs_mode
+        self.cache_dfs_max_bytes = cache_dfs_max_bytes
+        self._cached_dfs = {}
+        self._cached_df_nbytes = {}
+        if checkpoint_cache is None:
+            checkpoint_cache = TransformCheckpointCache.from_env()
+        self.checkpoint_cache = checkpoint_cache
 
     ################################################################################
     # Abstract methods that must be defined by subclasses
@@ -1201,20 +1320,124 @@ class AbstractTableTransformer(ABC):
     ################################################################################
     # Default method implementations which can be used or overridden by subclasses
     def transform(self, *args, **kwargs) -> pd.DataFrame:
-        """Apply all specified transformations to the appropriate input dataframes."""
-        df = (
-            self.transform_start(*args, **kwargs)
-            .pipe(self.transform_main)
-            .pipe(self.transform_end)
-        )
+        """Apply all specified transformations to the appropriate input dataframes.
+
+        If the transformer has a :attr:`checkpoint_cache`, the output of each of the
+        start, main and end steps is stored in it. The checkpoints are keyed on the
+        inputs to the transform, the transform parameters, any public dataframe
+        attributes of the transformer (e.g. FERC 1 XBRL metadata) and the source code
+        of the whole :mod:`pudl` package. When the transform is re-run
+        with identical keys, it resumes after the last checkpointed step, so an
+        unchanged table isn't transformed at all.
+        """
+        steps = [self.transform_start, self.transform_main, self.transform_end]
+        keys = self._checkpoint_keys(*args, **kwargs)
+        df = None
+        n_done = 0
+        for n_step in range(len(steps), 0, -1):
+            if keys and (df := self.checkpoint_cache.get(keys[n_step - 1])) is not None:
+                logger.info(
+                    f"{self.table_id.value}: Loaded {steps[n_step - 1].__name__}() "
+                    "output from a checkpoint."
+                )
+                n_done = n_step
+                break
+        for n_step, step in enumerate(steps[n_done:], start=n_done):
+            df = step(*args, **kwargs) if n_step == 0 else step(df)
+            if keys:
+                self.checkpoint_cache.put(keys[n_step], df)
         if self.clear_cached_dfs:
             logger.debug(
                 f"{self.table_id.value}: Clearing cached dfs: "
                 f"{sorted(self._cached_dfs.keys())}"
             )
             self._cached_dfs.clear()
+            self._cached_df_nbytes.clear()
         return df
 
+    def get_cached_df(self, key: str) -> pd.DataFrame:
+        """Retrieve a dataframe cached by the :func:`cache_df` decorator.
+
+        Arrow snapshots are converted back into pandas dataframes. Note that shallow
+        ``cow`` snapshots should not be modified in place.
+        """
+        snapshot = self._cached_dfs[key]
+        if isinstance(snapshot, pa.Buffer):
+            return pa.ipc.open_stream(snapshot).read_all().to_pandas()
+        return snapshot
+
+    def _cache_df(self, key: str, df: pd.DataFrame) -> None:
+        """Snapshot a dataframe according to ``cache_dfs_mode`` and enforce the budget."""
+        snapshot = None
+        if self.cache_dfs_mode == "arrow":
+            try:
+                # Arrow may share memory with numeric numpy columns, so the table is
+                # serialized to make sure later changes to df can't leak into it.
+                table = pa.Table.from_pandas(df)
+                sink = pa.BufferOutputStream()
+                with pa.ipc.new_stream(
+                    sink,
+                    table.schema,
+                    options=pa.ipc.IpcWriteOptions(compression="lz4"),
+                ) as writer:
+                    writer.write_table(table)
+                snapshot = sink.getvalue()
+                nbytes = snapshot.size
+            except (pa.ArrowException, TypeError, ValueError) as err:
+                logger.debug(
+                    f"{self.table_id.value}: Copying {key=} instead of converting it "
+                    f"to Arrow. {err}"
+                )
+        if snapshot is None:
+            snapshot = df.copy(deep=(self.cache_dfs_mode != "cow"))
+            nbytes = int(snapshot.memory_usage(deep=True).sum())
+        # Re-inserting moves the key to the end, making it the most recent.
+        self._cached_dfs.pop(key, None)
+        self._cached_df_nbytes.pop(key, None)
+        self._cached_dfs[key] = snapshot
+        self._cached_df_nbytes[key] = nbytes
+
+        if self.cache_dfs_max_bytes is not None:
+            while (
+                len(self._cached_dfs) > 1
+                and sum(self._cached_df_nbytes.values()) > self.cache_dfs_max_bytes
+            ):
+                oldest = next(iter(self._cached_dfs))
+                logger.debug(f"{self.table_id.value}: Evicting cached df {oldest=}")
+                del self._cached_dfs[oldest]
+                del self._cached_df_nbytes[oldest]
+
+    def _checkpoint_keys(self, *args, **kwargs) -> list[str] | None:
+        """Compute the checkpoint cache keys for the start, main and end steps.
+
+        Returns:
+            The keys, or None if there is no checkpoint cache or the inputs can't be
+            hashed reliably.
+        """
+        if self.checkpoint_cache is None:
+            return None
+        hasher = hashlib.sha256()
+        try:
+            _update_checkpoint_hash(hasher, [args, kwargs, self.params.model_dump()])
+            _update_checkpoint_hash(
+                hasher,
+                {
+                    name: value
+                    for name, value in vars(self).items()
+                    if isinstance(value, pd.DataFrame) and not name.startswith("_")
+                },
+            )
+        except TypeError as err:
+            logger.info(f"{self.table_id.value}: Not checkpointing transform. {err}")
+            return None
+        hasher.update(f"{type(self).__qualname__}:".encode())
+        hasher.update(_pudl_source_digest().encode())
+        digest = hasher.hexdigest()[:32]
+        return [
+            f"{self.table_id.value}__{step}__{digest}"
+            for step in ["transform_start", "transform_main", "transform_end"]
+        ]
+
     def rename_columns(
         self, df: pd.DataFrame, params: RenameColumns | None = None, **kwargs
     ) -> pd.DataFrame:
@@ -17,13 +17,19 @@ found in :func:`pudl.transform.eia._boiler_generator_assn`.
 """
 
 import importlib.resources
+import multiprocessing
+import tempfile
 from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
 from enum import StrEnum, auto
+from functools import cache
+from pathlib import Path
 from typing import Literal
 
 import networkx as nx
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 import timezonefinder
 from dagster import (
     AssetIn,
@@ -45,8 +51,14 @@ from pudl.settings import EiaSettings
 
 logger = pudl.logging_helpers.get_logger(__name__)
 
-TZ_FINDER = timezonefinder.TimezoneFinder()
-"""A global TimezoneFinder to cache geographies in memory for faster access."""
+
+@cache
+def _timezone_finder() -> timezonefinder.TimezoneFinder:
+    """A global TimezoneFinder to cache geographies in memory for faster access.
+
+    It takes seconds to load the geographies, so this is only done when it's first used.
+    """
+    return timezonefinder.TimezoneFinder()
 
 
 class EiaEntity(StrEnum):
@@ -84,10 +96,10 @@ def find_timezone(*, lng=None, lat=None, state=None, strict=True):
         Update docstring.
     """
     try:
-        tz = TZ_FINDER.timezone_at(lng=lng, lat=lat)
+        tz = _timezone_finder().timezone_at(lng=lng, lat=lat)
         if tz is None:  # Try harder
             # Could change the search radius as well
-            tz = TZ_FINDER.closest_timezone_at(lng=lng, lat=lat)
+            tz = _timezone_finder().closest_timezone_at(lng=lng, lat=lat)
     # For some reason w/ Python 3.6 we get a ValueError here, but with
     # Python 3.7 we get an OverflowError...
     except (OverflowError, ValueError) as err:
@@ -106,6 +118,7 @@ def occurrence_consistency(
     col: str,
     cols_to_consit: list[str],
     strictness: float = 0.7,
+    consit_codes: np.ndarray | None = None,
 ) -> pd.DataFrame:
     """Find the occurence of entities & the consistency of records.
 
@@ -115,6 +128,9 @@ def occurrence_consistency(
     the number of occurances of each reported record for each entity. With that
     information we can determine if the reported records are strict enough.
 
+    Both numbers are counted with :func:`numpy.bincount` over integer codes for the
+    entities and the reported values, rather than with groupbys and merges.
+
     Args:
         entity_idx: a list of the id(s) for the entity. Ex: for a plant
             entity, the entity_idx is ['plant_id_eia']. For a generator entity,
@@ -128,6 +144,11 @@ def occurrence_consistency(
         strictness: How consistent do you want the column records to
             be? The default setting is .7 (so 70% of the records need to be
             consistent in order to accept harvesting the record).
+        consit_codes: integer codes identifying the unique combinations of
+            ``cols_to_consit`` in each row of ``compiled_df``, numbered in sorted
+            order, as returned by :func:`_group_codes`. When harvesting many columns
+            from the same dataframe they only need to be computed once. If None, they
+            are computed here.
 
     Returns:
         A transformed version of compiled_df with NaNs removed and with new columns with
@@ -135,50 +156,74 @@ def occurrence_consistency(
     """
     # select only the colums you want and drop the NaNs
     # we want to drop the NaNs because
-    col_df = compiled_df[entity_idx + ["report_date", col]].copy()
-    if get_pudl_dtypes(group="eia")[col] == "string":
-        nan_str_mask = (col_df[col] == "nan").fillna(False)
-        col_df.loc[nan_str_mask, col] = pd.NA
-    col_df = col_df.dropna()
+    values = compiled_df[col]
+    if _eia_dtypes()[col] == "string":
+        values = values.mask((values == "nan").fillna(False))
+    keep = np.flatnonzero(
+        compiled_df[entity_idx + ["report_date"]].notna().all(axis="columns")
+        & values.notna()
+    )
 
-    if len(col_df) == 0:
+    if len(keep) == 0:
+        col_df = compiled_df[entity_idx + ["report_date", col]].iloc[keep].copy()
         col_df[f"{col}_is_consistent"] = pd.NA
         col_df[f"{col}_consistent_rate"] = pd.NA
         col_df["entity_occurences"] = pd.NA
         return col_df
-    # determine how many times each entity occurs in col_df
-    occur = (
-        col_df.assign(entity_occurences=1)
-        .groupby(by=cols_to_consit, observed=True)[["entity_occurences"]]
-        .count()
-        .reset_index()
-    )
-
-    # add the occurances into the main dataframe
-    col_df = col_df.merge(occur, on=cols_to_consit)
 
-    # determine how many instances of each of the records in col exist
-    consist_df = (
-        col_df.assign(record_occurences=1)
-        .groupby(by=cols_to_consit + [col], observed=True)[["record_occurences"]]
-        .count()
-        .reset_index()
-    )
-    # now in col_df we have # of times an entity occurred accross the tables
-    # and we are going to merge in the # of times each value occured for each
-    # entity record. When we merge the consistency in with the occurances, we
-    # can determine if the records are more than 70% consistent across the
-    # occurances of the entities.
-    col_df = col_df.merge(consist_df, how="outer")
-    # change all of the fully consistent records to True
-    col_df[f"{col}_consistent_rate"] = (
-        col_df["record_occurences"] / col_df["entity_occurences"]
+    if consit_codes is None:
+        consit_codes = _group_codes(compiled_df, cols_to_consit)
+    entity_codes = consit_codes[keep]
+    value_codes = pd.factorize(values, sort=True)[0][keep]
+    record_codes = pd.factorize(
+        entity_codes.astype(np.int64) * (value_codes.max() + 1) + value_codes
+    )[0]
+    # determine how many times each entity occurs, and how many instances of each of
+    # the records in col exist for each entity. If >70% of an entity's records have
+    # the same value, that value is consistent.
+    entity_occurences = np.bincount(entity_codes)[entity_codes]
+    record_occurences = np.bincount(record_codes)[record_codes]
+    consistent_rate = record_occurences / entity_occurences
+    # Only select the records once, already sorted by their consistency. Harvesting
+    # keeps the first of the most consistent values of each entity, so ties are broken
+    # the way they always have been: records were sorted by entity and value by an outer
+    # merge, and then by consistency with pandas' default (unstable) quicksort.
+    merge_order = np.lexsort((value_codes, entity_codes))
+    rate_order = np.argsort(consistent_rate[merge_order], kind="quicksort")
+    order = merge_order[rate_order]
+    rows = keep[order]
+    col_df = (
+        compiled_df[entity_idx + ["report_date"]]
+        .iloc[rows]
+        .assign(
+            **{col: values.iloc[rows].array},
+            entity_occurences=entity_occurences[order],
+            record_occurences=record_occurences[order],
+            **{f"{col}_consistent_rate": consistent_rate[order]},
+        )
     )
     col_df[f"{col}_is_consistent"] = col_df[f"{col}_consistent_rate"] > strictness
-    col_df = col_df.sort_values(f"{col}_consistent_rate")
+    col_df.index = rate_order
     return col_df
 
 
+@cache
+def _eia_dtypes() -> dict[str, str]:
+    """Look up the pandas dtypes of all EIA columns once, instead of once per column."""
+    return get_pudl_dtypes(group="eia")
+
+
+def _group_codes(df: pd.DataFrame, cols: list[str]) -> np.ndarray:
+    """Label each row of a dataframe with an integer code for its values of cols.
+
+    The codes are numbered in the sorted order of the values, which
+    :func:`occurrence_consistency` relies on to order its records. Rows with nulls in
+    any of the columns get their own codes, since they are dropped by
+    :func:`occurrence_consistency` anyway.
+    """
+    return df.groupby(cols, observed=True, sort=True, dropna=False).ngroup().to_numpy()
+
+
 def _lat_long(
     dirty_df: pd.DataFrame,
     clean_df: pd.DataFrame,
@@ -452,11 +497,183 @@ def _manage_strictness(col: str, eia860m: bool) -> float:
     return strictness_cols.get(col, strictness_default)
 
 
+def _harvest_column(  # noqa: C901
+    col: str,
+    compiled_df: pd.DataFrame,
+    consit_codes: dict[str, np.ndarray],
+    entity_id_df: pd.DataFrame,
+    annual_id_df: pd.DataFrame,
+    id_cols: list[str],
+    static_cols: list[str],
+    annual_cols: list[str],
+    eia860m: bool,
+    debug: bool,
+) -> tuple[pd.DataFrame, pd.DataFrame | None, float, float, int]:
+    """Harvest the consistent values of a single column of the compiled entity records.
+
+    See :func:`harvest_entity_tables` for the arguments. ``compiled_df`` only needs
+    to contain the ID columns, ``report_date`` and ``col``.
+
+    Returns:
+        The harvested values of ``col`` with the ID columns (and ``report_date`` for
+        annual columns) to merge onto the entity or annual table, the dataframe with
+        consistency information for every record (only if ``debug`` is True), the ratio
+        of consistent entities, the number of inconsistent entities, and the total
+        number of entities.
+    """
+    special_case_cols = {
+        "latitude": [_lat_long, 1],
+        "longitude": [_lat_long, 1],
+        "generator_operating_date": [_round_operating_date, "Y"],
+    }
+    if col in annual_cols:
+        cols_to_consit = id_cols + ["report_date"]
+        col_consit_codes = consit_codes["annual"]
+    if col in static_cols:
+        cols_to_consit = id_cols
+        col_consit_codes = consit_codes["static"]
+
+    strictness = _manage_strictness(col, eia860m)
+    col_df = occurrence_consistency(
+        id_cols,
+        compiled_df,
+        col,
+        cols_to_consit,
+        strictness=strictness,
+        consit_codes=col_consit_codes,
+    )
+
+    # pull the correct values out of the df and merge w/ the plant ids
+    col_correct_df = col_df[col_df[f"{col}_is_consistent"]].drop_duplicates(
+        subset=(cols_to_consit + [f"{col}_is_consistent"])
+    )
+
+    # we need this to be an empty df w/ columns bc we are going to use it
+    if col_correct_df.empty:
+        col_correct_df = pd.DataFrame(columns=col_df.columns)
+
+    if col in static_cols:
+        clean_df = entity_id_df.merge(col_correct_df, on=id_cols, how="left")
+        clean_df = clean_df[id_cols + [col]]
+
+    if col in annual_cols:
+        clean_df = annual_id_df.merge(
+            col_correct_df, on=(id_cols + ["report_date"]), how="left"
+        )
+        clean_df = clean_df[id_cols + ["report_date", col]]
+
+    # get the still dirty records by using the cleaned ids w/null values
+    # we need the plants that have no 'correct' value so
+    # we can't just use the col_df records when the consistency is not True
+    dirty_df = col_df.merge(clean_df[clean_df[col].isnull()][id_cols])
+
+    if col in special_case_cols:
+        clean_df = special_case_cols[col][0](
+            dirty_df,
+            clean_df,
+            entity_id_df,
+            id_cols,
+            col,
+            cols_to_consit,
+            special_case_cols[col][1],
+        )
+        if col in static_cols:
+            clean_df = clean_df[id_cols + [col]]
+        elif col in annual_cols:
+            raise AssertionError(
+                "Method currenty not configured to work with annual values."
+            )
+
+    total = len(col_df.drop_duplicates(subset=cols_to_consit))
+    # if the total is 0, the ratio will error, so assign null values.
+    if total == 0:
+        ratio = np.nan
+        wrongos = np.nan
+    if total > 0:
+        ratio = (
+            len(
+                col_df[(col_df[f"{col}_is_consistent"])].drop_duplicates(
+                    subset=cols_to_consit
+                )
+            )
+            / total
+        )
+        wrongos = (1 - ratio) * total
+    return clean_df, (col_df if debug else None), ratio, wrongos, total
+
+
+_HARVEST_WORKER_STATE: dict = {}
+"""The shared compiled entity records and harvesting arguments of a worker process."""
+
+
+def _init_harvest_worker(records_path: str, harvest_kwargs: dict) -> None:
+    """Memory-map the compiled entity records written by the parent process."""
+    _HARVEST_WORKER_STATE["records"] = pa.ipc.open_file(
+        pa.memory_map(records_path)
+    ).read_all()
+    _HARVEST_WORKER_STATE["harvest_kwargs"] = harvest_kwargs
+
+
+def _harvest_column_in_worker(
+    col: str,
+) -> tuple[pd.DataFrame, pd.DataFrame | None, float, float, int]:
+    """Harvest one column in a worker process, reading only the columns it needs."""
+    harvest_kwargs = _HARVEST_WORKER_STATE["harvest_kwargs"]
+    records = _HARVEST_WORKER_STATE["records"]
+    compiled_df = records.select(
+        harvest_kwargs["id_cols"] + ["report_date", col]
+    ).to_pandas()
+    consit_codes = {
+        kind: records.column(f"_{kind}_consit_code").to_numpy()
+        for kind in ("static", "annual")
+    }
+    return _harvest_column(col, compiled_df, consit_codes, **harvest_kwargs)
+
+
+def _harvest_columns_in_processes(
+    cols: list[str],
+    compiled_df: pd.DataFrame,
+    consit_codes: dict[str, np.ndarray],
+    num_workers: int,
+    **harvest_kwargs,
+) -> list[tuple[pd.DataFrame, pd.DataFrame | None, float, float, int]]:
+    """Spread the harvesting of many columns across a pool of worker processes.
+
+    The compiled entity records are written once to an uncompressed Arrow IPC file,
+    which every worker memory-maps read-only, so they are neither pickled for each
+    column nor copied into each worker up front. Workers are spawned rather than forked,
+    since the parent is usually a multi-threaded Dagster process.
+
+    Returns:
+        The outputs of :func:`_harvest_column` for each of ``cols``, in order.
+    """
+    records = pa.Table.from_pandas(compiled_df, preserve_index=False)
+    for kind, codes in consit_codes.items():
+        records = records.append_column(f"_{kind}_consit_code", pa.array(codes))
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        records_path = str(Path(tmp_dir) / "compiled_entity_records.arrow")
+        with (
+            pa.OSFile(records_path, "wb") as sink,
+            pa.ipc.new_file(sink, records.schema) as writer,
+        ):
+            writer.write_table(records)
+        del records
+        logger.info(f"Harvesting {len(cols)} columns with {num_workers} processes.")
+        with ProcessPoolExecutor(
+            max_workers=num_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_harvest_worker,
+            initargs=(records_path, harvest_kwargs),
+        ) as executor:
+            return list(executor.map(_harvest_column_in_worker, cols))
+
+
 def harvest_entity_tables(  # noqa: C901
     entity: EiaEntity,
     clean_dfs: dict[str, pd.DataFrame],
     eia_settings: EiaSettings,
     debug: bool = False,
+    num_workers: int = 1,
 ) -> tuple:
     """Compile consistent records for various entities.
 
@@ -490,6 +707,10 @@ def harvest_entity_tables(  # noqa: C901
         eia860m: if True, the etl run is attempting to include year-to-date updated from
             EIA 860M.
         debug: if True, log when columns are inconsistent, but don't raise an error.
+        num_workers: number of processes to spread the harvested columns across. The
+            consistency of each column is determined independently, so with more than
+            one worker the columns are harvested in a process pool that shares the
+            compiled entity records through a memory-mapped Arrow file.
 
     Returns:
         entity_df (the harvested entity table), annual_df (the annual entity table),
@@ -544,91 +765,55 @@ def harvest_entity_tables(  # noqa: C901
 
     entity_df = entity_id_df.copy()
     annual_df = annual_id_df.copy()
-    special_case_cols = {
-        "latitude": [_lat_long, 1],
-        "longitude": [_lat_long, 1],
-        "generator_operating_date": [_round_operating_date, "Y"],
-    }
     consistency = pd.DataFrame(
         columns=["column", "consistent_ratio", "wrongos", "total"]
     )
     col_dfs = {}
-    # determine how many times each of the columns occur
-    for col in static_cols + annual_cols:
-        if col in annual_cols:
-            cols_to_consit = id_cols + ["report_date"]
-        if col in static_cols:
-            cols_to_consit = id_cols
-
-        strictness = _manage_strictness(col, eia_settings.eia860.eia860m)
-        col_df = occurrence_consistency(
-            id_cols, compiled_df, col, cols_to_consit, strictness=strictness
+    harvest_cols = static_cols + annual_cols
+    harvest_kwargs = {
+        "entity_id_df": entity_id_df,
+        "annual_id_df": annual_id_df,
+        "id_cols": id_cols,
+        "static_cols": static_cols,
+        "annual_cols": annual_cols,
+        "eia860m": eia_settings.eia860.eia860m,
+        "debug": debug,
+    }
+    # identify the entities once, rather than for every column. The values of each
+    # column are still counted separately rather than in one stacked pass over all the
+    # columns: counting is only ~10% of the cost of occurrence_consistency, the rest is
+    # building each column's records, which are needed to harvest it anyway, and whole
+    # columns are the unit of work handed out to the worker processes.
+    consit_codes = {
+        "static": _group_codes(compiled_df, id_cols),
+        "annual": _group_codes(compiled_df, id_cols + ["report_date"]),
+    }
+    if num_workers > 1:
+        harvested = _harvest_columns_in_processes(
+            harvest_cols, compiled_df, consit_codes, num_workers, **harvest_kwargs
         )
-
-        # pull the correct values out of the df and merge w/ the plant ids
-        col_correct_df = col_df[col_df[f"{col}_is_consistent"]].drop_duplicates(
-            subset=(cols_to_consit + [f"{col}_is_consistent"])
+    else:
+        harvested = (
+            _harvest_column(col, compiled_df, consit_codes, **harvest_kwargs)
+            for col in harvest_cols
         )
-
-        # we need this to be an empty df w/ columns bc we are going to use it
-        if col_correct_df.empty:
-            col_correct_df = pd.DataFrame(columns=col_df.columns)
-
+    # merge the harvested values in a fixed column order, whichever way they were
+    # computed, so the entity tables don't depend on the number of workers.
+    for col, (clean_df, col_df, ratio, wrongos, total) in zip(
+        harvest_cols, harvested, strict=True
+    ):
         if col in static_cols:
-            clean_df = entity_id_df.merge(col_correct_df, on=id_cols, how="left")
-            clean_df = clean_df[id_cols + [col]]
             entity_df = entity_df.merge(clean_df, on=id_cols)
-
-        if col in annual_cols:
-            clean_df = annual_id_df.merge(
-                col_correct_df, on=(id_cols + ["report_date"]), how="left"
-            )
-            clean_df = clean_df[id_cols + ["report_date", col]]
+        elif col in annual_cols:
             annual_df = annual_df.merge(clean_df, on=(id_cols + ["report_date"]))
 
-        # get the still dirty records by using the cleaned ids w/null values
-        # we need the plants that have no 'correct' value so
-        # we can't just use the col_df records when the consistency is not True
-        dirty_df = col_df.merge(clean_df[clean_df[col].isnull()][id_cols])
-
-        if col in special_case_cols:
-            clean_df = special_case_cols[col][0](
-                dirty_df,
-                clean_df,
-                entity_id_df,
-                id_cols,
-                col,
-                cols_to_consit,
-                special_case_cols[col][1],
-            )
-            if col in static_cols:
-                clean_df = clean_df[id_cols + [col]]
-                entity_df = entity_df.drop(columns=[col]).merge(clean_df, on=id_cols)
-            elif col in annual_cols:
-                raise AssertionError(
-                    "Method currenty not configured to work with annual values."
-                )
-
         if debug:
             col_dfs[col] = col_df
         # this next section is used to print and test whether the harvested
         # records are consistent enough
-        total = len(col_df.drop_duplicates(subset=cols_to_consit))
-        # if the total is 0, the ratio will error, so assign null values.
         if total == 0:
-            ratio = np.nan
-            wrongos = np.nan
             logger.debug(f"       Zero records found for {col}")
         if total > 0:
-            ratio = (
-                len(
-                    col_df[(col_df[f"{col}_is_consistent"])].drop_duplicates(
-                        subset=cols_to_consit
-                    )
-                )
-                / total
-            )
-            wrongos = (1 - ratio) * total
             logger.debug(
                 f"       Ratio: {ratio:.3}  "
                 f"Wrongos: {wrongos:.5}  "
@@ -1269,6 +1454,14 @@ def harvested_entity_asset_factory(
                     "produce additional debugging output."
                 ),
             ),
+            "num_workers": Field(
+                int,
+                default_value=1,
+                description=(
+                    "Number of processes to spread the harvested columns across. "
+                    "If 1, all columns are harvested in the asset's own process."
+                ),
+            ),
         },
         required_resource_keys={"dataset_settings"},
         name=f"harvested_{entity.value}_eia",
@@ -1280,7 +1473,11 @@ def harvested_entity_asset_factory(
         debug = context.op_config["debug"]
 
         entity_df, annual_df, _col_dfs = harvest_entity_tables(
-            entity, clean_dfs, debug=debug, eia_settings=eia_settings
+            entity,
+            clean_dfs,
+            debug=debug,
+            eia_settings=eia_settings,
+            num_workers=context.op_config["num_workers"],
         )
 
         return (
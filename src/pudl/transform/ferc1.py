@@ -20,6 +20,7 @@ from typing import Annotated, Any, Literal, Self
 
 import numpy as np
 import pandas as pd
+import scipy.sparse
 import sqlalchemy as sa
 from dagster import AssetIn, AssetsDefinition, asset
 from pandas.core.groupby import DataFrameGroupBy
@@ -35,6 +36,7 @@ from pudl.transform.classes import (
     InvalidRows,
     RenameColumns,
     TableTransformParams,
+    TransformCheckpointCache,
     TransformParams,
     cache_df,
     enforce_snake_case,
@@ -923,6 +925,9 @@ class ReconcileTableCalculations(TransformParams):
     """For the subdimension calculations, how to merge valiate when merging the data (left)
     onto the calculation components (right)."""
 
+    calculation_engine: Literal["merge", "sparse"] = "merge"
+    """How to evaluate the calculations in :func:`calculate_values_from_components`."""
+
 
 def reconcile_table_calculations(
     df: pd.DataFrame,
@@ -1015,6 +1020,7 @@ def reconcile_table_calculations(
                 table_name=table_name,
                 is_subdimension=True,
                 calc_to_data_merge_validation=params.subdimension_merge_validation,
+                engine=params.calculation_engine,
             )[df.columns]
     calculated_df = reconcile_one_type_of_table_calculations(
         data=df,
@@ -1024,6 +1030,7 @@ def reconcile_table_calculations(
         group_metric_checks=params.group_metric_checks,
         table_name=table_name,
         is_subdimension=False,
+        engine=params.calculation_engine,
     )
     # Rename back to the original xbrl_factoid column name before returning:
     return calculated_df.rename(columns={"xbrl_factoid": xbrl_factoid_name})
@@ -1040,6 +1047,7 @@ def reconcile_one_type_of_table_calculations(
     calc_to_data_merge_validation: Literal[
         "one_to_many", "many_to_many"
     ] = "one_to_many",
+    engine: Literal["merge", "sparse"] = "merge",
 ) -> pd.DataFrame:
     """Calculate vales, run metric checks and add corrections.
 
@@ -1055,6 +1063,8 @@ def reconcile_one_type_of_table_calculations(
             (not including the ``_parent`` columns).
         value_col: label of the column in ``data`` that contains the values to apply the
             calculations to (typically ``dollar_value`` or ``ending_balance``).
+        engine: how to evaluate the calculations. See
+            :func:`calculate_values_from_components`.
     """
     if calculation_components.empty:
         return data
@@ -1065,6 +1075,7 @@ def reconcile_one_type_of_table_calculations(
             calc_idx=calc_idx,
             value_col=value_col,
             calc_to_data_merge_validation=calc_to_data_merge_validation,
+            engine=engine,
         )
         .pipe(
             check_calculation_metrics,
@@ -1163,6 +1174,7 @@ def calculate_values_from_components(
     calc_to_data_merge_validation: Literal[
         "one_to_many", "many_to_many"
     ] = "one_to_many",
+    engine: Literal["merge", "sparse"] = "merge",
 ) -> pd.DataFrame:
     """Apply calculations derived from XBRL metadata to reported XBRL data.
 
@@ -1178,6 +1190,82 @@ def calculate_values_from_components(
             (not including the ``_parent`` columns).
         value_col: label of the column in ``data`` that contains the values to apply the
             calculations to (typically ``dollar_value`` or ``ending_balance``).
+        calc_to_data_merge_validation: whether the calculation components may contain
+            more than one record for the same component.
+        engine: how to evaluate the calculations. ``merge`` merges the data onto the
+            calculation components and groups them by their parents. ``sparse``
+            evaluates every calculation in every utility-year with one sparse matrix
+            product (see :func:`_calculate_values_with_sparse_weights`), which is much
+            faster for large tables with many calculations.
+    """
+    if engine == "sparse":
+        calculated_df = _calculate_values_with_sparse_weights(
+            calculation_components=calculation_components,
+            data=data,
+            calc_idx=calc_idx,
+            value_col=value_col,
+            calc_to_data_merge_validation=calc_to_data_merge_validation,
+        )
+    elif engine == "merge":
+        calculated_df = _calculate_values_with_merge(
+            calculation_components=calculation_components,
+            data=data,
+            calc_idx=calc_idx,
+            value_col=value_col,
+            calc_to_data_merge_validation=calc_to_data_merge_validation,
+        )
+    else:
+        raise ValueError(f"Unknown calculation engine: {engine}")
+    # Force value_col to be a float to prevent any hijinks with calculating differences.
+    # Data types were very messy here, including pandas Float64 for the
+    # calculated_value columns which did not work with the np.isclose(). Not sure
+    # why these are cropping up.
+    calculated_df = calculated_df.convert_dtypes(convert_floating=False).astype(
+        {value_col: "float64", "calculated_value": "float64"}
+    )
+    # For all of these below, only assign values when the record is a calculated record
+    # Also, make sure we are filling nulls so we capture the differences when there are
+    # null values in the calculated or reported values.
+    # is_calc is all null when none of the calculations matched the data, which
+    # convert_dtypes() turns into Int64.
+    is_calc = (
+        calculated_df.is_calc.astype(pd.BooleanDtype())
+        .fillna(False)
+        .to_numpy(dtype=bool)
+    )
+    reported_value = calculated_df[value_col].to_numpy()
+    calculated_value = calculated_df.calculated_value.to_numpy()
+    diff = np.where(is_calc, reported_value - np.nan_to_num(calculated_value), np.nan)
+    abs_diff = np.where(is_calc & (diff != 0.0), np.abs(diff), np.nan)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rel_diff = np.where(
+            is_calc & (reported_value != 0.0),
+            np.abs(abs_diff / reported_value),
+            np.nan,
+        )
+    calculated_df = calculated_df.assign(
+        is_calc=pd.array(is_calc, dtype=pd.BooleanDtype()),
+        diff=diff,
+        abs_diff=abs_diff,
+        rel_diff=rel_diff,
+    )
+    # Uniformity here helps keep the error checking functions simpler:
+    calculated_df["reported_value"] = calculated_df[value_col]
+    return calculated_df
+
+
+def _calculate_values_with_merge(
+    calculation_components: pd.DataFrame,
+    data: pd.DataFrame,
+    calc_idx: list[str],
+    value_col: str,
+    calc_to_data_merge_validation: Literal["one_to_many", "many_to_many"],
+) -> pd.DataFrame:
+    """Calculate values by merging the data onto the calculation components.
+
+    See :func:`calculate_values_from_components` for the arguments. Returns the data
+    with the ``calculated_value`` and ``is_calc`` columns added, and a record for each
+    calculated value that wasn't reported.
     """
     # Merge the reported data and the calculation component metadata to enable
     # validation of calculated values. Here the data table exploded is supplying the
@@ -1231,34 +1319,151 @@ def calculate_values_from_components(
         (calculated_df._merge == "right_only") & (calculated_df[value_col].notnull())
     ].empty
 
-    calculated_df = calculated_df.drop(columns=["_merge"])
-    # Force value_col to be a float to prevent any hijinks with calculating differences.
-    # Data types were very messy here, including pandas Float64 for the
-    # calculated_value columns which did not work with the np.isclose(). Not sure
-    # why these are cropping up.
-    calculated_df = calculated_df.convert_dtypes(convert_floating=False).astype(
-        {value_col: "float64", "calculated_value": "float64"}
+    return calculated_df.drop(columns=["_merge"])
+
+
+def _calculate_values_with_sparse_weights(
+    calculation_components: pd.DataFrame,
+    data: pd.DataFrame,
+    calc_idx: list[str],
+    value_col: str,
+    calc_to_data_merge_validation: Literal["one_to_many", "many_to_many"],
+) -> pd.DataFrame:
+    """Calculate values with a sparse matrix of calculation component weights.
+
+    Every distinct ``calc_idx`` value among the data, the calculation components and
+    their parents is numbered, as is every utility-year in the data. The calculation
+    components become a sparse (parent x component) matrix of weights, and the data a
+    sparse (component x utility-year) matrix of values, so that the calculated value of
+    every parent in every utility-year is given by their product. The number of
+    reported and of non-null values behind each calculated value are found the same
+    way, to distinguish calculations with no components in the data from calculations
+    whose components are all null.
+
+    See :func:`calculate_values_from_components` for the arguments. Returns the data
+    with the ``calculated_value`` and ``is_calc`` columns added, and a record for each
+    calculated value that wasn't reported.
+    """
+    block_idx = ["utility_id_ferc1", "report_year"]
+    if calc_to_data_merge_validation == "one_to_many" and (
+        calculation_components.duplicated(calc_idx).any()
+    ):
+        raise pd.errors.MergeError(
+            "Merge failed, duplicated merge keys in left dataset:\n"
+            f"{calculation_components[calculation_components.duplicated(calc_idx, keep=False)]}"
+        )
+    # Number the nodes of the calculations, treating nulls as values like merge does.
+    nodes = pd.concat(
+        [
+            data[calc_idx],
+            calculation_components[calc_idx],
+            calculation_components[[f"{col}_parent" for col in calc_idx]].set_axis(
+                calc_idx, axis="columns"
+            ),
+        ],
+        ignore_index=True,
     )
-    # For all of these below, only assign values when the record is a calculated record
-    # Also, make sure we are filling nulls so we capture the differences when there are
-    # null values in the calculated or reported values.
-    calculated_df = calculated_df.astype({"is_calc": pd.BooleanDtype()}).assign(
-        is_calc=lambda x: x.is_calc.fillna(False),
-        diff=lambda x: np.where(
-            x.is_calc, x[value_col] - x.calculated_value.fillna(0), np.nan
-        ),
-        abs_diff=lambda x: np.where(
-            x.is_calc & (x["diff"] != 0.0), abs(x["diff"]), np.nan
-        ),
-        rel_diff=lambda x: np.where(
-            x.is_calc & (x[value_col] != 0.0),
-            abs(x.abs_diff / x[value_col]),
-            np.nan,
-        ),
+    node_ids = nodes.groupby(calc_idx, dropna=False, sort=False).ngroup().to_numpy()
+    data_nodes, child_nodes, parent_nodes = np.split(
+        node_ids, [len(data), len(data) + len(calculation_components)]
+    )
+    block_ids = data.groupby(block_idx, dropna=False, sort=False).ngroup().to_numpy()
+    n_nodes = node_ids.max(initial=-1) + 1
+    n_blocks = block_ids.max(initial=-1) + 1
+
+    data_keys = data_nodes.astype(np.int64) * n_blocks + block_ids
+    if len(np.unique(data_keys)) < len(data_keys):
+        raise pd.errors.MergeError(
+            f"Merge keys are not unique in left dataset; not a one-to-one merge:\n"
+            f"{data[pd.Series(data_keys).duplicated(keep=False).to_numpy()]}"
+        )
+
+    def _sparse(values, rows, cols, shape) -> scipy.sparse.csr_array:
+        return scipy.sparse.csr_array(
+            (np.asarray(values, dtype=float), (rows, cols)), shape=shape
+        )
+
+    weights = _sparse(
+        calculation_components.weight.to_numpy(dtype=float, na_value=np.nan),
+        parent_nodes,
+        child_nodes,
+        (n_nodes, n_nodes),
+    )
+    components = _sparse(
+        np.ones(len(calculation_components)),
+        parent_nodes,
+        child_nodes,
+        (n_nodes, n_nodes),
+    )
+    values = data[value_col].to_numpy(dtype=float, na_value=np.nan)
+    is_reported = ~np.isnan(values)
+    # Count each reported component of each calculation, whether or not it is null.
+    n_components = (
+        components
+        @ _sparse(np.ones(len(data)), data_nodes, block_ids, (n_nodes, n_blocks))
+    ).tocoo()
+    n_components.sum_duplicates()
+    calc_nodes, calc_blocks = n_components.coords
+    calc_keys = calc_nodes.astype(np.int64) * n_blocks + calc_blocks
+
+    def _lookup(product: scipy.sparse.csr_array) -> np.ndarray:
+        """Look up the calculated values in a product, which may drop zeros."""
+        product = product.tocoo()
+        if product.nnz == 0 or len(calc_keys) == 0:
+            return np.zeros(len(calc_keys))
+        product.sum_duplicates()
+        rows, cols = product.coords
+        keys = rows.astype(np.int64) * n_blocks + cols
+        positions = np.searchsorted(keys, calc_keys).clip(max=len(keys) - 1)
+        return np.where(keys[positions] == calc_keys, product.data[positions], 0.0)
+
+    n_values = _lookup(
+        components @ _sparse(is_reported, data_nodes, block_ids, (n_nodes, n_blocks))
+    )
+    calc_values = _lookup(
+        weights
+        @ _sparse(
+            np.where(is_reported, values, 0.0),
+            data_nodes,
+            block_ids,
+            (n_nodes, n_blocks),
+        )
+    )
+    calculated_value = np.where(n_values > 0, calc_values, np.nan)
+
+    data_calcs = pd.Index(calc_keys).get_indexer(data_keys)
+    is_data_calc = data_calcs >= 0
+    data_calculated_value = np.full(len(data), np.nan)
+    data_calculated_value[is_data_calc] = calculated_value[data_calcs[is_data_calc]]
+    unreported = pd.Index(data_keys).get_indexer(calc_keys) < 0
+    node_first_rows = np.unique(node_ids, return_index=True)[1]
+    block_first_rows = np.unique(block_ids, return_index=True)[1]
+    unreported_calcs = pd.concat(
+        [
+            nodes.iloc[node_first_rows[calc_nodes[unreported]]].reset_index(drop=True),
+            data[block_idx]
+            .iloc[block_first_rows[calc_blocks[unreported]]]
+            .reset_index(drop=True),
+        ],
+        axis="columns",
+    ).assign(calculated_value=calculated_value[unreported], is_calc=True)
+    # Order the records by their primary keys, like the outer merge does.
+    return (
+        pd.concat(
+            [
+                data.assign(
+                    calculated_value=data_calculated_value,
+                    is_calc=pd.array(
+                        np.where(is_data_calc, True, None), dtype="object"
+                    ),
+                ),
+                unreported_calcs,
+            ],
+            ignore_index=True,
+        )
+        .sort_values(calc_idx + block_idx, na_position="last", kind="stable")
+        .reset_index(drop=True)
     )
-    # Uniformity here helps keep the error checking functions simpler:
-    calculated_df["reported_value"] = calculated_df[value_col]
-    return calculated_df
 
 
 def check_calculation_metrics_by_group(
@@ -1917,12 +2122,18 @@ class Ferc1AbstractTableTransformer(AbstractTableTransformer):
         params: TableTransformParams | None = None,
         cache_dfs: bool = False,
         clear_cached_dfs: bool = True,
+        checkpoint_cache: TransformCheckpointCache | None = None,
+        cache_dfs_mode: Literal["copy", "arrow", "cow"] = "copy",
+        cache_dfs_max_bytes: int | None = None,
     ) -> None:
         """Augment inherited initializer to store XBRL metadata in the class."""
         super().__init__(
             params=params,
             cache_dfs=cache_dfs,
             clear_cached_dfs=clear_cached_dfs,
+            checkpoint_cache=checkpoint_cache,
+            cache_dfs_mode=cache_dfs_mode,
+            cache_dfs_max_bytes=cache_dfs_max_bytes,
         )
         if xbrl_metadata_json:
             xbrl_metadata_converted = self.convert_xbrl_metadata_json_to_df(
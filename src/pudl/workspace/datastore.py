@@ -6,9 +6,11 @@ import json
 import pathlib
 import re
 import sys
+import tempfile
 import zipfile
 from collections import defaultdict
 from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Annotated, Any, Self
 from urllib.parse import ParseResult, urlparse
@@ -91,13 +93,30 @@ class DatapackageDescriptor:
 
     def validate_checksum(self, name: str, content: str) -> bool:
         """Returns True if content matches checksum for given named resource."""
-        expected_checksum = self._get_resource_metadata(name)["hash"]
         m = hashlib.md5()  # noqa: S324 Unfortunately md5 is required by Zenodo
         m.update(content)
-        if m.hexdigest() != expected_checksum:
+        self.validate_digest(name, m.hexdigest())
+
+    def validate_file_checksum(self, name: str, path: Path) -> None:
+        """Raise ChecksumMismatchError if a file doesn't match the named resource.
+
+        The file is hashed incrementally, so its contents are never fully read into
+        memory.
+        """
+        with path.open("rb") as f:
+            self.validate_digest(name, hashlib.file_digest(f, "md5").hexdigest())
+
+    def get_resource_checksum(self, name: str) -> str:
+        """Returns the md5 checksum of the named resource."""
+        return self._get_resource_metadata(name)["hash"]
+
+    def validate_digest(self, name: str, md5_hexdigest: str) -> None:
+        """Raise ChecksumMismatchError if an md5 digest doesn't match named resource."""
+        expected_checksum = self.get_resource_checksum(name)
+        if md5_hexdigest != expected_checksum:
             raise ChecksumMismatchError(
                 f"Checksum for resource {name} does not match."
-                f"Expected {expected_checksum}, got {m.hexdigest()}"
+                f"Expected {expected_checksum}, got {md5_hexdigest}"
             )
 
     def _matches(self, res: dict, **filters: Any):
@@ -301,6 +320,79 @@ class ZenodoFetcher:
         desc.validate_checksum(res.name, content)
         return content
 
+    def download_resource(
+        self: Self,
+        res: PudlResourceKey,
+        path: Path,
+        chunk_size: int = 2**20,
+        desc: DatapackageDescriptor | None = None,
+    ) -> None:
+        """Given resource key, stream contents of the file from zenodo to disk.
+
+        The response is written to ``path`` in chunks of ``chunk_size`` bytes, and
+        its checksum is computed incrementally as it arrives, so the resource never
+        has to fit in memory. If ``path`` already holds the beginning of the
+        resource (e.g. from an interrupted download) only the remaining bytes are
+        requested.
+
+        Args:
+            res: the resource to download.
+            path: the local file to write the resource to.
+            chunk_size: number of bytes to read and write at a time.
+            desc: datapackage descriptor of the resource's dataset. Retrieved from
+                zenodo if not provided.
+
+        Raises:
+            ChecksumMismatchError: if the downloaded file doesn't match the checksum
+                recorded in the datapackage descriptor. The file is deleted, so the
+                next attempt starts from scratch.
+            ValueError: if the resource could not be downloaded.
+        """
+        if desc is None:
+            desc = self.get_descriptor(res.dataset)
+        url = desc.get_resource_path(res.name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        offset = path.stat().st_size if path.exists() else 0
+        if offset:
+            with path.open("rb") as f:
+                md5 = hashlib.file_digest(f, "md5")
+            headers = {"Range": f"bytes={offset}-"}
+            logger.info(f"Resuming download of {url} from byte {offset}")
+        else:
+            md5 = hashlib.md5()  # noqa: S324 Unfortunately md5 is required by Zenodo
+            headers = {}
+            logger.info(f"Streaming {url} from zenodo")
+
+        with self.http.get(
+            url, headers=headers, stream=True, timeout=self.timeout
+        ) as response:
+            if response.status_code == requests.codes.partial_content:
+                mode = "ab"
+            elif response.status_code == requests.codes.ok:
+                # Server ignored the range request, so start over from the beginning.
+                mode = "wb"
+                md5 = hashlib.md5()  # noqa: S324
+            elif (
+                offset
+                and response.status_code
+                == requests.codes.requested_range_not_satisfiable
+            ):
+                # The previous attempt already downloaded the whole file.
+                mode = None
+            else:
+                raise ValueError(f"Could not download {url}: {response.text}")
+            if mode is not None:
+                with path.open(mode) as f:
+                    for chunk in response.iter_content(chunk_size=chunk_size):
+                        f.write(chunk)
+                        md5.update(chunk)
+        try:
+            desc.validate_digest(res.name, md5.hexdigest())
+        except ChecksumMismatchError:
+            path.unlink(missing_ok=True)
+            raise
+        logger.debug(f"Successfully downloaded {url} to {path}")
+
 
 class Datastore:
     """Handle connections and downloading of Zenodo Source archives."""
@@ -325,10 +417,15 @@ class Datastore:
         """
         self._cache = resource_cache.LayeredCache()
         self._datapackage_descriptors: dict[str, DatapackageDescriptor] = {}
+        # (mtime, size) of local files whose checksums have already been verified
+        self._verified_files: dict[Path, tuple[int, int]] = {}
+        # Where interrupted downloads are kept so that they can be resumed later
+        self._partial_download_dir: Path | None = None
 
         if local_cache_path:
             logger.info(f"Adding local cache layer at {local_cache_path}")
             self._cache.add_cache_layer(resource_cache.LocalFileCache(local_cache_path))
+            self._partial_download_dir = Path(local_cache_path) / ".partial"
         if gcs_cache_path:
             try:
                 logger.info(f"Adding GCS cache layer at {gcs_cache_path}")
@@ -402,6 +499,62 @@ class Datastore:
                 self._cache.add(res, contents)
                 yield (res, contents)
 
+    def prefetch_resources(
+        self,
+        dataset: str,
+        max_workers: int = 4,
+        chunk_size: int = 2**20,
+        **filters: Any,
+    ) -> list[PudlResourceKey]:
+        """Concurrently add all matching resources to the closest writable cache.
+
+        Resources that are not yet cached anywhere are streamed from Zenodo straight
+        to disk by a pool of ``max_workers`` threads, verifying checksums as the
+        data arrives. Downloads that are interrupted are kept in a ``.partial``
+        directory under the local cache and resumed on the next attempt. Resources
+        that are already optimally cached are skipped.
+
+        Args:
+            dataset: name of the dataset to query.
+            max_workers: maximum number of resources to retrieve at the same time.
+            chunk_size: number of bytes to read from the network and write to disk at
+                a time.
+            filters (key=val): only retrieve resources that match the key-value mapping
+                in their metadata["parts"].
+
+        Returns:
+            Keys of the resources that were added to the cache.
+        """
+        desc = self.get_datapackage_descriptor(dataset)
+        to_fetch = []
+        for res in desc.get_resources(**filters):
+            if self._cache.is_optimally_cached(res):
+                logger.info(f"{res} is already optimally cached.")
+                continue
+            to_fetch.append(res)
+        if not to_fetch:
+            return []
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            partial_dir = self._partial_download_dir or Path(tmp_dir)
+
+            def _fetch(res: PudlResourceKey) -> PudlResourceKey:
+                if self._cache.contains(res):
+                    logger.info(f"{res} was not optimally cached yet, adding.")
+                    self._cache.add(res, self._cache.get(res))
+                    return res
+                partial_path = partial_dir / res.get_local_path()
+                self._zenodo_fetcher.download_resource(
+                    res, partial_path, chunk_size=chunk_size, desc=desc
+                )
+                self._cache.add_file(res, partial_path)
+                partial_path.unlink(missing_ok=True)
+                logger.info(f"Retrieved {res} from zenodo.")
+                return res
+
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                return list(executor.map(_fetch, to_fetch))
+
     def remove_from_cache(self, res: PudlResourceKey) -> None:
         """Remove given resource from the associated cache."""
         self._cache.delete(res)
@@ -430,6 +583,76 @@ class Datastore:
         )
         return zipfile.ZipFile(resource)
 
+    def get_unique_resource_key(self, dataset: str, **filters: Any) -> PudlResourceKey:
+        """Returns key of a resource assuming there is exactly one that matches."""
+        desc = self.get_datapackage_descriptor(dataset)
+        matches = list(desc.get_resources(**filters))
+        if not matches:
+            raise KeyError(f"No resources found for {dataset}: {filters}")
+        if len(matches) > 1:
+            raise KeyError(f"Multiple resources found for {dataset}: {filters}")
+        return matches[0]
+
+    def get_unique_resource_checksum(self, dataset: str, **filters: Any) -> str:
+        """Returns the md5 checksum of a resource assuming there is exactly one match.
+
+        The checksum is looked up in the datapackage descriptor, so the resource itself
+        is not retrieved.
+        """
+        res = self.get_unique_resource_key(dataset, **filters)
+        desc = self.get_datapackage_descriptor(dataset)
+        return desc.get_resource_checksum(res.name)
+
+    def _verify_local_file(self, res: PudlResourceKey, path: Path) -> None:
+        """Verify the checksum of a locally cached resource file.
+
+        Verified files are remembered by their modification time and size, so each
+        file is only hashed once unless it changes on disk.
+        """
+        stat = path.stat()
+        if self._verified_files.get(path) == (stat.st_mtime_ns, stat.st_size):
+            return
+        desc = self.get_datapackage_descriptor(res.dataset)
+        desc.validate_file_checksum(res.name, path)
+        self._verified_files[path] = (stat.st_mtime_ns, stat.st_size)
+
+    def open_zipfile_resource(
+        self, dataset: str, verify_checksum: bool = False, **filters: Any
+    ) -> zipfile.ZipFile:
+        """Retrieves unique resource and opens it as a file-backed ZipFile.
+
+        Unlike :meth:`get_zipfile_resource`, a resource in the local file cache is
+        read directly from disk on demand, rather than being loaded into memory in its
+        entirety. A resource that isn't cached locally yet is retrieved and added to
+        the cache first. If there's no local cache layer at all, the resource is held
+        in memory, as with :meth:`get_zipfile_resource`.
+
+        Args:
+            dataset: name of the dataset to query.
+            verify_checksum: if True, check the local file against the checksum in the
+                datapackage descriptor before opening it. The result is remembered
+                based on the file's modification time and size.
+            filters (key=val): only return resources that match the key-value mapping
+                in their metadata["parts"].
+        """
+        res = self.get_unique_resource_key(dataset, **filters)
+        path = self._cache.get_local_path(res)
+        if path is None:
+            # get_resources() adds the resource to the closest writable cache layer.
+            content = self.get_unique_resource(dataset, **filters)
+            path = self._cache.get_local_path(res)
+            if path is None:
+                logger.info(
+                    f"Got resource {dataset=}, {filters=}, {len(content)} bytes; "
+                    "no local cache, turning into in-memory ZipFile"
+                )
+                return zipfile.ZipFile(io.BytesIO(content))
+            del content
+        if verify_checksum:
+            self._verify_local_file(res, path)
+        logger.info(f"Opening resource {dataset=}, {filters=} from {path}")
+        return zipfile.ZipFile(path)
+
     def get_zipfile_resources(
         self, dataset: str, **filters: Any
     ) -> Iterator[tuple[PudlResourceKey, zipfile.ZipFile]]:
@@ -494,17 +717,28 @@ def fetch_resources(
     partition: dict[str, int | str],
     gcs_cache_path: str,
     bypass_local_cache: bool,
+    max_workers: int = 1,
 ) -> None:
-    """Retrieve all matching resources and store them in the cache."""
+    """Retrieve all matching resources and store them in the cache.
+
+    If ``max_workers`` is greater than 1, resources are downloaded concurrently and
+    streamed to disk using :meth:`Datastore.prefetch_resources`.
+    """
     for single_ds in datasets:
-        for res, contents in dstore.get_resources(
-            single_ds, skip_optimally_cached=True, **partition
-        ):
-            logger.info(f"Retrieved {res}.")
-            # If the gcs_cache_path is specified and we don't want
-            # to bypass the local cache, populate the local cache.
-            if gcs_cache_path and not bypass_local_cache:
-                dstore._cache.add(res, contents)
+        if max_workers > 1:
+            for res in dstore.prefetch_resources(
+                single_ds, max_workers=max_workers, **partition
+            ):
+                logger.info(f"Retrieved {res}.")
+        else:
+            for res, contents in dstore.get_resources(
+                single_ds, skip_optimally_cached=True, **partition
+            ):
+                logger.info(f"Retrieved {res}.")
+                # If the gcs_cache_path is specified and we don't want
+                # to bypass the local cache, populate the local cache.
+                if gcs_cache_path and not bypass_local_cache:
+                    dstore._cache.add(res, contents)
 
 
 def _parse_key_values(
@@ -591,6 +825,15 @@ def _parse_key_values(
         "project to pay data egress costs."
     ),
 )
+@click.option(
+    "--max-workers",
+    type=click.IntRange(min=1),
+    default=1,
+    help=(
+        "Number of resources to download concurrently. If greater than 1, resources "
+        "are streamed directly to disk and interrupted downloads are resumed."
+    ),
+)
 @click.option(
     "--logfile",
     help="If specified, write logs to this file.",
@@ -614,6 +857,7 @@ def pudl_datastore(
     partition: dict[str, int | str],
     gcs_cache_path: str,
     bypass_local_cache: bool,
+    max_workers: int,
     logfile: pathlib.Path,
     loglevel: str,
 ):
@@ -638,6 +882,10 @@ def pudl_datastore(
     List the available partitions in the EIA-860 and EIA-923 datasets:
 
     pudl_datastore --dataset eia860 --dataset eia923 --list-partitions
+
+    Download all datasets, fetching up to 8 files at a time:
+
+    pudl_datastore --max-workers 8
     """
     pudl.logging_helpers.configure_root_logger(logfile=logfile, loglevel=loglevel)
 
@@ -664,6 +912,7 @@ def pudl_datastore(
             partition=partition,
             gcs_cache_path=gcs_cache_path,
             bypass_local_cache=bypass_local_cache,
+            max_workers=max_workers,
         )
 
     return 0
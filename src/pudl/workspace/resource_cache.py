@@ -1,5 +1,6 @@
 """Implementations of datastore resource caches."""
 
+import shutil
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Any, NamedTuple
@@ -72,6 +73,14 @@ class AbstractCache(ABC):
     def add(self, resource: PudlResourceKey, content: bytes) -> None:
         """Adds resource to the cache and sets the content."""
 
+    def add_file(self, resource: PudlResourceKey, path: Path) -> None:
+        """Adds resource to the cache with the contents of a local file.
+
+        Caches may move the file into place rather than copying it, so the caller
+        should not rely on the file still existing at ``path`` afterwards.
+        """
+        self.add(resource, path.read_bytes())
+
     @abstractmethod
     def delete(self, resource: PudlResourceKey) -> None:
         """Removes the resource from cache."""
@@ -80,6 +89,13 @@ class AbstractCache(ABC):
     def contains(self, resource: PudlResourceKey) -> bool:
         """Returns True if the resource is present in the cache."""
 
+    def get_local_path(self, resource: PudlResourceKey) -> Path | None:
+        """Returns path to a local file holding the resource, if there is one.
+
+        Caches that do not store their contents on the local filesystem return None.
+        """
+        return None
+
 
 class LocalFileCache(AbstractCache):
     """Simple key-value store mapping PudlResourceKeys to ByteIO contents."""
@@ -109,6 +125,16 @@ class LocalFileCache(AbstractCache):
         with path.open("wb") as file:
             file.write(content)
 
+    def add_file(self, resource: PudlResourceKey, path: Path):
+        """Adds (or updates) resource to the cache by moving a file into place."""
+        logger.debug(f"Moving {path} to {self._resource_path(resource)}")
+        if self.is_read_only():
+            logger.debug(f"Read only cache: ignoring set({resource})")
+            return
+        dest = self._resource_path(resource)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        shutil.move(path, dest)
+
     def delete(self, resource: PudlResourceKey):
         """Deletes resource from the cache."""
         if self.is_read_only():
@@ -120,6 +146,11 @@ class LocalFileCache(AbstractCache):
         """Returns True if resource is present in the cache."""
         return self._resource_path(resource).exists()
 
+    def get_local_path(self, resource: PudlResourceKey) -> Path | None:
+        """Returns path to the cached file, or None if the resource isn't cached."""
+        path = self._resource_path(resource)
+        return path if path.exists() else None
+
 
 class GoogleCloudStorageCache(AbstractCache):
     """Implements file cache backed by Google Cloud Storage bucket."""
@@ -158,6 +189,11 @@ class GoogleCloudStorageCache(AbstractCache):
         logger.debug(f"Adding {resource} to {self._blob.__name__}")
         return self._blob(resource).upload_from_string(value)
 
+    def add_file(self, resource: PudlResourceKey, path: Path):
+        """Adds (or updates) resource to the cache by uploading a local file."""
+        logger.debug(f"Uploading {path} as {resource} to {self._blob.__name__}")
+        return self._blob(resource).upload_from_filename(str(path))
+
     def delete(self, resource: PudlResourceKey):
         """Deletes resource from the cache."""
         self._blob(resource).delete()
@@ -225,6 +261,18 @@ class LayeredCache(AbstractCache):
             )
             break
 
+    def add_file(self, resource: PudlResourceKey, path: Path):
+        """Adds (or replaces) resource into the cache with the contents of a file."""
+        if self.is_read_only():
+            logger.debug(f"Read only cache: ignoring set({resource})")
+            return
+        for cache_layer in self._caches:
+            if cache_layer.is_read_only():
+                continue
+            logger.debug(f"Adding {resource} to cache {cache_layer.__class__.__name__}")
+            cache_layer.add_file(resource, path)
+            break
+
     def delete(self, resource: PudlResourceKey):
         """Removes resource from the cache if the cache is not in the read_only mode."""
         if self.is_read_only():
@@ -247,6 +295,14 @@ class LayeredCache(AbstractCache):
         logger.debug(f"contains: {resource} not found in layered cache.")
         return False
 
+    def get_local_path(self, resource: PudlResourceKey) -> Path | None:
+        """Returns path to the resource in the first layer that stores it locally."""
+        for cache in self._caches:
+            path = cache.get_local_path(resource)
+            if path is not None:
+                return path
+        return None
+
     def is_optimally_cached(self, resource: PudlResourceKey) -> bool:
         """Return True if resource is contained in the closest write-enabled layer."""
         for cache_layer in self._caches:
@@ -0,0 +1,167 @@
+"""Unit tests for the pudl.analysis.record_linkage.eia_ferc1_record_linkage module."""
+
+from unittest.mock import MagicMock
+
+import jellyfish
+import numpy as np
+import pandas as pd
+import pytest
+from splink.duckdb.linker import DuckDBLinker
+
+from pudl.analysis.record_linkage import eia_ferc1_record_linkage
+from pudl.analysis.record_linkage.eia_ferc1_record_linkage import (
+    ModelPredictionsConfig,
+    SplinkModelCache,
+    get_model_predictions,
+)
+
+PLANT_NAMES = ["alpha", "bravo station", "charlie", "delta power", "echo", "foxtrot"]
+UTILITY_NAMES = ["acme", "big utility", "coastal", "dixie"]
+
+
+def _fake_plants(prefix: str, n_records: int, seed: int) -> pd.DataFrame:
+    """Generate plant records with all of the columns used for matching."""
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame(
+        {
+            "record_id": [f"{prefix}{i}" for i in range(n_records)],
+            "report_year": rng.integers(2018, 2022, n_records),
+            "plant_name": rng.choice(PLANT_NAMES, n_records),
+            "utility_name": rng.choice(UTILITY_NAMES, n_records),
+            "fuel_type_code_pudl": rng.choice(["coal", "gas", "oil"], n_records),
+            "installation_year": pd.to_datetime(
+                rng.integers(1960, 2000, n_records).astype(str), format="%Y"
+            ),
+            "construction_year": pd.to_datetime(
+                rng.integers(1960, 2000, n_records).astype(str), format="%Y"
+            ),
+            "capacity_mw": rng.choice([10.0, 50.0, 100.0], n_records),
+            "net_generation_mwh": rng.choice([1e3, 5e3, 1e4], n_records),
+            "plant_id_pudl": rng.integers(1, 10, n_records),
+            "utility_id_pudl": rng.integers(1, 5, n_records),
+        }
+    )
+    df["plant_name_mphone"] = df.plant_name.map(jellyfish.metaphone)
+    df["utility_name_mphone"] = df.utility_name.map(jellyfish.metaphone)
+    return df
+
+
+@pytest.fixture
+def splink_inputs(monkeypatch):
+    """Fake EIA, FERC1 and training records, and a cheaper model training step."""
+    eia_df = _fake_plants("eia", 300, seed=1)
+    ferc_df = _fake_plants("ferc", 120, seed=2)
+    train_df = pd.DataFrame(
+        {
+            "record_id_l": eia_df.record_id[:30].to_numpy(),
+            "record_id_r": ferc_df.record_id[:30].to_numpy(),
+            "source_dataset_l": "eia_df",
+            "source_dataset_r": "ferc_df",
+            "clerical_match_score": 1,
+        }
+    )
+
+    # Splink only samples up to 1e4 pairs without salting, which needs several CPUs.
+    def _train_linker(linker, train_df):
+        linker.register_table(train_df, "training_labels", overwrite=True)
+        linker.estimate_u_using_random_sampling(max_pairs=1e4)
+        linker.estimate_m_from_pairwise_labels("training_labels")
+
+    train_linker = MagicMock(side_effect=_train_linker)
+    monkeypatch.setattr(eia_ferc1_record_linkage, "_train_linker", train_linker)
+    return eia_df, ferc_df, train_df, train_linker
+
+
+def _sort_preds(preds_df: pd.DataFrame) -> pd.DataFrame:
+    return preds_df.sort_values(["record_id_l", "record_id_r"]).reset_index(drop=True)
+
+
+def _predict_all_years(model, eia_df, ferc_df) -> pd.DataFrame:
+    """Predict the matches between all of the records at once."""
+    linker = DuckDBLinker(
+        [eia_df, ferc_df],
+        input_table_aliases=["eia_df", "ferc_df"],
+        settings_dict=model,
+    )
+    return linker.predict(threshold_match_probability=0.9).as_pandas_dataframe()
+
+
+def test_get_model_predictions_incremental(splink_inputs, tmp_path, monkeypatch):
+    """Only report years with changed records should be compared again."""
+    eia_df, ferc_df, train_df, train_linker = splink_inputs
+    monkeypatch.setenv("PUDL_SPLINK_CACHE", str(tmp_path))
+    compare = MagicMock(wraps=eia_ferc1_record_linkage._compare_report_years)
+    monkeypatch.setattr(eia_ferc1_record_linkage, "_compare_report_years", compare)
+    config = ModelPredictionsConfig(incremental=True)
+
+    first = get_model_predictions(config, eia_df, ferc_df, train_df, MagicMock())
+    assert train_linker.call_count == 1
+    assert compare.call_args.args[3] == [2018, 2019, 2020, 2021]
+    assert not first.empty
+    model = SplinkModelCache.from_env().get_model(
+        next(path.stem for path in tmp_path.glob("splink_model__*.json"))
+    )
+    pd.testing.assert_frame_equal(
+        _sort_preds(first),
+        _sort_preds(_predict_all_years(model, eia_df, ferc_df)),
+        check_dtype=False,
+    )
+
+    # A rerun on the same inputs reuses the model and all of the comparisons.
+    again = get_model_predictions(config, eia_df, ferc_df, train_df, MagicMock())
+    assert train_linker.call_count == 1
+    assert compare.call_count == 1
+    pd.testing.assert_frame_equal(_sort_preds(first), _sort_preds(again))
+
+    # Term frequencies are computed over all years, so changing a utility name in one
+    # year changes the match weights in every year, but only that year is compared.
+    changed_ferc_df = ferc_df.copy()
+    changed_ferc_df.loc[0, "utility_name"] = "eastern"
+    changed_year = changed_ferc_df.loc[0, "report_year"]
+    changed = get_model_predictions(
+        config, eia_df, changed_ferc_df, train_df, MagicMock()
+    )
+    assert train_linker.call_count == 1
+    assert compare.call_args.args[3] == [changed_year]
+    pd.testing.assert_frame_equal(
+        _sort_preds(changed),
+        _sort_preds(_predict_all_years(model, eia_df, changed_ferc_df)),
+        check_dtype=False,
+    )
+
+    # A new report year is compared on its own and linked with the existing model.
+    def _add_year(df: pd.DataFrame) -> pd.DataFrame:
+        new_df = df[df.report_year == 2021].assign(report_year=2022)
+        new_df["record_id"] = new_df.record_id + "_2022"
+        return pd.concat([df, new_df], ignore_index=True)
+
+    new_eia_df = _add_year(eia_df)
+    new_ferc_df = _add_year(changed_ferc_df)
+    new_year = get_model_predictions(
+        config, new_eia_df, new_ferc_df, train_df, MagicMock()
+    )
+    assert train_linker.call_count == 1
+    assert compare.call_count == 3
+    assert compare.call_args.args[3] == [2022]
+    assert (new_year.report_year_r == 2022).any()
+    pd.testing.assert_frame_equal(
+        _sort_preds(new_year),
+        _sort_preds(_predict_all_years(model, new_eia_df, new_ferc_df)),
+        check_dtype=False,
+    )
+
+
+def test_get_model_predictions_retrains_on_new_inputs(
+    splink_inputs, tmp_path, monkeypatch
+):
+    """Outside of incremental mode, changed inputs require a new model."""
+    eia_df, ferc_df, train_df, train_linker = splink_inputs
+    monkeypatch.setenv("PUDL_SPLINK_CACHE", str(tmp_path))
+    config = ModelPredictionsConfig()
+
+    get_model_predictions(config, eia_df, ferc_df, train_df, MagicMock())
+    get_model_predictions(config, eia_df, ferc_df, train_df, MagicMock())
+    assert train_linker.call_count == 1
+    get_model_predictions(config, eia_df.iloc[1:], ferc_df, train_df, MagicMock())
+    assert train_linker.call_count == 2
+    assert len(list(tmp_path.glob("splink_model__*.json"))) == 2
@@ -0,0 +1,75 @@
+"""Unit tests for the pudl.analysis.record_linkage.link_cross_year module."""
+
+import numpy as np
+import pandas as pd
+import pytest
+import scipy.sparse
+from sklearn.metrics import pairwise_distances
+
+from pudl.analysis.record_linkage.link_cross_year import (
+    DistanceMatrix,
+    PenalizeReportYearDistanceConfig,
+    get_average_distance_matrix,
+    get_cluster_distance_matrix,
+)
+
+RNG = np.random.default_rng(12)
+FEATURES = RNG.random((60, 4))
+ORIGINAL_DF = pd.DataFrame({"report_year": RNG.integers(2000, 2006, 60)})
+CONFIG = PenalizeReportYearDistanceConfig(distance_penalty=100.0, radius=0.4)
+
+
+def _dense_distances() -> np.ndarray:
+    """Compute the full penalized distance matrix the simple way."""
+    distances = pairwise_distances(FEATURES).astype("float32")
+    years = ORIGINAL_DF.report_year.to_numpy()
+    distances[years[:, None] == years[None, :]] = CONFIG.distance_penalty
+    np.fill_diagonal(distances, 0)
+    return distances
+
+
+@pytest.mark.parametrize("sparse_features", [False, True])
+def test_distance_matrix(sparse_features):
+    """Only penalized distances within the radius should be stored."""
+    features = scipy.sparse.csr_matrix(FEATURES) if sparse_features else FEATURES
+    distance_matrix = DistanceMatrix(features, ORIGINAL_DF, CONFIG)
+    expected = _dense_distances()
+    within_radius = expected <= CONFIG.radius
+
+    graph = distance_matrix.distance_matrix
+    assert scipy.sparse.issparse(graph)
+    assert graph.nnz == within_radius.sum()
+    np.testing.assert_allclose(
+        graph.toarray()[within_radius], expected[within_radius], rtol=1e-6
+    )
+    # Records from the same year are never neighbors.
+    rows, cols = graph.nonzero()
+    years = ORIGINAL_DF.report_year.to_numpy()
+    assert (years[rows] != years[cols]).all()
+
+    cluster_inds = np.array([3, 17, 42, 8])
+    np.testing.assert_allclose(
+        get_cluster_distance_matrix(distance_matrix, cluster_inds),
+        expected[np.ix_(cluster_inds, cluster_inds)],
+        rtol=1e-6,
+    )
+
+
+def test_get_average_distance_matrix():
+    """Average cluster distances should match a pairwise loop over the dense matrix."""
+    distance_matrix = DistanceMatrix(FEATURES, ORIGINAL_DF, CONFIG)
+    dense = _dense_distances()
+    cluster_groups = [np.array([5]), np.array([0, 1, 2]), np.arange(3, 60, 4)]
+
+    expected = np.zeros((3, 3))
+    for i, cluster_i in enumerate(cluster_groups):
+        for j, cluster_j in enumerate(cluster_groups[:i]):
+            expected[i, j] = expected[j, i] = dense[
+                np.ix_(cluster_i, cluster_j)
+            ].sum() / (len(cluster_i) + len(cluster_j))
+
+    np.testing.assert_allclose(
+        get_average_distance_matrix(distance_matrix, cluster_groups),
+        expected,
+        rtol=1e-6,
+    )
@@ -0,0 +1,65 @@
+"""Unit tests for the pudl.analysis.record_linkage.name_cleaner module."""
+
+import pandas as pd
+import pytest
+
+from pudl.analysis.record_linkage.name_cleaner import (
+    CompanyNameCleaner,
+    map_unique_values,
+)
+
+NAMES = pd.Series(
+    [
+        "The Acme Power Co., Inc.",
+        "Gas_Plant #2 (old)",
+        pd.NA,
+        "The Acme Power Co., Inc.",
+        "Smith & Sons LLC",
+        "Gas_Plant #2 (old)",
+    ],
+    index=[10, 11, 12, 13, 14, 15],
+    name="utility_name",
+    dtype="string",
+)
+
+
+def _upper_or_none(name: str | None) -> str | None:
+    """A picklable function to map over the names."""
+    return None if pd.isna(name) else name.upper()
+
+
+@pytest.mark.parametrize("num_workers", [1, 2])
+def test_map_unique_values(num_workers):
+    """Each unique value should be mapped once and the results aligned to the input."""
+    actual = map_unique_values(NAMES, _upper_or_none, num_workers=num_workers)
+    expected = NAMES.apply(_upper_or_none)
+    pd.testing.assert_series_equal(actual, expected)
+
+
+@pytest.mark.parametrize(
+    "cleaner",
+    [
+        CompanyNameCleaner(),
+        CompanyNameCleaner(legal_term_location=2, output_lettercase="title"),
+    ],
+)
+def test_clean_names(cleaner):
+    """Batch cleaning should match cleaning each name individually."""
+    expected = NAMES.apply(cleaner.get_clean_data)
+    pd.testing.assert_series_equal(cleaner.clean_names(NAMES), expected)
+    assert expected[10] == expected[13]
+    assert pd.isna(expected[12])
+
+    df = pd.DataFrame({"a": NAMES, "b": NAMES.iloc[::-1].to_numpy()}, index=NAMES.index)
+    pd.testing.assert_frame_equal(
+        cleaner.apply_name_cleaning(df),
+        pd.DataFrame({col: df[col].apply(cleaner.get_clean_data) for col in df}),
+    )
+
+
+def test_clean_names_rules_not_stale():
+    """Copies of a cleaner with different rules should not share compiled rules."""
+    cleaner = CompanyNameCleaner(normalize_legal_terms=False)
+    assert cleaner.get_clean_data("Acme 12 Co.") == "acme co"
+    copy = cleaner.model_copy(update={"cleaning_rules_list": ["remove_numbers"]})
+    assert copy.get_clean_data("Acme 12 Co.") == "acme co."
@@ -0,0 +1,83 @@
+"""Unit tests for the pudl.analysis.service_territory module."""
+
+from unittest.mock import MagicMock
+
+import geopandas as gpd
+import pandas as pd
+import shapely
+
+from pudl.analysis import service_territory
+from pudl.analysis.service_territory import add_geometries
+
+CENSUS_GDF = gpd.GeoDataFrame(
+    {
+        "geoid10": ["08001", "08003", "08005", "08007"],
+        "namelsad10": ["A County", "B County", "C County", "D County"],
+        "dp0010001": [10, 20, 30, 40],
+    },
+    geometry=[shapely.box(x, 0, x + 1, 1) for x in range(4)],
+    crs="EPSG:4326",
+)
+
+
+def _territory_counties(county_sets: dict[tuple[str, int], list[str]]) -> pd.DataFrame:
+    return pd.DataFrame(
+        [
+            {
+                "report_date": pd.Timestamp(report_date),
+                "utility_id_eia": utility_id,
+                "state": "CO",
+                "county": "x",
+                "state_id_fips": "08",
+                "county_id_fips": fips,
+            }
+            for (report_date, utility_id), counties in county_sets.items()
+            for fips in counties
+        ]
+    )
+
+
+def test_add_geometries_dissolves_each_county_set_once(tmp_path, monkeypatch):
+    """Territories sharing a set of counties should share one dissolved geometry."""
+    df = _territory_counties(
+        {
+            ("2020-01-01", 1): ["08001", "08003"],
+            ("2021-01-01", 1): ["08003", "08001", "08001"],
+            ("2021-01-01", 2): ["08005", "08007"],
+            ("2021-01-01", 3): ["99999"],
+        }
+    )
+    monkeypatch.setenv("PUDL_TERRITORY_CACHE", str(tmp_path))
+    dissolve = MagicMock(wraps=service_territory._dissolve_county_sets)
+    monkeypatch.setattr(service_territory, "_dissolve_county_sets", dissolve)
+
+    actual = add_geometries(
+        df, CENSUS_GDF, dissolve=True, dissolve_by=["report_date", "utility_id_eia"]
+    )
+    assert dissolve.call_args.args[0] == ["08001,08003", "08005,08007"]
+    assert actual.columns.tolist() == [
+        "report_date",
+        "utility_id_eia",
+        "geometry",
+        "population",
+        "area_km2",
+    ]
+    assert actual.crs == CENSUS_GDF.crs
+    assert actual.population.tolist() == [30, 30, 70, 0]
+    assert (
+        actual.geometry[:3]
+        .geom_equals(
+            gpd.GeoSeries([shapely.box(0, 0, 2, 1)] * 2 + [shapely.box(2, 0, 4, 1)])
+        )
+        .all()
+    )
+    # Counties without a Census geometry leave the territory without one.
+    assert actual.geometry[3] is None
+
+    # The dissolved geometries are reused from the cache by later runs.
+    cached = add_geometries(
+        df, CENSUS_GDF, dissolve=True, dissolve_by=["report_date", "utility_id_eia"]
+    )
+    assert dissolve.call_args.args[0] == []
+    pd.testing.assert_frame_equal(actual, cached)
+    assert len(list(tmp_path.glob("territory_geometries__*.parquet"))) == 1
@@ -184,6 +184,43 @@ def test_self_union():
     assert_geodataframe_equal(result_two, expected_two)
 
 
+def test_self_union_enclosed_gap():
+    """Gaps enclosed by the features, and disjoint features, are handled in one pass."""
+    gdf = GeoDataFrame(
+        {
+            "geometry": GeoSeries(
+                [
+                    Polygon([(0, 0), (3, 0), (3, 1), (0, 1)]),
+                    Polygon([(2, 0), (3, 0), (3, 3), (2, 3)]),
+                    Polygon([(0, 2), (3, 2), (3, 3), (0, 3)]),
+                    Polygon([(0, 0), (1, 0), (1, 3), (0, 3)]),
+                    Polygon([(5, 5), (6, 5), (6, 6), (5, 6)]),
+                ]
+            ),
+            "x": [0, 1, 2, 3, 4],
+        }
+    )
+    result = self_union(gdf)
+    # The unit square enclosed by the ring of features belongs to none of them.
+    assert (
+        result.intersection(Polygon([(1, 1), (2, 1), (2, 2), (1, 2)])).area.sum() == 0
+    )
+    np.testing.assert_array_equal(
+        result.area.groupby(result["x"]).sum(), gdf.area.to_numpy()
+    )
+    assert sorted(set(result.index)) == [
+        (0,),
+        (0, 1),
+        (0, 3),
+        (1,),
+        (1, 2),
+        (2,),
+        (2, 3),
+        (3,),
+        (4,),
+    ]
+
+
 def test_dissolve():
     """Test mergining of geometries and non-spatial attributes."""
     gdf = GeoDataFrame(
@@ -4,7 +4,11 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from pudl.analysis.state_demand import lookup_state
+import pudl.analysis.timeseries_cleaning
+from pudl.analysis.state_demand import (
+    impute_ferc714_hourly_demand_matrix,
+    lookup_state,
+)
 
 AK_FIPS = {"name": "Alaska", "code": "AK", "fips": "02"}
 
@@ -34,3 +38,36 @@ AK_FIPS = {"name": "Alaska", "code": "AK", "fips": "02"}
 def test_lookup_state(state: str | int, expected: dict[str, str | int]) -> None:
     """Check that various kinds of state lookups work."""
     assert lookup_state(state) == expected
+
+
+def test_impute_ferc714_hourly_demand_matrix_num_workers() -> None:
+    """Imputing years in a process pool should match imputing them one by one."""
+    rng = np.random.default_rng(seed=0)
+    index = pd.DatetimeIndex(
+        pd.date_range("2019-01-01", "2020-12-31 23:00", freq="h"), freq=None
+    )
+    hours = np.arange(len(index))
+    x = 1000 + 100 * np.sin(2 * np.pi * (hours[:, None] + np.arange(3)) / 24)
+    df = pd.DataFrame(
+        np.where(rng.random(x.shape) < 0.05, np.nan, x),
+        index=index,
+        columns=pd.Index([1, 2, 3], name="respondent_id_ferc714"),
+    )
+    # Respondents without data in a year are excluded from its imputation.
+    df.loc["2020", 3] = np.nan
+
+    expected = []
+    for _, gdf in df.groupby(df.index.year):
+        tsi = pudl.analysis.timeseries_cleaning.Timeseries(
+            gdf.dropna(axis=1, how="all")
+        )
+        expected.append(
+            tsi.to_dataframe(tsi.impute(method="tnn", seed=0, maxiter=5), copy=False)
+        )
+    expected = pd.concat(expected)
+    serial = impute_ferc714_hourly_demand_matrix(df, seed=0, maxiter=5)
+    pd.testing.assert_frame_equal(serial, expected)
+    parallel = impute_ferc714_hourly_demand_matrix(df, num_workers=2, seed=0, maxiter=5)
+    pd.testing.assert_frame_equal(parallel, expected)
+    assert parallel.loc["2019"].notna().all().all()
+    assert parallel.loc["2020", 3].isna().all()
@@ -107,3 +107,25 @@ def test_flags_and_imputes_anomalies(series_seed, anomalies_seed) -> None:
         fit = s.summarize_imputed(imputed, mask)
         # Mean MAPE (mean absolute percent error) is converging
         assert fit["mape"].mean() < fit0["mape"].mean()
+
+
+def test_impute_blocks() -> None:
+    """Blocks are imputed independently of each other, and of the number of blocks."""
+    x = simulate_series(seed=7088438834)
+    s = pudl.analysis.timeseries_cleaning.Timeseries(x)
+    mask = np.random.default_rng(seed=382046123).random(x.shape) < 0.05
+    # 20 periods don't divide evenly into 6 blocks, which leaves 5 blocks of 4.
+    imputed = s.impute(mask=mask, method="tnn", blocks=6, seed=0, maxiter=5)
+    for start in range(0, 20, 4):
+        block = pudl.analysis.timeseries_cleaning.Timeseries(
+            x[start * 24 : (start + 4) * 24]
+        )
+        np.testing.assert_array_equal(
+            imputed[start * 24 : (start + 4) * 24],
+            block.impute(
+                mask=mask[start * 24 : (start + 4) * 24],
+                method="tnn",
+                seed=0,
+                maxiter=5,
+            ),
+        )
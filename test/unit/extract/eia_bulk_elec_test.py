@@ -32,19 +32,43 @@ def elec_txt_dataframe(test_file_bytes) -> pd.DataFrame:
     return df
 
 
-def test__filter_for_fuel_receipts_costs_series(elec_txt_dataframe):
+def test__is_fuel_receipts_costs_series(elec_txt_dataframe):
     """Filter for only the desired data series."""
-    input_ = elec_txt_dataframe
-    expected = input_.iloc[
-        1:, :
-    ]  # row 0 should be filtered because it is not COST_BTU or RECEIPTS_BTU
-    actual = bulk._filter_for_fuel_receipts_costs_series(input_)
-    pd.testing.assert_frame_equal(actual, expected)
+    records = elec_txt_dataframe.to_dict(orient="records")
+    # row 0 should be filtered because it is not COST_BTU or RECEIPTS_BTU
+    assert [bulk._is_fuel_receipts_costs_series(rec) for rec in records] == [
+        False,
+        True,
+        True,
+        True,
+        True,
+    ]
+    # non-series objects don't have a series_id
+    assert not bulk._is_fuel_receipts_costs_series({"category_id": 0})
+
+
+def test__parse_dates():
+    """Annual, quarterly and monthly dates should all be parsed."""
+    dates = pd.Series(["2021", "2020Q1", "2020Q4", "202004", "2020-05-06"])
+    expected = pd.Series(
+        pd.to_datetime(
+            ["2021-01-01", "2020-01-01", "2020-10-01", "2020-04-01", "2020-05-06"]
+        )
+    )
+    pd.testing.assert_series_equal(bulk._parse_dates(dates), expected)
 
 
-def test__parse_data_column(elec_txt_dataframe):
-    """Convert a pd.Series of python lists to a dataframe."""
-    input_ = elec_txt_dataframe.iloc[[2, 4], :]  # only annual series for easier testing
+def test__extract_timeseries(test_file_bytes):
+    """Convert the nested data arrays into a single timeseries dataframe."""
+    zipped_buffer = BytesIO()
+    with ZipFile(zipped_buffer, mode="w") as archive:
+        # only annual series for easier testing
+        archive.writestr(
+            "elec.txt",
+            b"\n".join(
+                line for line in test_file_bytes.splitlines() if b'.A","name"' in line
+            ),
+        )
     expected = pd.DataFrame(
         {
             "series_id": [
@@ -67,11 +91,9 @@ def test__parse_data_column(elec_txt_dataframe):
             ],
         },
     ).convert_dtypes()
-    expected.loc[:, "series_id"] = expected.loc[:, "series_id"].astype(
-        "category", copy=False
-    )
+    expected["series_id"] = expected["series_id"].astype("category")
 
-    actual = bulk._parse_data_column(input_)
+    actual = bulk._extract(zipped_buffer)["timeseries"]
     pd.testing.assert_frame_equal(actual, expected)
 
 
@@ -1,6 +1,8 @@
 """Unit tests for pudl.extract.excel module."""
 
+import io
 import unittest
+import zipfile
 from unittest import mock as mock
 
 import pandas as pd
@@ -42,7 +44,7 @@ class FakeExtractor(excel.ExcelExtractor):
         """
         self.METADATA = excel.ExcelMetadata("test")
         self.BLACKLISTED_PAGES = ["shoes"]
-        super().__init__(ds=None)
+        super().__init__(ds=None, **kwargs)
 
     def load_source(self, page, **partition):
         """Returns fake file contents for given page and partition."""
@@ -99,6 +101,18 @@ class TestExtractor(unittest.TestCase):
         }
         assert expected_boxes == res["boxes"].to_dict()
 
+    @staticmethod
+    def test_extract_concurrently():
+        """Extracting partitions concurrently should give the same result."""
+        expected = FakeExtractor().extract(year=[2010, 2011])
+        for executor in ["thread", "process"]:
+            actual = FakeExtractor(max_workers=2, executor=executor).extract(
+                year=[2010, 2011]
+            )
+            assert list(actual) == list(expected)
+            for page, df in expected.items():
+                pd.testing.assert_frame_equal(actual[page], df)
+
     # @patch('pudl.extract.excel.pd.read_excel', _fake_data_frames)
     # def test_resulting_dataframes(self):
     #     """Checks that pages across years are merged and columns are translated."""
@@ -120,3 +134,59 @@ class TestExtractor(unittest.TestCase):
 
     # TODO(rousik@gmail.com): need to figure out how to test process_$x methods.
     # TODO(rousik@gmail.com): we should test that empty columns are properly added.
+
+
+class SheetCacheExtractor(excel.ExcelExtractor):
+    """Extractor that reads the test metadata's spreadsheets from a fake datastore."""
+
+    def __init__(self, *args, **kwargs):
+        """Use the test metadata."""
+        self.METADATA = excel.ExcelMetadata("test")
+        super().__init__(*args, **kwargs)
+
+
+def _fake_excel_datastore(checksum: str) -> mock.MagicMock:
+    """Build a mock datastore serving a zipped spreadsheet with books and boxes."""
+    xlsx = io.BytesIO()
+    with pd.ExcelWriter(xlsx) as writer:
+        # Raw spreadsheets often have columns of mixed types.
+        pd.DataFrame(
+            {"book_title": ["Tao Te Ching", "The Tao of Pooh"], "pages": [0, "unknown"]}
+        ).to_excel(writer, sheet_name="books", index=False)
+        pd.DataFrame({"composition": ["cardboard"], "size_inches": [10]}).to_excel(
+            writer, sheet_name="boxes", index=False
+        )
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("b-file.xlsx", xlsx.getvalue())
+    ds = mock.MagicMock()
+    ds.get_zipfile_resource.side_effect = lambda *args, **kwargs: zipfile.ZipFile(
+        io.BytesIO(archive.getvalue())
+    )
+    ds.get_unique_resource_checksum.return_value = checksum
+    return ds
+
+
+def test_excel_sheet_cache(tmp_path):
+    """Parsed sheets should be reused by later extractors until the archive changes."""
+    cache = excel.ExcelSheetCache(tmp_path)
+    ds = _fake_excel_datastore("abc")
+    expected = {
+        page: SheetCacheExtractor(ds, sheet_cache=cache).load_source(page, year=2010)
+        for page in ["books", "boxes"]
+    }
+    assert expected["books"].pages.tolist() == [0, "unknown"]
+    # The mixed-type sheet can't be stored as Feather.
+    assert len(list(tmp_path.glob("*.pkl"))) == 1
+    assert len(list(tmp_path.glob("*.feather"))) == 1
+
+    ds.get_zipfile_resource.reset_mock()
+    extractor = SheetCacheExtractor(ds, sheet_cache=cache)
+    for page, df in expected.items():
+        pd.testing.assert_frame_equal(extractor.load_source(page, year=2010), df)
+    ds.get_zipfile_resource.assert_not_called()
+
+    new_ds = _fake_excel_datastore("def")
+    SheetCacheExtractor(new_ds, sheet_cache=cache).load_source("books", year=2010)
+    new_ds.get_zipfile_resource.assert_called_once()
+    assert len(list(tmp_path.glob("*.pkl"))) == 2
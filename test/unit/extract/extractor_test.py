@@ -1,8 +1,14 @@
 import pandas as pd
 import pytest
-from dagster import build_op_context
+from dagster import build_op_context, materialize
 
-from pudl.extract.extractor import concat_pages, partitions_from_settings_factory
+from pudl.extract.extractor import (
+    GenericExtractor,
+    GenericMetadata,
+    concat_pages,
+    partitions_from_settings_factory,
+    raw_page_dfs_factory,
+)
 from pudl.settings import DatasetsSettings
 
 
@@ -39,3 +45,53 @@ def test_concat_pages():
             merged_dfs[page],
             pd.DataFrame({"df": [1, 2], "page": [page, page]}, index=[0, 1]),
         )
+
+
+class FakePageExtractor(GenericExtractor):
+    """Extractor that makes up one row of data for each EIA-930 page and partition."""
+
+    METADATA = GenericMetadata("eia930")
+    BLACKLISTED_PAGES = ["subregion"]
+
+    def source_filename(self, page, **partition):
+        return f"{page}.csv"
+
+    def load_source(self, page, **partition):
+        return pd.DataFrame({"page": [page], "partition": [partition["half_year"]]})
+
+    def extract(self, **partitions):
+        return {
+            page: self.load_source(page, **partitions)
+            for page in self._metadata.get_all_pages()
+            if page not in self.BLACKLISTED_PAGES
+        }
+
+
+def test_raw_page_dfs_factory():
+    """Each page should be concatenated across partitions into its own asset."""
+    dataset_settings = DatasetsSettings(
+        eia={"eia930": {"half_years": ["2022half1", "2022half2"]}}
+    )
+    page_assets = raw_page_dfs_factory(FakePageExtractor, name="eia930")
+    assert {key.to_user_string() for key in page_assets.keys} == {
+        "raw_eia930__balance",
+        "raw_eia930__interchange",
+    }
+    # Concatenating the pages uses a lot of memory, which limits their concurrency.
+    concat_ops = [
+        op_def
+        for op_def in page_assets.node_def.iterate_op_defs()
+        if op_def.name.startswith("concat_")
+    ]
+    assert len(concat_ops) == 2
+    assert all(op_def.tags == {"memory-use": "high"} for op_def in concat_ops)
+    result = materialize(
+        [page_assets],
+        resources={"datastore": None, "dataset_settings": dataset_settings},
+    )
+    assert result.success
+    for page in ["balance", "interchange"]:
+        df = result.asset_value(f"raw_eia930__{page}")
+        assert df.page.tolist() == [page, page]
+        assert sorted(df.partition) == ["2022half1", "2022half2"]
+        assert df.index.tolist() == [0, 1]
@@ -1,17 +1,22 @@
 """Unit tests for the :mod:`pudl.helpers` module."""
 
+import datetime
+import os
 from io import StringIO
 
 import numpy as np
 import pandas as pd
 import pytest
+import sqlalchemy as sa
 from dagster import AssetKey
 from pandas.testing import assert_frame_equal, assert_series_equal
 from pandas.tseries.offsets import BYearEnd
 
 import pudl
 from pudl.helpers import (
+    DataFrameFileCache,
     apply_pudl_dtypes,
+    bulk_insert_sqlite,
     convert_col_to_bool,
     convert_df_to_excel_file,
     convert_to_date,
@@ -22,9 +27,11 @@ from pudl.helpers import (
     fix_eia_na,
     flatten_list,
     remove_leading_zeros_from_numeric_strings,
+    sqlite_pragmas,
     standardize_percentages_ratio,
     zero_pad_numeric_string,
 )
+from pudl.metadata.constants import FIELD_DTYPES_SQL
 from pudl.output.sql.helpers import sql_asset_factory
 
 MONTHLY_GEN_FUEL = pd.DataFrame(
@@ -787,3 +794,131 @@ def test_standardize_percentages_ratio():
         standardized = standardize_percentages_ratio(
             over_100_df, mixed_cols=["mixed_col"], years_to_standardize=[1995, 1996]
         )
+
+
+def test_bulk_insert_sqlite_matches_to_sql(tmp_path):
+    """Bulk inserted records should read back just like those written by to_sql."""
+    md = sa.MetaData()
+    table_args = [
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column("report_date", sa.Date),
+        sa.Column("timestamp", sa.DateTime),
+        sa.Column("pudl_timestamp", FIELD_DTYPES_SQL["datetime"]),
+        sa.Column("code", sa.Text),
+        sa.Column("value", sa.Float),
+        sa.Column("count", sa.Integer),
+        sa.Column("flag", sa.Boolean),
+        sa.Column("raw_date", sa.Date),
+    ]
+    to_sql_table = sa.Table("to_sql", md, *table_args)
+    bulk_table = sa.Table("bulk", md, *[c.copy() for c in table_args])
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'test.sqlite'}")
+    md.create_all(engine)
+
+    df = pd.DataFrame(
+        {
+            "id": [1, 2, 3],
+            "report_date": pd.to_datetime(["2020-01-01", None, "2022-03-01"]),
+            "timestamp": pd.to_datetime(
+                ["2020-01-01 01:02:03", "2021-02-01 00:00:00", None]
+            ),
+            "pudl_timestamp": pd.to_datetime(
+                ["2020-01-01 01:00:00", None, "2020-01-01 01:00:00"]
+            ),
+            "code": pd.Categorical(["a", None, "b"]),
+            "value": [1.5, np.nan, 3.0],
+            "count": pd.array([1, pd.NA, 3], dtype="Int64"),
+            "flag": pd.array([True, False, pd.NA], dtype="boolean"),
+            "raw_date": [datetime.date(2020, 1, 1), None, datetime.date(2022, 3, 1)],
+        }
+    )
+    with engine.begin() as con:
+        df.to_sql(
+            "to_sql",
+            con,
+            if_exists="append",
+            index=False,
+            dtype={c.name: c.type for c in to_sql_table.columns},
+        )
+    with engine.connect() as con, sqlite_pragmas(con), con.begin():
+        bulk_insert_sqlite(con, bulk_table, df, chunksize=2)
+
+    with engine.connect() as con:
+        expected = con.execute(sa.select(to_sql_table)).fetchall()
+        actual = con.execute(sa.select(bulk_table)).fetchall()
+        raw_expected = con.exec_driver_sql("SELECT * FROM to_sql").fetchall()
+        raw_actual = con.exec_driver_sql("SELECT * FROM bulk").fetchall()
+    assert actual == expected
+    assert raw_actual == raw_expected
+
+
+def test_sqlite_pragmas_are_restored(tmp_path):
+    """PRAGMAs should only apply within the context."""
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'test.sqlite'}")
+    with engine.connect() as con:
+        original = con.exec_driver_sql("PRAGMA synchronous").scalar()
+        with sqlite_pragmas(con, {"synchronous": 0}):
+            assert con.exec_driver_sql("PRAGMA synchronous").scalar() == 0
+        assert con.exec_driver_sql("PRAGMA synchronous").scalar() == original
+
+
+class PickleDataFrameCache(DataFrameFileCache):
+    """A dataframe cache that falls back to pickles."""
+
+    ALLOW_PICKLE = True
+
+
+@pytest.mark.parametrize(
+    "df",
+    [
+        pd.DataFrame({"x": [datetime.datetime(2020, 1, 1)]}, dtype=object),
+        pd.DataFrame({"x": ["a", np.nan]}),
+        pd.DataFrame({"x": [1, None]}, dtype=object),
+    ],
+)
+def test_dataframe_file_cache_inexact_feather(tmp_path, df):
+    """Dataframes that Feather changes are pickled or not cached at all."""
+    assert not DataFrameFileCache(tmp_path / "feather").put("df", df)
+    assert DataFrameFileCache(tmp_path / "feather").get("df") is None
+
+    cache = PickleDataFrameCache(tmp_path / "pickle")
+    assert cache.put("df", df)
+    assert (tmp_path / "pickle" / "df.pkl").exists()
+    actual = cache.get("df")
+    assert_frame_equal(actual, df)
+    assert actual.x.map(type).tolist() == df.x.map(type).tolist()
+
+
+def test_dataframe_file_cache_exact_feather(tmp_path):
+    """Dataframes that round-trip through Feather exactly are stored as Feather."""
+    df = pd.DataFrame(
+        {"x": ["a", None], "y": [1.0, np.nan], "z": pd.array([1, None], "Int64")},
+        index=[3, 5],
+    )
+    cache = PickleDataFrameCache(tmp_path)
+    assert cache.put("df", df)
+    assert (tmp_path / "df.feather").exists()
+    assert_frame_equal(cache.get("df"), df)
+
+
+def test_dataframe_file_cache_entries(tmp_path):
+    """Entries of all formats share the size budget and unreadable ones are deleted."""
+    cache = PickleDataFrameCache(tmp_path, max_bytes=10**9)
+    cache.put_entry("model", {"weights": list(range(100))}, ".json")
+    cache.put_entry("graphs", {"forest": list(range(100))}, ".pkl")
+    assert cache.get_entry("model", ".json") == {"weights": list(range(100))}
+    assert cache.get_entry("missing", ".json") is None
+
+    assert cache.put("df", pd.DataFrame({"x": [1.0]}))
+
+    # Make the JSON entry the least recently used one, then exceed the budget.
+    os.utime(tmp_path / "model.json", (0, 0))
+    cache.max_bytes = sum(path.stat().st_size for path in tmp_path.iterdir()) - 1
+    assert cache.put("df", pd.DataFrame({"x": [2.0]}))
+    assert cache.get_entry("model", ".json") is None
+    assert cache.get_entry("graphs", ".pkl") == {"forest": list(range(100))}
+    assert not list(tmp_path.glob("*.tmp"))
+
+    (tmp_path / "graphs.pkl").write_bytes(b"corrupt")
+    assert cache.get_entry("graphs", ".pkl") is None
+    assert not (tmp_path / "graphs.pkl").exists()
@@ -6,8 +6,11 @@ from pathlib import Path
 
 import alembic.config
 import hypothesis
+import numpy as np
 import pandas as pd
 import pandera
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 import sqlalchemy as sa
 from dagster import AssetKey, build_input_context, build_output_context
@@ -20,10 +23,12 @@ from pudl.etl.check_foreign_keys import (
 )
 from pudl.io_managers import (
     FercXBRLSQLiteIOManager,
+    PudlParquetIOManager,
     PudlSQLiteIOManager,
     SQLiteIOManager,
 )
 from pudl.metadata.classes import Package, Resource
+from pudl.workspace.setup import PudlPaths
 
 
 @pytest.fixture
@@ -359,6 +364,176 @@ def test_error_when_reading_view_without_metadata(fake_pudl_sqlite_io_manager_fi
         fake_pudl_sqlite_io_manager_fixture.load_input(input_context)
 
 
+@pytest.fixture
+def typed_pudl_sqlite_io_manager(tmp_path) -> PudlSQLiteIOManager:
+    """A PudlSQLiteIOManager with one table containing every kind of field."""
+    fields = [
+        {"name": "plant_id", "type": "integer", "description": "plant_id"},
+        {"name": "report_date", "type": "date", "description": "report_date"},
+        {"name": "datetime_utc", "type": "datetime", "description": "datetime_utc"},
+        {"name": "capacity_mw", "type": "number", "description": "capacity_mw"},
+        {"name": "operating", "type": "boolean", "description": "operating"},
+        {"name": "plant_name", "type": "string", "description": "plant_name"},
+        {
+            "name": "fuel_type",
+            "type": "string",
+            "constraints": {"enum": ["coal", "gas", "wind"]},
+            "description": "fuel_type",
+        },
+    ]
+    schema = {"fields": fields, "primary_key": ["plant_id", "report_date"]}
+    pkg = Package(
+        name="typed",
+        resources=[Resource(name="plants", schema=schema, description="Plants")],
+    )
+    pkg.to_sql().create_all(sa.create_engine(f"sqlite:///{tmp_path / 'typed.sqlite'}"))
+    manager = PudlSQLiteIOManager(base_dir=tmp_path, db_name="typed", package=pkg)
+    plants = pd.DataFrame(
+        {
+            "plant_id": [1, 1, 2, 3],
+            "report_date": pd.to_datetime(
+                ["2020-01-01", "2021-01-01", "2020-01-01", "2021-01-01"]
+            ),
+            "datetime_utc": pd.to_datetime(
+                [
+                    "2020-01-01 01:00:00",
+                    None,
+                    "2020-06-01 12:30:00",
+                    "2021-01-01 00:00:00",
+                ]
+            ),
+            "capacity_mw": [1.5, 2.25, np.nan, 1e-9],
+            "operating": [True, False, None, True],
+            "plant_name": ["Barry", "Barry", None, "Parish"],
+            "fuel_type": ["coal", "coal", "gas", None],
+        }
+    )
+    manager.handle_output(build_output_context(asset_key=AssetKey("plants")), plants)
+    return manager
+
+
+def test_pudl_sqlite_io_manager_matches_read_sql_table(typed_pudl_sqlite_io_manager):
+    """The Arrow reader should produce the same dataframe as pandas."""
+    manager = typed_pudl_sqlite_io_manager
+    res = manager.package.get_resource("plants")
+    with manager.engine.connect() as con:
+        expected = res.enforce_schema(pd.read_sql_table("plants", con))
+    actual = manager.load_input(build_input_context(asset_key=AssetKey("plants")))
+    pd.testing.assert_frame_equal(actual, expected)
+
+
+def test_pudl_sqlite_io_manager_columns_and_filters(typed_pudl_sqlite_io_manager):
+    """Columns and filters in the input metadata should be applied in SQLite."""
+    manager = typed_pudl_sqlite_io_manager
+    input_context = build_input_context(
+        asset_key=AssetKey("plants"),
+        definition_metadata={
+            "columns": ["report_date", "plant_id", "fuel_type"],
+            "filters": [
+                ("report_date", ">=", datetime.date(2021, 1, 1)),
+                ("fuel_type", "in", ["coal", "gas"]),
+            ],
+        },
+    )
+    actual = manager.load_input(input_context)
+    assert actual.columns.tolist() == ["report_date", "plant_id", "fuel_type"]
+    assert actual.plant_id.tolist() == [1]
+    assert actual.report_date.dtype == "datetime64[s]"
+    assert actual.fuel_type.cat.categories.tolist() == ["coal", "gas", "wind"]
+
+    input_context = build_input_context(
+        asset_key=AssetKey("plants"),
+        definition_metadata={"filters": [("plant_id", "==", 4)]},
+    )
+    assert manager.load_input(input_context).empty
+
+
+@pytest.mark.parametrize(
+    "columns,filters",
+    [
+        (["plant_id", "not_a_column"], None),
+        (None, [("not_a_column", "==", 1)]),
+        (None, [("plant_id", "~=", 1)]),
+    ],
+)
+def test_pudl_sqlite_io_manager_bad_columns_and_filters(
+    typed_pudl_sqlite_io_manager, columns, filters
+):
+    """Unknown columns and filter operators should be rejected."""
+    with pytest.raises(ValueError):
+        typed_pudl_sqlite_io_manager.read_arrow(
+            "plants", columns=columns, filters=filters
+        )
+
+
+def test_pudl_parquet_io_manager_row_groups_and_filters(tmp_path, monkeypatch):
+    """Parquet tables should be split into yearly row groups and read selectively."""
+    monkeypatch.setenv("PUDL_OUTPUT", str(tmp_path))
+    table_name = "core_eia861__assn_utility"
+    df = pd.DataFrame(
+        {
+            "report_date": pd.to_datetime(
+                ["2021-01-01", "2019-01-01", "2020-01-01", "2019-01-01"]
+            ),
+            "utility_id_eia": [1, 1, 2, 2],
+            "state": ["CO", "CO", "TX", "TX"],
+        }
+    )
+    manager = PudlParquetIOManager()
+    manager.handle_output(build_output_context(asset_key=AssetKey(table_name)), df)
+
+    metadata = pq.ParquetFile(PudlPaths().parquet_path(table_name)).metadata
+    assert metadata.num_row_groups == 3
+    assert [metadata.row_group(i).column(0).statistics.min for i in range(3)] == [
+        datetime.date(2019, 1, 1),
+        datetime.date(2020, 1, 1),
+        datetime.date(2021, 1, 1),
+    ]
+
+    full = manager.load_input(build_input_context(asset_key=AssetKey(table_name)))
+    assert full.report_date.is_monotonic_increasing
+    assert len(full) == 4
+
+    input_context = build_input_context(
+        asset_key=AssetKey(table_name),
+        definition_metadata={
+            "columns": ["utility_id_eia", "state"],
+            "filters": [
+                ("report_date", ">=", datetime.date(2020, 1, 1)),
+                ("state", "==", "TX"),
+            ],
+        },
+    )
+    actual = manager.load_input(input_context)
+    expected = pd.DataFrame(
+        {"utility_id_eia": pd.array([2], dtype="Int64"), "state": ["TX"]}
+    ).astype({"state": full.state.dtype})
+    pd.testing.assert_frame_equal(actual, expected)
+
+
+def test_pudl_parquet_io_manager_split_row_groups():
+    """Each year should get its own row group, however the table is chunked."""
+    res = Resource.from_id("core_eia861__assn_utility")
+    years = [2021, 2019, 2020, 2019, 2021, 2021, 2019]
+    dates = [datetime.date(year, 1, 1) for year in years]
+    ids = list(range(len(years)))
+    table = pa.concat_tables(
+        pa.table({"report_date": dates[i : i + 3], "utility_id_eia": ids[i : i + 3]})
+        for i in range(0, len(dates), 3)
+    )
+    assert table["report_date"].num_chunks == 3
+    row_groups = PudlParquetIOManager._split_row_groups(res, table)
+    assert [group["report_date"].to_pylist() for group in row_groups] == [
+        [datetime.date(2019, 1, 1)] * 3,
+        [datetime.date(2020, 1, 1)],
+        [datetime.date(2021, 1, 1)] * 3,
+    ]
+    assert (
+        sorted(sum((group["utility_id_eia"].to_pylist() for group in row_groups), []))
+        == ids
+    )
+
+
 def test_ferc_xbrl_sqlite_io_manager_dedupes(mocker, tmp_path):
     db_path = tmp_path / "test_db.sqlite"
     # fake datapackage descriptor just to see if we can find the primary keys -
@@ -1,5 +1,7 @@
 """Tests for metadata not covered elsewhere."""
 
+import os
+
 import pandas as pd
 import pandera as pr
 import pytest
@@ -8,6 +10,7 @@ from pudl.metadata.classes import (
     DataSource,
     Field,
     Package,
+    PackageCache,
     PudlResourceDescriptor,
     Resource,
 )
@@ -176,3 +179,109 @@ def test_resource_descriptors_can_encode_schemas(dummy_pandera_schema):
 def test_resource_descriptor_schema_failures(error_msg, data, dummy_pandera_schema):
     with pytest.raises(pr.errors.SchemaError, match=error_msg):
         dummy_pandera_schema.validate(data)
+
+
+@pytest.fixture
+def enforced_resource() -> Resource:
+    """A resource with a year, a categorical and a two column primary key."""
+    fields = [
+        {"name": "report_year", "type": "year", "description": "Year"},
+        {"name": "plant_id", "type": "integer", "description": "Plant"},
+        {
+            "name": "status",
+            "type": "string",
+            "description": "Status",
+            "constraints": {"enum": ["on", "off"]},
+        },
+    ]
+    schema = {"fields": fields, "primary_key": ["report_year", "plant_id"]}
+    return Resource(name="r", schema=schema, description="R")
+
+
+def test_enforce_schema(enforced_resource):
+    df = pd.DataFrame(
+        {
+            "extra": [0, 0, 0],
+            "status": ["on", "broken", None],
+            "plant_id": [1, 2, 1],
+            "report_year": [2020, 2020, 2021],
+        }
+    )
+    enforced = enforced_resource.enforce_schema(df)
+    assert enforced.columns.tolist() == ["report_year", "plant_id", "status"]
+    assert enforced.status.tolist()[0] == "on"
+    assert enforced.status.isna()[1:].all()
+    assert pd.api.types.is_integer_dtype(df.report_year)
+
+    # Duplicates are found across all of the primary key columns, nulls included.
+    with pytest.raises(ValueError, match="Duplicate primary keys"):
+        enforced_resource.enforce_schema(df.assign(report_year=2020, plant_id=1))
+    # The uniqueness check can be skipped for data that was already checked.
+    with pytest.raises(ValueError, match="Null values found"):
+        enforced_resource.enforce_schema(
+            df.assign(plant_id=[1, None, None]), check_unique=False
+        )
+    owned = df.assign(report_year=2020, plant_id=1)
+    enforced_resource.enforce_schema(owned, copy=False, check_unique=False)
+    # Without a copy, the year column of the input is converted in place.
+    assert pd.api.types.is_datetime64_any_dtype(owned.report_year)
+
+
+def test_enforcement_plan_follows_schema(enforced_resource):
+    """The compiled enforcement plan should be reused until the schema changes."""
+    df = pd.DataFrame(
+        {"report_year": [2020], "plant_id": [1], "status": ["on"], "other": [1]}
+    )
+    plan = enforced_resource._get_enforcement_plan()
+    enforced_resource.format_df(df)
+    assert enforced_resource._get_enforcement_plan() is plan
+    assert enforced_resource._get_enforcement_plan(compact=True) is not plan
+    assert enforced_resource.format_df(df, compact=True).plant_id.dtype == "Int32"
+
+    # Fields edited in place are picked up, as well as replaced ones.
+    enforced_resource.schema.fields[2].constraints.enum = ["on", "off", "idle"]
+    enforced_resource.schema.fields[1].type = "number"
+    formatted = enforced_resource.format_df(df)
+    assert formatted.status.dtype == pd.CategoricalDtype(["on", "off", "idle"])
+    assert formatted.plant_id.dtype == "float64"
+    assert enforced_resource._get_enforcement_plan() is not plan
+
+    enforced_resource.schema.fields = enforced_resource.schema.fields[:2]
+    assert enforced_resource.format_df(df).columns.tolist() == [
+        "report_year",
+        "plant_id",
+    ]
+
+
+def test_package_cache(tmp_path, monkeypatch):
+    """Packages are pickled to the metadata cache and loaded by later processes."""
+    monkeypatch.setenv("PUDL_METADATA_CACHE", str(tmp_path))
+    # Entries built from other versions of the source are only deleted once unused.
+    stale_path = tmp_path / "package__0123456789abcdef__0123456789abcdef.pkl"
+    stale_path.write_bytes(b"stale")
+    os.utime(stale_path, (0, 0))
+    other_path = tmp_path / "package__fedcba9876543210__0123456789abcdef.pkl"
+    other_path.write_bytes(b"other checkout")
+    args = (("core_eia__codes_balancing_authorities",), False, ())
+
+    # Skip the in-memory cache, which would hide the on-disk one.
+    package = Package.from_resource_ids.__wrapped__(Package, *args)
+    assert not stale_path.exists()
+    assert other_path.exists()
+    other_path.unlink()
+    assert len(list(tmp_path.glob("package__*.pkl"))) == 1
+
+    cached = PackageCache.from_env().get(*args)
+    assert cached is not package
+    assert [r.name for r in cached.resources] == [r.name for r in package.resources]
+    assert cached.to_sql().tables.keys() == package.to_sql().tables.keys()
+    reloaded = Package.from_resource_ids.__wrapped__(Package, *args)
+    assert [r.name for r in reloaded.resources] == [r.name for r in package.resources]
+
+    # Unreadable entries are discarded rather than breaking the metadata, including
+    # ones that refer to code which no longer exists, e.g. after a library upgrade.
+    for contents in [b"corrupt", b"cno_such_module\nPackage\n."]:
+        next(tmp_path.glob("package__*.pkl")).write_bytes(contents)
+        assert PackageCache.from_env().get(*args) is None
+        assert not list(tmp_path.glob("package__*.pkl"))
+        Package.from_resource_ids.__wrapped__(Package, *args)
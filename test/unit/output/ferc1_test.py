@@ -19,7 +19,9 @@ Stuff we are testing:
 """
 
 import logging
+import tempfile
 import unittest
+from pathlib import Path
 
 import networkx as nx
 import pandas as pd
@@ -27,6 +29,7 @@ import pytest
 
 from pudl.helpers import dedupe_n_flatten_list_of_lists
 from pudl.output.ferc1 import (
+    CalculationForestCache,
     NodeId,
     XbrlCalculationForestFerc1,
     get_core_ferc1_asset_description,
@@ -365,6 +368,76 @@ class TestTagPropagation(TestForestSetup):
         ]:
             assert annotated_tags[post_yes_node]["in_rate_base"] == "yes"
 
+    def test_leafy_meta_propagates_weights_and_tags(self):
+        """Leaves inherit the product of their ancestors' weights and their tags."""
+        edges = [
+            (self.parent, self.child1),
+            (self.parent, self.child2),
+            (self.child1, self.grand_child11),
+            (self.child1, self.grand_child12),
+        ]
+        exploded_calcs = self._exploded_calcs_from_edges(edges)
+        exploded_calcs["weight"] = pd.array([-1, 1, 2, -2], dtype="Int64")
+        tags = pd.DataFrame([self.parent, self.child1]).assign(
+            a_non_propped_tag=["root", pd.NA],
+            another_tag=[pd.NA, "child"],
+        )
+        forest = XbrlCalculationForestFerc1(
+            exploded_calcs=exploded_calcs, seeds=[self.parent], tags=tags
+        )
+        leafy_meta = forest.leafy_meta.set_index("xbrl_factoid")
+        assert set(leafy_meta.index) == {
+            "reported_1_2",
+            "reported_1_1_1",
+            "reported_1_1_2",
+        }
+        assert (leafy_meta.xbrl_factoid_root == "reported_1").all()
+        assert leafy_meta.weight.to_dict() == {
+            "reported_1_2": 1,
+            "reported_1_1_1": -2,
+            "reported_1_1_2": 2,
+        }
+        assert (leafy_meta.tags_a_non_propped_tag == "root").all()
+        assert pd.isna(leafy_meta.tags_another_tag["reported_1_2"])
+        assert (
+            leafy_meta.tags_another_tag[["reported_1_1_1", "reported_1_1_2"]] == "child"
+        ).all()
+
+    def test_calculation_forest_cache(self):
+        """Forests built from the same inputs should reuse the cached graphs."""
+        edges = [
+            (self.parent, self.child1),
+            (self.parent, self.child2),
+            (self.child1, self.grand_child11),
+        ]
+        tags = pd.DataFrame([self.child1]).assign(in_rate_base=["yes"])
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        cache = CalculationForestCache(Path(tmp_dir.name))
+
+        def _forest(edges):
+            return XbrlCalculationForestFerc1(
+                exploded_calcs=self._exploded_calcs_from_edges(edges),
+                seeds=[self.parent],
+                tags=tags,
+            )
+
+        built = _forest(edges)
+        built.load_or_store_graphs(cache)
+        loaded = _forest(edges)
+        loaded.load_or_store_graphs(cache)
+        assert loaded.cache_key == built.cache_key
+        assert "full_digraph" not in loaded.__dict__
+        assert nx.utils.graphs_equal(loaded.annotated_forest, built.annotated_forest)
+        pd.testing.assert_frame_equal(loaded.leafy_meta, built.leafy_meta)
+
+        # Changing the calculations invalidates the cached forest.
+        changed = _forest(edges[:2])
+        changed.load_or_store_graphs(cache)
+        assert changed.cache_key != built.cache_key
+        assert self.grand_child11 not in changed.annotated_forest
+        assert len(list(cache.path.glob("calculation_forest__*.pkl"))) == 2
+
 
 def test_get_core_ferc1_asset_description():
     valid_core_ferc1_asset_name = "core_ferc1__yearly_income_statements_sched114"
@@ -7,6 +7,7 @@
 """
 
 import enum
+import os
 import random
 from contextlib import nullcontext as does_not_raise
 from datetime import date
@@ -27,6 +28,7 @@ from pudl.transform.classes import (
     StringCategories,
     StringNormalization,
     TableTransformParams,
+    TransformCheckpointCache,
     TransformParams,
     UnitConversion,
     UnitCorrections,
@@ -1117,6 +1119,115 @@ def test_transform(mocker):
         ).all()
 
 
+@pytest.mark.parametrize("mode", ["copy", "arrow", "cow"])
+def test_cache_df_modes(mode):
+    """Cached dataframes should be independent snapshots in every mode."""
+    params = TableTransformParams.from_dict(
+        STRING_PARAMS["test_table"] | {"drop_invalid_rows": []}
+    )
+    with pd.option_context("mode.copy_on_write", mode == "cow"):
+        transformer = TableTransformer(
+            params=params,
+            cache_dfs=True,
+            clear_cached_dfs=False,
+            cache_dfs_mode=mode,
+        )
+        actual = transformer.transform(STRING_DATA)
+        expected = actual.copy()
+        actual.loc[:, "stage"] = "modified"
+        assert_frame_equal(transformer.get_cached_df("end"), expected)
+        for stage in ["start", "main", "end"]:
+            assert (transformer.get_cached_df(stage)["stage"] == stage).all()
+
+        # With a tiny budget only the most recently cached dataframe is kept.
+        transformer = TableTransformer(
+            params=params,
+            cache_dfs=True,
+            clear_cached_dfs=False,
+            cache_dfs_mode=mode,
+            cache_dfs_max_bytes=1,
+        )
+        transformer.transform(STRING_DATA)
+        assert list(transformer._cached_dfs) == ["end"]
+
+
+def test_cache_df_cow_mode_requires_copy_on_write():
+    """Shallow snapshots are only safe when copy-on-write is enabled."""
+    with (
+        pd.option_context("mode.copy_on_write", False),
+        pytest.raises(ValueError, match="copy_on_write"),
+    ):
+        TableTransformer(
+            params=TableTransformParams(), cache_dfs=True, cache_dfs_mode="cow"
+        )
+
+
+def test_transform_checkpoints(mocker, tmp_path):
+    """Unchanged transforms should be loaded from checkpoints instead of re-run."""
+    params = TableTransformParams.from_dict(
+        STRING_PARAMS["test_table"] | {"drop_invalid_rows": []}
+    )
+    cache = TransformCheckpointCache(tmp_path)
+    expected = TableTransformer(params=params, checkpoint_cache=cache).transform(
+        STRING_DATA
+    )
+    # The raw strings include pd.NA in an object column, which Feather would read back
+    # as None, so the output of the first step can't be checkpointed.
+    assert not list(tmp_path.glob("test_table__transform_start__*"))
+    assert len(list(tmp_path.glob("*.feather"))) == 2
+
+    spies = [
+        mocker.spy(TableTransformer, step)
+        for step in ["transform_start", "transform_main", "transform_end"]
+    ]
+    actual = TableTransformer(params=params, checkpoint_cache=cache).transform(
+        STRING_DATA
+    )
+    assert_frame_equal(actual, expected)
+    for spy in spies:
+        spy.assert_not_called()
+
+    # If the final checkpoint is gone, only the last step has to be re-run.
+    max(tmp_path.glob("test_table__transform_end__*.feather")).unlink()
+    actual = TableTransformer(params=params, checkpoint_cache=cache).transform(
+        STRING_DATA
+    )
+    assert_frame_equal(actual, expected)
+    assert [spy.call_count for spy in spies] == [0, 0, 1]
+
+    # Different inputs are transformed from scratch.
+    TableTransformer(params=params, checkpoint_cache=cache).transform(
+        STRING_DATA.iloc[:-1]
+    )
+    assert [spy.call_count for spy in spies] == [1, 1, 2]
+
+    # So are unchanged inputs after any change to the PUDL source, e.g. the metadata.
+    mocker.patch(
+        "pudl.transform.classes._pudl_source_digest", return_value="changed source"
+    )
+    TableTransformer(params=params, checkpoint_cache=cache).transform(STRING_DATA)
+    assert [spy.call_count for spy in spies] == [2, 2, 3]
+
+
+def test_transform_checkpoint_eviction(tmp_path):
+    """The least recently used checkpoints should be evicted first."""
+    df = pd.DataFrame({"x": np.arange(1000)})
+    cache = TransformCheckpointCache(tmp_path, max_bytes=10**9)
+    assert cache.put("a", df)
+    entry_bytes = (tmp_path / "a.feather").stat().st_size
+    cache.max_bytes = 2 * entry_bytes
+    assert cache.put("b", df)
+    # Make "a" more recently used than "b", then add a third entry.
+    os.utime(tmp_path / "b.feather", (0, 0))
+    assert_frame_equal(cache.get("a"), df)
+    assert cache.put("c", df)
+    assert cache.get("b") is None
+    assert_frame_equal(cache.get("a"), df)
+    assert_frame_equal(cache.get("c"), df)
+    # Dataframes that Arrow can't represent are skipped.
+    assert not cache.put("mixed", pd.DataFrame({"x": [1, "a"]}))
+
+
 def test_enforce_snake_case():
     """Test the enforce_snake_case function.
 
@@ -0,0 +1,201 @@
+"""Unit tests for the pudl.transform.eia module."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pudl.metadata.fields import apply_pudl_dtypes
+from pudl.metadata.resources import ENTITIES
+from pudl.settings import EiaSettings
+from pudl.transform.eia import (
+    EiaEntity,
+    _group_codes,
+    harvest_entity_tables,
+    occurrence_consistency,
+)
+
+HARVESTED_COLS = (
+    ENTITIES["utilities"]["static_cols"] + ENTITIES["utilities"]["annual_cols"]
+)
+
+COMPILED_DF = pd.DataFrame(
+    {
+        "plant_id_eia": pd.array([1, 1, 1, 1, 2, 2, 3, 3, None], dtype="Int64"),
+        "report_date": pd.to_datetime(
+            [
+                "2020-01-01",
+                "2021-01-01",
+                "2021-01-01",
+                "2022-01-01",
+                "2020-01-01",
+                "2021-01-01",
+                "2020-01-01",
+                "2021-01-01",
+                "2020-01-01",
+            ]
+        ),
+        "state": pd.array(
+            ["CO", "CO", "CO", "UT", "TX", "nan", "NM", "AZ", "CO"], dtype="string"
+        ),
+    }
+)
+
+
+@pytest.mark.parametrize("precompute_codes", [False, True])
+def test_occurrence_consistency(precompute_codes):
+    """Check the entity and record counts that determine harvesting consistency."""
+    consit_codes = (
+        _group_codes(COMPILED_DF, ["plant_id_eia"]) if precompute_codes else None
+    )
+    actual = occurrence_consistency(
+        entity_idx=["plant_id_eia"],
+        compiled_df=COMPILED_DF,
+        col="state",
+        cols_to_consit=["plant_id_eia"],
+        consit_codes=consit_codes,
+    )
+    # Rows with null IDs or values (including "nan" strings) are dropped.
+    expected = pd.DataFrame(
+        {
+            "plant_id_eia": pd.array([1, 3, 3, 1, 1, 1, 2], dtype="Int64"),
+            "report_date": pd.to_datetime(
+                [
+                    "2022-01-01",
+                    "2021-01-01",
+                    "2020-01-01",
+                    "2020-01-01",
+                    "2021-01-01",
+                    "2021-01-01",
+                    "2020-01-01",
+                ]
+            ),
+            "state": pd.array(
+                ["UT", "AZ", "NM", "CO", "CO", "CO", "TX"], dtype="string"
+            ),
+            "entity_occurences": [4, 2, 2, 4, 4, 4, 1],
+            "record_occurences": [1, 1, 1, 3, 3, 3, 1],
+            "state_consistent_rate": [0.25, 0.5, 0.5, 0.75, 0.75, 0.75, 1.0],
+            "state_is_consistent": [False, False, False, True, True, True, True],
+        },
+        index=[3, 5, 6, 0, 2, 1, 4],
+    )
+    pd.testing.assert_frame_equal(actual, expected)
+
+
+def test_occurrence_consistency_annual():
+    """Annual consistency is determined separately for each report date."""
+    actual = occurrence_consistency(
+        entity_idx=["plant_id_eia"],
+        compiled_df=COMPILED_DF,
+        col="state",
+        cols_to_consit=["plant_id_eia", "report_date"],
+    )
+    assert actual["state_is_consistent"].all()
+    np.testing.assert_array_equal(actual["state_consistent_rate"], 1.0)
+    assert (
+        actual.loc[actual.report_date == "2021-01-01", "entity_occurences"]
+        .isin([1, 2])
+        .all()
+    )
+
+
+def test_harvest_entity_tables_num_workers():
+    """Harvesting in a process pool should give the same tables as a single process."""
+    n_records = 60
+    utility_id = np.arange(n_records) % 12
+    clean_df = apply_pudl_dtypes(
+        pd.DataFrame(
+            {
+                "utility_id_eia": utility_id,
+                "report_date": pd.to_datetime(
+                    (2015 + np.arange(n_records) // 12).astype(str), format="%Y"
+                ),
+                "utility_name_eia": [f"Utility {u}" for u in utility_id],
+                "state": np.where(utility_id % 2 == 0, "CO", "UT"),
+            }
+        ).reindex(columns=["utility_id_eia", "report_date"] + HARVESTED_COLS),
+        group="eia",
+    )
+    clean_dfs = {"_core_eia860__utilities": clean_df}
+    eia_settings = EiaSettings()
+    expected = harvest_entity_tables(
+        EiaEntity.UTILITIES, clean_dfs, eia_settings=eia_settings
+    )
+    actual = harvest_entity_tables(
+        EiaEntity.UTILITIES, clean_dfs, eia_settings=eia_settings, num_workers=2
+    )
+    pd.testing.assert_frame_equal(expected[0], actual[0])
+    pd.testing.assert_frame_equal(expected[1], actual[1])
+    assert len(expected[0]) == 12
+    assert expected[0].utility_name_eia.notna().all()
+    assert set(expected[1].state) == {"CO", "UT"}
+
+
+def _merge_occurrence_consistency(
+    entity_idx: list[str],
+    compiled_df: pd.DataFrame,
+    col: str,
+    cols_to_consit: list[str],
+    strictness: float = 0.7,
+) -> pd.DataFrame:
+    """The original groupby & merge implementation of occurrence_consistency."""
+    col_df = compiled_df[entity_idx + ["report_date", col]].copy()
+    col_df.loc[(col_df[col] == "nan").fillna(False), col] = pd.NA
+    col_df = col_df.dropna()
+    occur = (
+        col_df.assign(entity_occurences=1)
+        .groupby(by=cols_to_consit, observed=True)[["entity_occurences"]]
+        .count()
+        .reset_index()
+    )
+    col_df = col_df.merge(occur, on=cols_to_consit)
+    consist_df = (
+        col_df.assign(record_occurences=1)
+        .groupby(by=cols_to_consit + [col], observed=True)[["record_occurences"]]
+        .count()
+        .reset_index()
+    )
+    col_df = col_df.merge(consist_df, how="outer")
+    col_df[f"{col}_consistent_rate"] = (
+        col_df["record_occurences"] / col_df["entity_occurences"]
+    )
+    col_df[f"{col}_is_consistent"] = col_df[f"{col}_consistent_rate"] > strictness
+    return col_df.sort_values(f"{col}_consistent_rate")
+
+
+@pytest.mark.parametrize("col", ["plant_name_eia", "latitude"])
+@pytest.mark.parametrize(
+    "cols_to_consit", [["plant_id_eia"], ["plant_id_eia", "report_date"]]
+)
+def test_occurrence_consistency_breaks_ties_like_merge(col, cols_to_consit):
+    """Values with tied consistency rates are ordered like the original version.
+
+    Harvesting keeps the first consistent value of each entity, so with a strictness of
+    zero the order of tied values determines which one is harvested.
+    """
+    rng = np.random.default_rng(5)
+    n_rows = 2000
+    compiled_df = pd.DataFrame(
+        {
+            "plant_id_eia": pd.array(rng.integers(0, 200, n_rows), dtype="Int64"),
+            "report_date": pd.to_datetime(
+                rng.integers(2018, 2022, n_rows).astype(str), format="%Y"
+            ),
+            "plant_name_eia": pd.array(
+                rng.choice(["a", "b", "c", "nan", None], n_rows), dtype="string"
+            ),
+            "latitude": rng.choice([0.0, 1.0, 2.0, np.nan], n_rows),
+        }
+    )
+    expected = _merge_occurrence_consistency(
+        ["plant_id_eia"], compiled_df, col, cols_to_consit, strictness=0
+    )
+    actual = occurrence_consistency(
+        ["plant_id_eia"],
+        compiled_df,
+        col,
+        cols_to_consit,
+        strictness=0,
+        consit_codes=_group_codes(compiled_df, cols_to_consit),
+    )
+    pd.testing.assert_frame_equal(actual, expected)
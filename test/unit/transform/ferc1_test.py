@@ -498,7 +498,8 @@ def test_dimension_columns():
     assert params3.dimension_columns == ["added_dim"]
 
 
-def test_calculate_values_from_components():
+@pytest.mark.parametrize("engine", ["merge", "sparse"])
+def test_calculate_values_from_components(engine):
     """Test :func:`calculate_values_from_components`."""
     # drawing inspo from kim stanley robinson books
     calculation_components_ksr = pd.read_csv(
@@ -549,6 +550,7 @@ books,big_fact,earth,12.0,44,2312,{3+4+5}
         data=data_ksr,
         calc_idx=["table_name", "xbrl_factoid", "planet"],
         value_col="value",
+        engine=engine,
     )[list(expected_ksr.columns)].convert_dtypes()
     idx = ["xbrl_factoid", "planet"]
     pd.testing.assert_frame_equal(
@@ -557,6 +559,101 @@ books,big_fact,earth,12.0,44,2312,{3+4+5}
     )
 
 
+def test_calculate_values_from_components_engines_agree():
+    """The sparse engine should reproduce the merge engine's output exactly."""
+    calculation_components = pd.read_csv(
+        StringIO(
+            """
+table_name_parent,xbrl_factoid_parent,planet_parent,table_name,xbrl_factoid,planet,weight
+books,big_fact,mars,books,lil_fact_x,mars,1
+books,big_fact,mars,books,lil_fact_y,mars,-1
+books,big_fact,,books,lil_fact_x,,0.5
+books,big_fact,,books,lil_fact_y,,2
+books,bigger_fact,mars,books,big_fact,mars,1
+books,bigger_fact,mars,books,lil_fact_x,mars,1
+books,missing_fact,mars,books,lil_fact_z,mars,1
+"""
+        )
+    )
+    data = pd.read_csv(
+        StringIO(
+            """
+table_name,xbrl_factoid,planet,value,utility_id_ferc1,report_year,notes
+books,lil_fact_x,mars,10,44,2312,a
+books,lil_fact_y,mars,,44,2312,b
+books,big_fact,mars,10,44,2312,c
+books,lil_fact_x,,3,44,2312,d
+books,lil_fact_y,,4,44,2312,e
+books,lil_fact_x,mars,,45,2312,f
+books,lil_fact_y,mars,,45,2312,g
+books,big_fact,mars,1,45,2312,h
+books,lil_fact_z,mars,7,44,2313,i
+"""
+        )
+    )
+    kwargs = {
+        "calculation_components": calculation_components,
+        "data": data,
+        "calc_idx": ["table_name", "xbrl_factoid", "planet"],
+        "value_col": "value",
+        "calc_to_data_merge_validation": "many_to_many",
+    }
+    expected = calculate_values_from_components(**kwargs, engine="merge")
+    actual = calculate_values_from_components(**kwargs, engine="sparse")
+    pd.testing.assert_frame_equal(expected, actual)
+    # Calculations whose reported components are all null have no value.
+    all_null = actual[
+        (actual.utility_id_ferc1 == 45) & (actual.xbrl_factoid == "big_fact")
+    ]
+    assert all_null.is_calc.all()
+    assert all_null.calculated_value.isna().all()
+    # Calculations without any reported components get a record of their own.
+    assert actual.loc[
+        actual.xbrl_factoid == "bigger_fact", "calculated_value"
+    ].tolist() == [20.0, 1.0]
+
+    with pytest.raises(pd.errors.MergeError):
+        calculate_values_from_components(
+            **(kwargs | {"calc_to_data_merge_validation": "one_to_many"}),
+            engine="sparse",
+        )
+
+
+@pytest.mark.parametrize("engine", ["merge", "sparse"])
+def test_calculate_values_from_components_no_matches(engine):
+    """Data without any calculation components is returned as uncalculated."""
+    calculation_components = pd.DataFrame(
+        {
+            "table_name_parent": ["books"],
+            "xbrl_factoid_parent": ["big_fact"],
+            "table_name": ["books"],
+            "xbrl_factoid": ["lil_fact_z"],
+            "weight": [1.0],
+        }
+    )
+    data = pd.DataFrame(
+        {
+            "table_name": ["books", "books"],
+            "xbrl_factoid": ["lil_fact_x", "lil_fact_y"],
+            "value": [10.0, 4.0],
+            "utility_id_ferc1": [44, 44],
+            "report_year": [2312, 2312],
+        }
+    )
+    actual = calculate_values_from_components(
+        calculation_components=calculation_components,
+        data=data,
+        calc_idx=["table_name", "xbrl_factoid"],
+        value_col="value",
+        engine=engine,
+    )
+    assert actual.xbrl_factoid.tolist() == ["lil_fact_x", "lil_fact_y"]
+    assert actual.is_calc.dtype == pd.BooleanDtype()
+    assert not actual.is_calc.any()
+    assert actual.calculated_value.isna().all()
+    assert actual["diff"].isna().all()
+
+
 TABLE_NAME = "table_a"
 FACT_NAME = "my_cool_fact"
 VALUE_COL = "value"
@@ -1,8 +1,14 @@
 """Unit tests for Datastore module."""
 
+import hashlib
+import io
 import json
 import re
+import shutil
+import tempfile
 import unittest
+import zipfile
+from pathlib import Path
 from typing import Any
 
 import responses
@@ -329,10 +335,145 @@ class TestZenodoFetcher(unittest.TestCase):
             datastore.ChecksumMismatchError, self.fetcher.get_resource, res
         )
 
+    @responses.activate
+    def test_download_resource(self):
+        """Test that download_resource() streams the content to disk."""
+        responses.add(responses.GET, "http://localhost/first", body="blah")
+        res = PudlResourceKey("epacems", self.PROD_EPACEMS_DOI, "first")
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "sub" / "first"
+            self.fetcher.download_resource(res, path, chunk_size=1)
+            self.assertEqual(b"blah", path.read_bytes())
+
+    @responses.activate
+    def test_download_resource_resumes_partial_download(self):
+        """Test that only the missing bytes of a partial download are requested."""
+
+        def _range_callback(request):
+            self.assertEqual("bytes=2-", request.headers["Range"])
+            return (206, {}, b"ah")
+
+        responses.add_callback(
+            responses.GET, "http://localhost/first", callback=_range_callback
+        )
+        res = PudlResourceKey("epacems", self.PROD_EPACEMS_DOI, "first")
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "first"
+            path.write_bytes(b"bl")
+            self.fetcher.download_resource(res, path)
+            self.assertEqual(b"blah", path.read_bytes())
+
+    @responses.activate
+    def test_download_resource_with_invalid_checksum(self):
+        """Test that a download with bad checksum raises and is discarded."""
+        responses.add(responses.GET, "http://localhost/first", body="wrongContent")
+        res = PudlResourceKey("epacems", self.PROD_EPACEMS_DOI, "first")
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "first"
+            self.assertRaises(
+                datastore.ChecksumMismatchError,
+                self.fetcher.download_resource,
+                res,
+                path,
+            )
+            self.assertFalse(path.exists())
+
     def test_get_resource_with_nonexistent_resource_fails(self):
         """If resource does not exist, get_resource() throws KeyError."""
         res = PudlResourceKey("epacems", self.PROD_EPACEMS_DOI, "nonexistent")
         self.assertRaises(KeyError, self.fetcher.get_resource, res)
 
 
-# TODO(rousik): add unit tests for Datasource class as well
+class TestDatastore(unittest.TestCase):
+    """Unit tests for the Datastore class."""
+
+    def setUp(self):
+        """Prepare a local cache holding a datapackage.json and one zipped resource."""
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.doi = datastore.ZenodoDoiSettings().epacems
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w") as zf:
+            zf.writestr("data.csv", "a,b\n1,2\n")
+        self.zip_bytes = buffer.getvalue()
+        descriptor = {
+            "resources": [
+                _make_resource("first.zip", year=2020)
+                | {"hash": hashlib.md5(self.zip_bytes).hexdigest()},  # noqa: S324
+                _make_resource("second.zip", year=2021) | {"hash": "bad"},
+            ]
+        }
+        self.ds = datastore.Datastore(local_cache_path=self.test_dir)
+        self.ds._cache.add(
+            PudlResourceKey("epacems", self.doi, "datapackage.json"),
+            json.dumps(descriptor).encode(),
+        )
+        for name in ["first.zip", "second.zip"]:
+            self.ds._cache.add(
+                PudlResourceKey("epacems", self.doi, name), self.zip_bytes
+            )
+
+    def tearDown(self):
+        """Deletes content of the temporary directories."""
+        shutil.rmtree(self.test_dir)
+
+    def test_open_zipfile_resource_reads_from_disk(self):
+        """Locally cached resources are opened directly from the cached file."""
+        with self.ds.open_zipfile_resource("epacems", year=2020) as zf:
+            self.assertEqual(
+                Path(zf.filename),
+                self.test_dir / "epacems" / self.doi.replace("/", "-") / "first.zip",
+            )
+            self.assertEqual(b"a,b\n1,2\n", zf.read("data.csv"))
+
+    def test_open_zipfile_resource_missing(self):
+        """Requesting a nonexistent partition raises KeyError."""
+        self.assertRaises(KeyError, self.ds.open_zipfile_resource, "epacems", year=1)
+
+    def test_open_zipfile_resource_verifies_checksum(self):
+        """Checksums are only checked on request, and only once per unchanged file."""
+        with self.ds.open_zipfile_resource("epacems", year=2021) as zf:
+            self.assertEqual(["data.csv"], zf.namelist())
+        self.assertRaises(
+            datastore.ChecksumMismatchError,
+            self.ds.open_zipfile_resource,
+            "epacems",
+            verify_checksum=True,
+            year=2021,
+        )
+        self.ds.open_zipfile_resource("epacems", verify_checksum=True, year=2020)
+        self.assertEqual(1, len(self.ds._verified_files))
+
+    def test_get_unique_resource_checksum(self):
+        """Checksums come from the datapackage descriptor."""
+        self.assertEqual(
+            "bad", self.ds.get_unique_resource_checksum("epacems", year=2021)
+        )
+
+    @responses.activate
+    def test_prefetch_resources(self):
+        """Uncached resources are downloaded concurrently into the local cache."""
+        descriptor = {
+            "resources": [
+                _make_resource(f"part{i}.zip", year=2000 + i)
+                | {"hash": hashlib.md5(f"part{i}".encode()).hexdigest()}  # noqa: S324
+                for i in range(4)
+            ]
+        }
+        doi = datastore.ZenodoDoiSettings().eia860
+        self.ds._cache.add(
+            PudlResourceKey("eia860", doi, "datapackage.json"),
+            json.dumps(descriptor).encode(),
+        )
+        for i in range(4):
+            responses.add(
+                responses.GET, f"http://localhost/part{i}.zip", body=f"part{i}"
+            )
+        # One of the resources is already cached, and shouldn't be downloaded again
+        self.ds._cache.add(PudlResourceKey("eia860", doi, "part0.zip"), b"part0")
+        fetched = self.ds.prefetch_resources("eia860", max_workers=3)
+        self.assertEqual(
+            ["part1.zip", "part2.zip", "part3.zip"], [res.name for res in fetched]
+        )
+        self.assertEqual(3, len(responses.calls))
+        self.assertEqual(b"part3", self.ds.get_unique_resource("eia860", year=2003))
+        self.assertEqual([], list((self.test_dir / ".partial").rglob("*.zip")))
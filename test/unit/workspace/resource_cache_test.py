@@ -147,6 +147,23 @@ class TestLayeredCache(unittest.TestCase):
         self.assertTrue(self.cache_2.contains(res))
         self.assertEqual(b"secondLayer", self.layered_cache.get(res))
 
+    def test_get_local_path_uses_innermost_layer(self):
+        """Local path points at the file in the leftmost layer that contains it."""
+        res = PudlResourceKey("a", "b", "x.txt")
+        self.layered_cache.add_cache_layer(self.cache_1)
+        self.layered_cache.add_cache_layer(self.cache_2)
+        self.assertIsNone(self.layered_cache.get_local_path(res))
+
+        self.cache_2.add(res, b"secondLayer")
+        self.assertEqual(
+            Path(self.test_dir_2) / "a" / "b" / "x.txt",
+            self.layered_cache.get_local_path(res),
+        )
+        self.cache_1.add(res, b"firstLayer")
+        self.assertEqual(
+            b"firstLayer", self.layered_cache.get_local_path(res).read_bytes()
+        )
+
     def test_add_with_no_layers_does_nothing(self):
         """When add() is called on cache with no layers nothing happens."""
         res = PudlResourceKey("a", "b", "c")